@@ -1,6 +1,6 @@
 # Credit Markets Daily Pipeline DAG
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import boto3
 from airflow import DAG
@@ -80,6 +80,10 @@ def publish_cloudwatch_metric(metric_name, value, unit="Count"):
     except Exception as e:
         print(f"failed to publish metric {metric_name}: {e}")
 
+# validate_data checks only the rows each run loaded; on this weekday (Sunday),
+# or when triggered with {"full_validation": true}, it sweeps the whole table
+FULL_VALIDATION_WEEKDAY = 6
+
 default_args = {
     "owner": "airflow",
     "depends_on_past": False,
@@ -122,8 +126,8 @@ with DAG(
 
         start_time = time.time()
 
-        pipeline = DailyPipeline()
-        results = pipeline.run(execution_date)
+        with DailyPipeline() as pipeline:
+            results = pipeline.run(execution_date)
         duration = time.time() - start_time
 
         publish_cloudwatch_metric("PipelineDuration", duration, "Seconds")
@@ -132,17 +136,40 @@ with DAG(
         return results
     
     @task
-    def validate_data(**context):
+    def validate_data(pipeline_results, **context):
         """Run Great Expectations validation on pipeline output."""
-        from credit_markets.quality.expectations import get_context, validate_fred_data
-
-        gx_context = get_context()
-        result = validate_fred_data(gx_context)
+        from credit_markets.quality.expectations import validate_fred_data
 
-        if not result.success:
-            raise ValueError(f"Data quality check failed: {result.statistics}")
-
-        return result.statistics
+        dag_run = context["dag_run"]
+        full_sweep = (
+            (dag_run.conf or {}).get("full_validation", False)
+            or context["logical_date"].weekday() == FULL_VALIDATION_WEEKDAY
+        )
+        if not full_sweep and not pipeline_results["fred"]["silver_rows"]:
+            return {"skipped": "no FRED rows loaded"}
+
+        if full_sweep:
+            load_dates = [None]
+        else:
+            # ingested_at holds UTC time (column default and pipeline sessions use UTC),
+            # and Airflow task start/end dates are UTC, so their dates line up
+            pipeline_task = dag_run.get_task_instance("run_daily_pipeline")
+            day = pipeline_task.start_date.date()
+            last_day = (pipeline_task.end_date or datetime.now(timezone.utc)).date()
+            load_dates = []
+            while day <= last_day:
+                load_dates.append(day)
+                day += timedelta(days=1)
+
+        statistics = {}
+        for load_date in load_dates:
+            # GX context, datasource and suite are loaded once and reused for each date
+            result = validate_fred_data(load_date=load_date)
+            statistics[str(load_date or "full_table")] = result.statistics
+            if not result.success:
+                raise ValueError(f"Data quality check failed for {load_date or 'full table'}: {result.statistics}")
+
+        return statistics
 
     @task
     def trigger_lambda(pipeline_results, **context):
@@ -172,7 +199,7 @@ with DAG(
         return response['StatusCode']
 
     pipeline_result = run_daily_pipeline()
-    validation_result = validate_data()
+    validation_result = validate_data(pipeline_result)
     wait_for_fred_data >> pipeline_result >> validation_result >> trigger_lambda(pipeline_result)
 
    
\ No newline at end of file
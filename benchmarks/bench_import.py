@@ -0,0 +1,67 @@
+"""Cold-start benchmark: import time of the CLI and Lambda entry points.
+
+Runs `python -X importtime` in fresh interpreters and reports the cumulative
+import time of each entry point, median over several runs. With --budget-ms
+the script exits non-zero when an entry point exceeds the budget, so it can
+gate CI against import-time regressions.
+
+Usage:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --budget-ms 300 --top 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+ENTRY_POINTS = ("credit_markets.cli", "credit_markets.lambda_handler")
+
+
+def import_times(module: str) -> dict:
+    """Cumulative microseconds per imported module for one cold import."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if cumulative.isdigit():
+            times[name] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail when an entry point imports slower")
+    parser.add_argument("--top", type=int, default=5, help="Slowest dependencies to list")
+    args = parser.parse_args()
+
+    over_budget = []
+    for module in ENTRY_POINTS:
+        runs = [import_times(module) for _ in range(args.runs)]
+        total_ms = statistics.median(run[module] for run in runs) / 1000
+        last = runs[-1]
+        slowest = sorted(
+            ((name, us) for name, us in last.items() if name != module and "." not in name),
+            key=lambda entry: entry[1], reverse=True,
+        )[:args.top]
+        print(json.dumps({
+            "module": module,
+            "import_ms": round(total_ms, 1),
+            "slowest": {name: round(us / 1000, 1) for name, us in slowest},
+        }))
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            over_budget.append(module)
+
+    if over_budget:
+        sys.exit(f"Import time over {args.budget_ms} ms budget: {', '.join(over_budget)}")
+
+
+if __name__ == "__main__":
+    main()
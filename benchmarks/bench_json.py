@@ -0,0 +1,87 @@
+"""Micro-benchmark: stdlib json vs credit_markets.utils.serialization.
+
+Times encoding and decoding of SEC submissions payloads, the largest
+documents the pipeline serializes (bronze S3 bodies, manifest digests).
+
+Usage:
+    python -m benchmarks.bench_json                      # fetch CIKs from SEC
+    python -m benchmarks.bench_json --cik 320193 --cik 789019
+    python -m benchmarks.bench_json --file submissions.json
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from credit_markets.utils import serialization
+
+DEFAULT_CIKS = ("320193", "789019", "19617", "70858")
+
+
+def load_payloads(files: list, ciks: list) -> list:
+    if files:
+        return [json.loads(Path(path).read_bytes()) for path in files]
+    from credit_markets.ingestion.sec import SECClient
+
+    with SECClient() as client:
+        return [client.get_company_filings(cik) for cik in ciks]
+
+
+def best_of(func, repeat: int, number: int) -> float:
+    """Median seconds per call over `repeat` runs of `number` calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return statistics.median(timings)
+
+
+def run(payloads: list, repeat: int, number: int) -> list:
+    results = []
+    for payload in payloads:
+        stdlib_bytes = json.dumps(payload).encode("utf-8")
+        fast_bytes = serialization.dumps(payload)
+        cases = {
+            "dumps": (
+                lambda payload=payload: json.dumps(payload).encode("utf-8"),
+                lambda payload=payload: serialization.dumps(payload),
+            ),
+            "loads": (
+                lambda stdlib_bytes=stdlib_bytes: json.loads(stdlib_bytes),
+                lambda fast_bytes=fast_bytes: serialization.loads(fast_bytes),
+            ),
+        }
+        for operation, (baseline, candidate) in cases.items():
+            stdlib = best_of(baseline, repeat, number)
+            fast = best_of(candidate, repeat, number)
+            results.append({
+                "payload": payload.get("name") or payload.get("cik"),
+                "size_mb": round(len(stdlib_bytes) / 1e6, 2),
+                "operation": operation,
+                "stdlib_ms": round(stdlib * 1000, 3),
+                f"{serialization.BACKEND}_ms": round(fast * 1000, 3),
+                "speedup": round(stdlib / fast, 1),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", action="append", default=[], help="Saved submissions JSON (repeatable)")
+    parser.add_argument("--cik", action="append", default=[], help="CIK to fetch from SEC (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.file, args.cik or list(DEFAULT_CIKS))
+    print(f"backend: {serialization.BACKEND}")
+    for row in run(payloads, args.repeat, args.number):
+        print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Micro-benchmark: synchronous JSON logging vs the queue-backed handler.
+
+Measures the time a worker thread spends inside logger.info() while
+several threads log concurrently, the way fetch/load workers do in the
+daily pipeline. Both backends write JSON lines to a temporary file;
+--write-latency adds a delay per write to model a slow sink (a pipe to
+CloudWatch, a congested stdout), which is where the queue pays off.
+
+Usage:
+    python -m benchmarks.bench_logging
+    python -m benchmarks.bench_logging --threads 16 --records 5000
+    python -m benchmarks.bench_logging --write-latency 0.0001
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import tempfile
+import threading
+import time
+
+from credit_markets.observability.logging import (
+    JSONFormatter,
+    configure_logging,
+    flush_logging,
+    log_context,
+    shutdown_logging,
+)
+
+LOGGER = "credit_markets.bench"
+
+
+class SlowStream:
+    """File wrapper that sleeps before each write."""
+
+    def __init__(self, stream, latency: float):
+        self.stream = stream
+        self.latency = latency
+
+    def write(self, text):
+        if self.latency:
+            time.sleep(self.latency)
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def sync_backend(stream):
+    """The previous setup: format and write on the calling thread."""
+    logger = logging.getLogger(LOGGER)
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JSONFormatter())
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return lambda: logger.removeHandler(handler)
+
+
+def queue_backend(stream):
+    logger = logging.getLogger(LOGGER)
+    logger.propagate = True
+    configure_logging(level="INFO", queue_size=100_000, stream=stream)
+    return shutdown_logging
+
+
+def hammer(threads: int, records: int) -> list:
+    """Per-call latencies (seconds) from `threads` threads logging `records` each."""
+    logger = logging.getLogger(LOGGER)
+    latencies = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads)
+
+    def work(index):
+        with log_context(run_id="bench", source="fred", entity=f"SERIES{index}"):
+            barrier.wait()
+            timings = latencies[index]
+            for n in range(records):
+                start = time.perf_counter()
+                logger.info("Loaded observations", extra={"rows": n, "batch": index})
+                timings.append(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=work, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return [t for timings in latencies for t in timings]
+
+
+def run(threads: int, records: int, write_latency: float = 0.0) -> list:
+    results = []
+    for name, backend in (("sync", sync_backend), ("queue", queue_backend)):
+        with tempfile.TemporaryFile("w+") as stream:
+            teardown = backend(SlowStream(stream, write_latency))
+            start = time.perf_counter()
+            latencies = hammer(threads, records)
+            emit = time.perf_counter() - start
+            flush_logging()
+            total = time.perf_counter() - start
+            teardown()
+        latencies.sort()
+        results.append({
+            "backend": name,
+            "threads": threads,
+            "write_latency_ms": write_latency * 1000,
+            "records": len(latencies),
+            "mean_us": round(statistics.fmean(latencies) * 1e6, 2),
+            "p50_us": round(latencies[len(latencies) // 2] * 1e6, 2),
+            "p99_us": round(latencies[int(len(latencies) * 0.99)] * 1e6, 2),
+            "emit_s": round(emit, 3),
+            "drained_s": round(total, 3),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--records", type=int, default=2000, help="Records per thread")
+    parser.add_argument("--write-latency", type=float, default=0.0, help="Seconds added to each write")
+    args = parser.parse_args()
+
+    for row in run(args.threads, args.records, args.write_latency):
+        print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""End-to-end throughput benchmark for DailyPipeline.run.
+
+Runs the full fetch -> bronze -> silver pipeline offline against local
+stand-ins:
+
+- FRED/SEC: benchmarks.fake_api, with configurable latency and payload size
+- S3: a moto server, or MinIO/LocalStack via --s3-endpoint
+- Postgres: a scratch database, credit_markets_bench, created on the
+  server from DATABASE_* (make docker-up) and dropped afterwards; the
+  infrastructure/sql/init schema is applied and the silver tables are
+  truncated before each run. --i-know-this-truncates runs against the
+  configured database itself instead
+
+The fake API and moto run in their own processes, so their CPU time and
+memory are not counted against the pipeline. Each universe size runs in a
+fresh subprocess so peak RSS is per run.
+Reports items/s, silver rows/s, per-stage p50/p99 latency and peak RSS,
+and writes them with the commit hash to benchmarks/results/ (not checked
+in) so runs can be compared between commits (--compare).
+
+Usage:
+    python -m benchmarks.bench_pipeline                          # 10, 1k, 10k CIKs
+    python -m benchmarks.bench_pipeline --universe 1000 --latency 0.05
+    python -m benchmarks.bench_pipeline --compare benchmarks/results/pipeline-<sha>.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager, suppress
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+DEFAULT_UNIVERSES = (10, 1_000, 10_000)
+RESULTS_DIR = Path(__file__).parent / "results"
+SQL_DIR = Path(__file__).parent.parent / "infrastructure" / "sql" / "init"
+BUCKET = "credit-markets-bench"
+BENCH_DATABASE = "credit_markets_bench"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{process.args[2]} exited with {process.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1.0).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"{process.args[2]} did not listen on port {port} within {timeout}s")
+
+
+def create_bucket(endpoint: str) -> None:
+    import boto3
+
+    s3 = boto3.client("s3", endpoint_url=endpoint, region_name=os.environ.get("AWS_REGION", "us-east-1"))
+    with suppress(s3.exceptions.BucketAlreadyOwnedByYou):
+        s3.create_bucket(Bucket=BUCKET)
+
+
+@contextmanager
+def stand_ins(args):
+    """Start the fake API (and moto unless --s3-endpoint is given) as separate processes.
+
+    Yields:
+        (api_url, s3_endpoint) tuple
+    """
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+    servers = {}
+    try:
+        api_port = free_port()
+        servers[api_port] = subprocess.Popen([
+            sys.executable, "-m", "benchmarks.fake_api",
+            "--port", str(api_port),
+            "--latency", str(args.latency),
+            "--observations", str(args.observations),
+            "--filings", str(args.filings),
+        ], stdout=subprocess.DEVNULL)
+        s3_endpoint = args.s3_endpoint
+        if s3_endpoint is None:
+            s3_port = free_port()
+            servers[s3_port] = subprocess.Popen(
+                [sys.executable, "-m", "moto.server", "-H", "127.0.0.1", "-p", str(s3_port)],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            s3_endpoint = f"http://127.0.0.1:{s3_port}"
+        for port, process in servers.items():
+            wait_for_port(port, process)
+        create_bucket(s3_endpoint)
+        yield f"http://127.0.0.1:{api_port}", s3_endpoint
+    finally:
+        for process in servers.values():
+            process.terminate()
+            process.wait()
+
+
+def configure_environment(api_url: str, s3_endpoint: str) -> None:
+    """Point the pipeline settings at the local stand-ins, without rate limits or caching."""
+    os.environ.update({
+        "FRED_BASE_URL": f"{api_url}/fred",
+        "SEC_BASE_URL": api_url,
+        "FRED_API_KEY": "bench",
+        "SEC_USER_AGENT": "credit-markets-bench bench@example.com",
+        "AWS_ENDPOINT_URL": s3_endpoint,
+        "AWS_REGION": os.environ.get("AWS_REGION", "us-east-1"),
+        "S3_BUCKET": BUCKET,
+        "FRED_RATE_LIMIT": "1000000",
+        "FRED_RATE_BURST": "1000000",
+        "SEC_RATE_LIMIT": "1000000",
+        "SEC_RATE_BURST": "1000000",
+        "HTTP_CACHE_ENABLED": "false",
+        "HTTP2": "false",
+        "BRONZE_DEDUP": "off",
+        "LOG_LEVEL": os.environ.get("LOG_LEVEL", "WARNING"),
+    })
+
+
+@contextmanager
+def bench_database(args):
+    """Create credit_markets_bench on the configured server and point DATABASE_NAME at it.
+
+    Dropped again on exit. With --i-know-this-truncates the configured
+    database is used as is.
+    """
+    if args.i_know_this_truncates:
+        yield
+        return
+
+    import psycopg2
+    from psycopg2 import sql
+    from credit_markets.config.settings import get_settings
+
+    settings = get_settings()
+    conn = psycopg2.connect(
+        host=settings.database_host,
+        port=settings.database_port,
+        dbname=settings.database_name,
+        user=settings.database_user,
+        password=settings.database_password.get_secret_value(),
+    )
+    conn.autocommit = True
+    name = sql.Identifier(BENCH_DATABASE)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(name))
+            cursor.execute(sql.SQL("CREATE DATABASE {}").format(name))
+        os.environ["DATABASE_NAME"] = BENCH_DATABASE
+        yield
+    finally:
+        with conn.cursor() as cursor:
+            cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(name))
+        conn.close()
+
+
+def reset_database(postgres, allow_any_database: bool = False) -> None:
+    """Apply the schema and empty the silver tables and manifest.
+
+    Refuses to touch any database but credit_markets_bench unless
+    `allow_any_database` (--i-know-this-truncates) is set.
+    """
+    from credit_markets.config.settings import get_settings
+
+    database = get_settings().database_name
+    if database != BENCH_DATABASE and not allow_any_database:
+        raise SystemExit(
+            f"Refusing to truncate silver tables in {database!r}; the benchmark only resets "
+            f"{BENCH_DATABASE!r} unless --i-know-this-truncates is given"
+        )
+    for path in sorted(SQL_DIR.glob("0[01]_*.sql")):
+        postgres.execute(path.read_text())
+    postgres.execute("TRUNCATE silver.treasury_yields, silver.sec_filings, reference.bronze_manifest")
+
+
+def stage_latencies(results: dict) -> dict:
+    return {
+        f"{source}.{name}": {
+            "p50_ms": round(stats["p50_seconds"] * 1000, 2),
+            "p99_ms": round(stats["p99_seconds"] * 1000, 2),
+            "items_per_second": stats["items_per_second"],
+        }
+        for source in ("fred", "sec")
+        for name, stats in results[source]["stages"].items()
+    }
+
+
+def run_once(universe: int, args) -> dict:
+    """Benchmark one universe size in this process against already running stand-ins."""
+    configure_environment(args.api_url, args.s3_endpoint)
+
+    from credit_markets.pipeline.daily import DailyPipeline
+
+    series = [f"BENCH{n:05d}" for n in range(args.series)]
+    ciks = [str(n) for n in range(1, universe + 1)]
+    with DailyPipeline() as pipeline:
+        reset_database(pipeline.postgres, allow_any_database=args.i_know_this_truncates)
+        start = time.perf_counter()
+        results = pipeline.run(date.today(), full_refresh=True, series=series, ciks=ciks)
+        elapsed = time.perf_counter() - start
+
+    items = len(series) + len(ciks)
+    rows = results["fred"]["silver_rows"] + results["sec"]["silver_rows"]
+    return {
+        "universe": universe,
+        "series": len(series),
+        "latency_ms": args.latency * 1000,
+        "observations": args.observations,
+        "filings": args.filings,
+        "elapsed_s": round(elapsed, 3),
+        "items_per_second": round(items / elapsed, 2),
+        "rows_per_second": round(rows / elapsed, 2),
+        "silver_rows": rows,
+        "failed": len(results["fred"]["failed"]) + len(results["sec"]["failed"]),
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "stages": stage_latencies(results),
+    }
+
+
+def run_subprocess(universe: int, args, api_url: str, s3_endpoint: str) -> dict:
+    command = [
+        sys.executable, "-m", "benchmarks.bench_pipeline", "--child",
+        "--universe", str(universe),
+        "--series", str(args.series),
+        "--latency", str(args.latency),
+        "--observations", str(args.observations),
+        "--filings", str(args.filings),
+        "--api-url", api_url,
+        "--s3-endpoint", s3_endpoint,
+    ]
+    if args.i_know_this_truncates:
+        command.append("--i-know-this-truncates")
+    completed = subprocess.run(command, stdout=subprocess.PIPE, check=True, text=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(baseline_path: str, runs: list) -> None:
+    """Print throughput and RSS of `runs` relative to a saved results file."""
+    baseline = {run["universe"]: run for run in json.loads(Path(baseline_path).read_text())["runs"]}
+    for run in runs:
+        before = baseline.get(run["universe"])
+        if before is None:
+            continue
+        print(json.dumps({
+            "universe": run["universe"],
+            "baseline": baseline_path,
+            "items_per_second_ratio": round(run["items_per_second"] / before["items_per_second"], 3),
+            "rows_per_second_ratio": round(run["rows_per_second"] / before["rows_per_second"], 3),
+            "peak_rss_ratio": round(run["peak_rss_mb"] / before["peak_rss_mb"], 3),
+        }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--universe", type=int, action="append", help="Number of CIKs (repeatable)")
+    parser.add_argument("--series", type=int, default=50, help="Number of FRED series")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake API seconds per response")
+    parser.add_argument("--observations", type=int, default=250, help="Observations per FRED series")
+    parser.add_argument("--filings", type=int, default=100, help="Recent filings per SEC company")
+    parser.add_argument("--s3-endpoint", help="Existing S3 endpoint (MinIO/LocalStack) instead of moto")
+    parser.add_argument("--output", type=Path, help="Results file (default benchmarks/results/pipeline-<commit>.json)")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument(
+        "--i-know-this-truncates",
+        action="store_true",
+        help="Use the configured DATABASE_NAME instead of a scratch database; its silver tables are truncated",
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--api-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        # --universe is repeatable; a child is always given exactly one
+        print(json.dumps(run_once(args.universe[0], args)))
+        return
+
+    runs = []
+    with stand_ins(args) as (api_url, s3_endpoint):
+        configure_environment(api_url, s3_endpoint)
+        with bench_database(args):
+            for universe in args.universe or DEFAULT_UNIVERSES:
+                run = run_subprocess(universe, args, api_url, s3_endpoint)
+                print(json.dumps(run))
+                runs.append(run)
+
+    commit = git_commit()
+    output = args.output or RESULTS_DIR / f"pipeline-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "runs": runs,
+    }, indent=2))
+    print(f"Results written to {output}")
+
+    if args.compare:
+        compare(args.compare, runs)
+
+
+if __name__ == "__main__":
+    main()
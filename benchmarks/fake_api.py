@@ -0,0 +1,130 @@
+"""Local stand-in for the FRED and SEC APIs.
+
+Serves deterministic payloads shaped like the real responses the
+pipeline parses, with a configurable per-request latency and payload
+size, so benchmarks exercise the real HTTP clients without the network
+or the public rate limits.
+
+    GET /fred/series/observations?series_id=...&observation_start=...
+    GET /submissions/CIK##########.json
+
+Usage:
+    python -m benchmarks.fake_api --port 8900 --latency 0.05
+"""
+
+import argparse
+import threading
+import time
+import zlib
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from credit_markets.utils import serialization
+
+FORMS = ("10-K", "10-Q", "8-K", "4", "S-1", "DEF 14A")
+LAST_DATE = date(2026, 1, 30)
+
+
+def fred_payload(series_id: str, observations: int, observation_start: str = None) -> dict:
+    """`observations` daily values ending at LAST_DATE, from observation_start on."""
+    seed = zlib.crc32(series_id.encode())
+    start = LAST_DATE - timedelta(days=observations - 1)
+    if observation_start:
+        start = max(start, date.fromisoformat(observation_start))
+    rows = []
+    day = start
+    while day <= LAST_DATE:
+        n = day.toordinal()
+        rows.append({
+            "realtime_start": str(LAST_DATE),
+            "realtime_end": str(LAST_DATE),
+            "date": str(day),
+            "value": "." if (n + seed) % 97 == 0 else f"{(n * 7 + seed) % 600 / 100:.2f}",
+        })
+        day += timedelta(days=1)
+    return {"observation_start": str(start), "observation_end": str(LAST_DATE), "observations": rows}
+
+
+def sec_payload(cik: str, filings: int) -> dict:
+    """A submissions document with `filings` recent filings."""
+    cik = cik.lstrip("0") or "0"
+    return {
+        "cik": cik,
+        "name": f"Benchmark Company {cik}",
+        "filings": {
+            "recent": {
+                "accessionNumber": [f"{int(cik):010d}-26-{n:06d}" for n in range(filings)],
+                "form": [FORMS[n % len(FORMS)] for n in range(filings)],
+                "filingDate": [str(LAST_DATE - timedelta(days=n)) for n in range(filings)],
+            }
+        },
+    }
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real APIs
+
+    def do_GET(self):
+        config = self.server.config
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/fred/series/observations" and "series_id" in params:
+            body = fred_payload(params["series_id"], config["observations"], params.get("observation_start"))
+        elif url.path.startswith("/submissions/CIK") and url.path.endswith(".json"):
+            body = sec_payload(url.path[len("/submissions/CIK"):-len(".json")], config["filings"])
+        else:
+            self.send_error(404)
+            return
+
+        if config["latency"]:
+            time.sleep(config["latency"])
+        content = serialization.dumps(body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency: float = 0.0, observations: int = 250, filings: int = 100):
+        super().__init__(("127.0.0.1", port), FakeAPIHandler)
+        self.config = {"latency": latency, "observations": observations, "filings": filings}
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> "FakeAPIServer":
+        self.thread = threading.Thread(target=self.serve_forever, name="fake-api", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--observations", type=int, default=250, help="Observations per FRED series")
+    parser.add_argument("--filings", type=int, default=100, help="Recent filings per SEC company")
+    args = parser.parse_args()
+
+    server = FakeAPIServer(args.port, args.latency, args.observations, args.filings)
+    print(f"Serving on {server.url} (FRED_BASE_URL={server.url}/fred SEC_BASE_URL={server.url})")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -16,4 +16,15 @@ CREATE TABLE IF NOT EXISTS reference.sec_companies (
     ,name VARCHAR(255) NOT NULL
     ,is_active BOOLEAN DEFAULT TRUE
     ,created_at TIMESTAMP DEFAULT NOW() 
-);
\ No newline at end of file
+);
+
+-- Last bronze payload digest per entity, used to skip unchanged payloads
+CREATE TABLE IF NOT EXISTS reference.bronze_manifest (
+     source VARCHAR(10) NOT NULL
+    ,entity_id VARCHAR(20) NOT NULL
+    ,content_hash CHAR(64) NOT NULL
+    ,bronze_key VARCHAR(255)
+    ,run_date DATE NOT NULL
+    ,updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+    ,PRIMARY KEY (source, entity_id)
+);
@@ -7,7 +7,7 @@ CREATE TABLE IF NOT EXISTS silver.treasury_yields (
      observation_date DATE NOT NULL
     ,series_id VARCHAR(20) NOT NULL
     ,value DECIMAL(10, 4)
-    ,ingested_at TIMESTAMP NOT NULL DEFAULT NOW()
+    ,ingested_at TIMESTAMP NOT NULL DEFAULT (NOW() AT TIME ZONE 'UTC')
     ,PRIMARY KEY (observation_date, series_id)
 );
 
@@ -17,12 +17,27 @@ CREATE TABLE IF NOT EXISTS silver.sec_filings (
     ,company_name VARCHAR(255)
     ,filing_type VARCHAR(20)
     ,filing_date DATE
-    ,ingested_at TIMESTAMP NOT NULL DEFAULT NOW()
+    ,ingested_at TIMESTAMP NOT NULL DEFAULT (NOW() AT TIME ZONE 'UTC')
 );
 
+-- ingested_at is UTC wall-clock time whatever the session TimeZone. It stays
+-- TIMESTAMP rather than TIMESTAMPTZ because EXTRACT() on TIMESTAMPTZ is not
+-- IMMUTABLE, which the ingested-day index below requires.
+ALTER TABLE silver.treasury_yields ALTER COLUMN ingested_at SET DEFAULT (NOW() AT TIME ZONE 'UTC');
+ALTER TABLE silver.sec_filings ALTER COLUMN ingested_at SET DEFAULT (NOW() AT TIME ZONE 'UTC');
+
 CREATE INDEX IF NOT EXISTS idx_treasury_yields_date
     ON silver.treasury_yields (observation_date DESC);
 
+-- Matches the year/month/day predicates of the GX "ingested_daily" batch,
+-- so validating one day's load does not scan the whole table
+CREATE INDEX IF NOT EXISTS idx_treasury_yields_ingested_day
+    ON silver.treasury_yields (
+         (EXTRACT(YEAR FROM ingested_at))
+        ,(EXTRACT(MONTH FROM ingested_at))
+        ,(EXTRACT(DAY FROM ingested_at))
+    );
+
 CREATE INDEX IF NOT EXISTS idx_sec_filings_date
     ON silver.sec_filings (filing_date DESC);
 
@@ -18,6 +18,11 @@ pip install -r requirements-lambda.txt -t build/lambda/ \
     --only-binary=:all: \
     --quiet
 
+#Drop pyarrow's C++ headers, Cython sources and tests (~14 MB) that are not
+#needed at runtime; the unzipped package must stay under Lambda's 250 MB limit
+rm -rf build/lambda/pyarrow/include build/lambda/pyarrow/src build/lambda/pyarrow/tests
+find build/lambda/pyarrow \( -name "*.pxd" -o -name "*.pyx" -o -name "*.pxi" \) -delete
+
 #Create zip
 cd build/lambda
 zip -r ../lambda.zip . -q
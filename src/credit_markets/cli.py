@@ -1,8 +1,11 @@
 # CLI Interface
 
 import click
-from datetime import date, timedelta
-from credit_markets.pipeline.daily import DailyPipeline
+from datetime import date
+
+# Pipeline modules are imported inside each command so that `--help` and
+# argument errors do not pay for loading httpx, boto3, psycopg2 and pyarrow.
+SOURCES = ("fred", "sec")
 
 @click.group()
 def cli():
@@ -10,7 +13,9 @@ def cli():
     pass
 @cli.command()
 @click.option("--target-date", type=click.DateTime(formats=["%Y-%m-%d"]), default=None, help="Date to run pipeline for")
-def run(target_date):
+@click.option("--full-refresh", is_flag=True, default=False, help="Fetch full FRED history instead of incrementally")
+@click.option("--async", "use_async", is_flag=True, default=False, help="Fetch from the APIs with the asyncio engine")
+def run(target_date, full_refresh, use_async):
     """Run the daily pipeline"""
 
     if target_date is None:
@@ -20,8 +25,14 @@ def run(target_date):
 
     click.echo(f"Running pipeline for {run_date}")
 
-    pipeline = DailyPipeline()
-    results = pipeline.run(run_date)
+    import asyncio
+    from credit_markets.pipeline.daily import DailyPipeline
+
+    with DailyPipeline() as pipeline:
+        if use_async:
+            results = asyncio.run(pipeline.run_async(run_date, full_refresh=full_refresh))
+        else:
+            results = pipeline.run(run_date, full_refresh=full_refresh)
 
     click.echo(f"FRED: {results['fred']['silver_rows']} rows")
     click.echo(f"SEC: {results['sec']['silver_rows']} rows")
@@ -29,7 +40,8 @@ def run(target_date):
 @cli.command()
 @click.option("--start-date", type=click.DateTime(formats=['%Y-%m-%d']), required=True, help="Start date")
 @click.option("--end-date", type=click.DateTime(formats=["%Y-%m-%d"]), required= True, help="End date")
-def backfill(start_date, end_date):
+@click.option("--workers", type=int, default=5, show_default=True, help="Parallel fetch/upload workers")
+def backfill(start_date, end_date, workers):
     """Backfill data for a date range"""
     start = start_date.date()
     end = end_date.date()
@@ -37,15 +49,37 @@ def backfill(start_date, end_date):
     total_days = (end - start).days + 1
     click.echo(f"Backfilling {total_days} days: {start} to {end}")
 
-    pipeline = DailyPipeline()
-    current = start
+    from credit_markets.pipeline.backfill import BackfillPipeline
+    from credit_markets.pipeline.daily import DailyPipeline
 
-    while current <= end:
-        click.echo(f"Processing {current}...")
-        pipeline.run(current)
-        current += timedelta(days=1)
+    with DailyPipeline() as pipeline:
+        results = BackfillPipeline(pipeline).run(start, end, workers=workers)
 
+    click.echo(f"FRED: {results['fred']['silver_rows']} rows, {results['fred']['bronze_objects']} bronze objects")
+    click.echo(f"SEC: {results['sec']['silver_rows']} rows, {results['sec']['bronze_objects']} bronze objects")
     click.echo(f"Backfill complete: {total_days} days processed")
 
+@cli.command()
+@click.option("--start-date", type=click.DateTime(formats=["%Y-%m-%d"]), required=True, help="First bronze run date")
+@click.option("--end-date", type=click.DateTime(formats=["%Y-%m-%d"]), required=True, help="Last bronze run date")
+@click.option("--source", "sources", type=click.Choice(SOURCES), multiple=True, help="Source to replay (default: all)")
+@click.option("--workers", type=int, default=None, help="Parallel S3 readers (default: replay_read_workers)")
+def replay(start_date, end_date, sources, workers):
+    """Rebuild silver from bronze objects without calling the APIs"""
+    start = start_date.date()
+    end = end_date.date()
+    sources = sources or SOURCES
+
+    click.echo(f"Replaying {', '.join(sources)} bronze: {start} to {end}")
+
+    from credit_markets.pipeline.daily import DailyPipeline
+    from credit_markets.pipeline.replay import ReplayPipeline
+
+    with DailyPipeline() as pipeline:
+        results = ReplayPipeline(pipeline).run(start, end, sources=sources, workers=workers)
+
+    for source in sources:
+        click.echo(f"{source.upper()}: {results[source]['silver_rows']} rows from {results[source]['bronze_objects']} bronze objects")
+
 if __name__ == "__main__":
     cli()
\ No newline at end of file
@@ -13,6 +13,7 @@ Hints:
 """
 
 from functools import lru_cache
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import SecretStr
 
@@ -33,11 +34,83 @@ class Settings(BaseSettings):
     database_name: str
     database_user: str
     database_password: SecretStr
+    database_pool_min_size: int = 1
+    database_pool_size: int = 5
+    database_pool_timeout: float = 30.0
+    database_pool_health_check_interval: float = 30.0
+    database_pool_max_lifetime: float = 3600.0
     
+    # HTTP
+    # Overridable so tests and benchmarks can point the clients at a local server
+    fred_base_url: str = "https://api.stlouisfed.org/fred"
+    sec_base_url: str = "https://data.sec.gov"
+    http_timeout: float = 30.0
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http2: bool = True
+    http_compression: bool = True
+    async_max_in_flight: int = 100
+    fred_rate_limit: float = 2.0
+    fred_rate_burst: int = 5
+    sec_rate_limit: float = 10.0
+    sec_rate_burst: int = 10
+    fetch_workers: int = 10
+    http_cache_enabled: bool = False
+    http_cache_dir: str = ".cache/http"
+    http_cache_max_bytes: int = 2_000_000_000
+    http_cache_max_entries: int = 50_000
+
+    # Pipeline stages
+    bronze_workers: int = 8
+    silver_workers: int = 4
+    stage_queue_size: int = 50
+    # Seconds kept in reserve for in-flight work when a run has a deadline
+    deadline_margin_seconds: float = 60.0
+
+    # Loading
+    fred_incremental: bool = True
+    fred_lookback_days: int = 7
+    sec_load_batch_size: int = 50
+    replay_read_workers: int = 16
+    replay_batch_rows: int = 50_000
+    # Skip bronze writes and silver loads for payloads whose digest is unchanged;
+    # "pointer" still writes a small object referencing the last full payload
+    bronze_dedup: Literal["off", "skip", "pointer"] = "off"
+    # Batches failing the in-flight quality checks are written here instead of silver
+    quarantine_enabled: bool = True
+    quarantine_prefix: str = "quarantine"
+
     # S3
     s3_bucket: str
     aws_region: str
     aws_endpoint_url: str | None = None 
+    s3_bronze_encoding: Literal["identity", "gzip", "zstd"] = "identity"
+    s3_compression_level: int | None = None
+    s3_upload_workers: int = 16
+    s3_max_pool_connections: int = 32
+
+    # Columnar output
+    columnar_format: Literal["none", "parquet", "delta"] = "none"
+    columnar_root: str | None = None
+    # Delta commits on S3 need a lock so concurrent writers do not lose appends:
+    # a DynamoDB table (delta-rs locking provider), or unsafe renames when only
+    # one writer can ever run at a time
+    delta_lock_table: str | None = None
+    delta_allow_unsafe_rename: bool = False
+    write_bronze_json: bool = True
+
+    # Observability
+    log_level: str = "INFO"
+    log_queue_size: int = 10_000
+    # Records below INFO (per-item debug logs) are sampled and capped per call site
+    log_debug_sample_rate: float = 1.0
+    log_debug_max_per_second: float | None = 20.0
+    metrics_textfile: str | None = None
+    metrics_pushgateway: str | None = None
+    metrics_job: str = "credit_markets"
+    trace_exporter: Literal["none", "console"] = "none"
+    trace_file: str | None = None
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,171 @@
+# On-disk Conditional Request Cache
+
+import hashlib
+import json
+import os
+import time
+from contextlib import suppress
+from pathlib import Path
+from threading import Lock, get_ident
+
+import httpx
+from credit_markets.config.settings import get_settings
+from credit_markets.utils import serialization
+
+# Query parameters that identify the caller rather than the resource
+UNCACHED_PARAMS = {"api_key"}
+
+
+class HTTPCache:
+    """On-disk cache of response bodies and their validators, keyed by URL.
+
+    Stores the ETag / Last-Modified of each response so the next request can
+    be sent with If-None-Match / If-Modified-Since. A 304, or a 200 whose
+    body hashes the same as the cached one, is reported as unchanged. The
+    least recently used entries are evicted once the cache exceeds
+    `max_bytes` or `max_entries`.
+
+    A new body is staged until mark_loaded() is called for its URL, i.e.
+    after the caller has loaded it. Until then no conditional headers are
+    sent and the body is reported as changed again, so a payload whose load
+    failed is fetched and loaded again on the next run.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, max_entries: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._index = None  # key -> (size, last_access)
+
+    def get(self, http: httpx.Client, url: str, params: dict = None, headers: dict = None) -> tuple:
+        """GET url conditionally.
+
+        Returns:
+            (data, changed) tuple, where data is the parsed JSON body
+        """
+        key = self.cache_key(url, params)
+        request_headers = {**(headers or {}), **self.conditional_headers(key)}
+        response = http.get(url, params=params, headers=request_headers)
+        if response.status_code == 304 and not self._body_path(key).exists():
+            # Evicted between building the validators and the reply
+            response = http.get(url, params=params, headers=headers)
+        return self.handle_response(key, response)
+
+    async def aget(self, http: httpx.AsyncClient, url: str, params: dict = None, headers: dict = None) -> tuple:
+        """Async variant of get()."""
+        key = self.cache_key(url, params)
+        request_headers = {**(headers or {}), **self.conditional_headers(key)}
+        response = await http.get(url, params=params, headers=request_headers)
+        if response.status_code == 304 and not self._body_path(key).exists():
+            response = await http.get(url, params=params, headers=headers)
+        return self.handle_response(key, response)
+
+    def cache_key(self, url: str, params: dict = None) -> str:
+        identity = sorted((k, str(v)) for k, v in (params or {}).items() if k not in UNCACHED_PARAMS)
+        return hashlib.sha256(json.dumps([url, identity]).encode()).hexdigest()
+
+    def mark_loaded(self, url: str, params: dict = None) -> None:
+        """Commit the validators of the staged body for url once it has been loaded."""
+        key = self.cache_key(url, params)
+        meta = self._read_meta(key)
+        if meta is None or meta.get("loaded"):
+            return
+        meta["loaded"] = True
+        self._replace(self._meta_path(key), json.dumps(meta).encode())
+
+    def conditional_headers(self, key: str) -> dict:
+        meta = self._read_meta(key)
+        if meta is None or not meta.get("loaded") or not self._body_path(key).exists():
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def handle_response(self, key: str, response: httpx.Response) -> tuple:
+        if response.status_code == 304:
+            body = self._body_path(key).read_bytes()
+            self._touch(key, len(body))
+            return serialization.loads(body), False
+
+        response.raise_for_status()
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        previous = self._read_meta(key)
+        changed = previous is None or not previous.get("loaded") or previous.get("content_hash") != digest
+
+        self._write(key, body, {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_hash": digest,
+            "loaded": not changed,
+        })
+        return serialization.loads(body), changed
+
+    def _meta_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / f"{key}.body"
+
+    def _read_meta(self, key: str):
+        try:
+            return json.loads(self._meta_path(key).read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _replace(self, path: Path, content: bytes) -> None:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{get_ident()}.tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, path)
+
+    def _write(self, key: str, body: bytes, meta: dict) -> None:
+        self._replace(self._body_path(key), body)
+        self._replace(self._meta_path(key), json.dumps(meta).encode())
+        self._touch(key, len(body))
+        self._evict()
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            self._index = {}
+            for body in self.directory.glob("*.body"):
+                stat = body.stat()
+                self._index[body.stem] = (stat.st_size, stat.st_mtime)
+        return self._index
+
+    def _touch(self, key: str, size: int) -> None:
+        now = time.time()
+        with self._lock:
+            self._load_index()[key] = (size, now)
+        with suppress(FileNotFoundError):
+            os.utime(self._body_path(key), (now, now))
+
+    def _evict(self) -> None:
+        with self._lock:
+            index = self._load_index()
+            total = sum(size for size, _ in index.values())
+            if total <= self.max_bytes and len(index) <= self.max_entries:
+                return
+            for key, (size, _) in sorted(index.items(), key=lambda entry: entry[1][1]):
+                if total <= self.max_bytes and len(index) <= self.max_entries:
+                    break
+                self._body_path(key).unlink(missing_ok=True)
+                self._meta_path(key).unlink(missing_ok=True)
+                del index[key]
+                total -= size
+
+
+def get_http_cache():
+    """HTTPCache configured from Settings, or None when caching is disabled."""
+    settings = get_settings()
+    if not settings.http_cache_enabled:
+        return None
+    return HTTPCache(
+        settings.http_cache_dir,
+        max_bytes=settings.http_cache_max_bytes,
+        max_entries=settings.http_cache_max_entries,
+    )
@@ -1,28 +1,123 @@
 # FRED API Client
 
 import httpx
+from datetime import date
 from credit_markets.config.settings import get_settings
-from credit_markets.utils.retry import retry
+from credit_markets.ingestion.cache import HTTPCache
+from credit_markets.ingestion.http import build_client, get_rate_limiter
+from credit_markets.observability.metrics import count_retry
+from credit_markets.utils import serialization
+from credit_markets.utils.retry import retry, async_retry
+
+def series_params(api_key: str, series_id: str, observation_start: date = None, observation_end: date = None) -> dict:
+    params = {
+        "series_id": series_id,
+        "api_key": api_key,
+        "file_type": "json",
+    }
+    if observation_start is not None:
+        params["observation_start"] = observation_start.isoformat()
+    if observation_end is not None:
+        params["observation_end"] = observation_end.isoformat()
+    return params
 
 class FREDClient:
-    def __init__(self):
+    def __init__(self, http: httpx.Client = None, cache: HTTPCache = None):
+        settings = get_settings()
+        self.api_key = settings.fred_api_key.get_secret_value()
+        self.base_url = settings.fred_base_url
+        self._owns_http = http is None
+        self.http = http or build_client()
+        self.cache = cache
+        self.rate_limiter = get_rate_limiter("fred")
+
+    def close(self) -> None:
+        """Close the HTTP session if this client created it."""
+        if self._owns_http:
+            self.http.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @retry(max_attempts=3, base_delay=1.0, exceptions=(httpx.HTTPError,), on_retry=count_retry)
+    def get_series(self, series_id: str, observation_start: date = None, observation_end: date = None) -> dict:
+        """Fetch observations for a series, optionally limited to a date window."""
+        url = f"{self.base_url}/series/observations"
+        params = series_params(self.api_key, series_id, observation_start, observation_end)
+
+        self.rate_limiter.wait()
+        response = self.http.get(url, params=params)
+        response.raise_for_status()
+        return serialization.loads(response.content)
+
+    @retry(max_attempts=3, base_delay=1.0, exceptions=(httpx.HTTPError,), on_retry=count_retry)
+    def get_series_if_changed(self, series_id: str, observation_start: date = None, observation_end: date = None) -> tuple:
+        """Conditional get_series through the HTTP cache.
+
+        Returns:
+            (data, changed) tuple; changed is always True without a cache
+        """
+        url = f"{self.base_url}/series/observations"
+        params = series_params(self.api_key, series_id, observation_start, observation_end)
+        if self.cache is None:
+            self.rate_limiter.wait()
+            response = self.http.get(url, params=params)
+            response.raise_for_status()
+            return serialization.loads(response.content), True
+        self.rate_limiter.wait()
+        return self.cache.get(self.http, url, params=params)
+
+    def mark_loaded(self, series_id: str, observation_start: date = None, observation_end: date = None) -> None:
+        """Let the HTTP cache send validators for this request once its payload is in silver."""
+        if self.cache is not None:
+            params = series_params(self.api_key, series_id, observation_start, observation_end)
+            self.cache.mark_loaded(f"{self.base_url}/series/observations", params=params)
+
+class AsyncFREDClient:
+    """Async FRED client that issues requests through a shared httpx.AsyncClient."""
+
+    def __init__(self, http: httpx.AsyncClient, cache: HTTPCache = None):
         settings = get_settings()
         self.api_key = settings.fred_api_key.get_secret_value()
-        self.base_url = "https://api.stlouisfed.org/fred"
+        self.base_url = settings.fred_base_url
+        self.http = http
+        self.cache = cache
+        self.rate_limiter = get_rate_limiter("fred")
+
+    @async_retry(max_attempts=3, base_delay=1.0, exceptions=(httpx.HTTPError,), on_retry=count_retry)
+    async def get_series(self, series_id: str, observation_start: date = None, observation_end: date = None) -> dict:
+        """Fetch observations for a series, optionally limited to a date window."""
+        url = f"{self.base_url}/series/observations"
+        params = series_params(self.api_key, series_id, observation_start, observation_end)
+
+        await self.rate_limiter.wait_async()
+        response = await self.http.get(url, params=params)
+        response.raise_for_status()
+        return serialization.loads(response.content)
 
-    @retry(max_attempts=3, base_delay=1.0, exceptions=(httpx.HTTPError,))
-    def get_series(self, series_id: str) -> dict:
+    @async_retry(max_attempts=3, base_delay=1.0, exceptions=(httpx.HTTPError,), on_retry=count_retry)
+    async def get_series_if_changed(self, series_id: str, observation_start: date = None, observation_end: date = None) -> tuple:
+        """Conditional get_series through the HTTP cache; returns (data, changed)."""
         url = f"{self.base_url}/series/observations"
-        params = {
-            "series_id": series_id,
-            "api_key": self.api_key,
-            "file_type": "json",
-        }
+        params = series_params(self.api_key, series_id, observation_start, observation_end)
+        if self.cache is None:
+            await self.rate_limiter.wait_async()
+            response = await self.http.get(url, params=params)
+            response.raise_for_status()
+            return serialization.loads(response.content), True
+        await self.rate_limiter.wait_async()
+        return await self.cache.aget(self.http, url, params=params)
 
-        response = httpx.get(url, params=params)
-        return response.json()
+    def mark_loaded(self, series_id: str, observation_start: date = None, observation_end: date = None) -> None:
+        """Let the HTTP cache send validators for this request once its payload is in silver."""
+        if self.cache is not None:
+            params = series_params(self.api_key, series_id, observation_start, observation_end)
+            self.cache.mark_loaded(f"{self.base_url}/series/observations", params=params)
 
 if __name__ == "__main__":
-    client = FREDClient()
-    data = client.get_series("DGS10")
+    with FREDClient() as client:
+        data = client.get_series("DGS10")
     print(data)
\ No newline at end of file
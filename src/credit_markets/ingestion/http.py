@@ -0,0 +1,78 @@
+# Shared HTTP Client Factory
+
+import importlib.util
+from threading import Lock
+import httpx
+from credit_markets.config.settings import get_settings
+from credit_markets.observability.metrics import rate_limit_observer
+from credit_markets.utils.parallel import RateLimiter
+
+_rate_limiters = {}
+_rate_limiters_lock = Lock()
+
+
+def get_rate_limiter(api: str) -> RateLimiter:
+    """Process-wide token bucket for an API ("fred" or "sec"), shared by sync and async clients."""
+    with _rate_limiters_lock:
+        if api not in _rate_limiters:
+            settings = get_settings()
+            _rate_limiters[api] = RateLimiter(
+                calls_per_second=getattr(settings, f"{api}_rate_limit"),
+                burst=getattr(settings, f"{api}_rate_burst"),
+                on_throttle=rate_limit_observer(api),
+            )
+        return _rate_limiters[api]
+
+
+def rate_limiter_stats() -> dict:
+    with _rate_limiters_lock:
+        return {api: limiter.stats() for api, limiter in _rate_limiters.items()}
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (httpx[http2])."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def accept_encoding() -> str:
+    """Accept-Encoding to negotiate: gzip/deflate, plus brotli when it can be decoded."""
+    if not get_settings().http_compression:
+        return "identity"
+    encodings = ["gzip", "deflate"]
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+def build_limits() -> httpx.Limits:
+    settings = get_settings()
+    return httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+
+
+def build_client(transport: httpx.BaseTransport = None) -> httpx.Client:
+    """Long-lived Client whose keep-alive pool is shared by all worker threads.
+
+    `transport` replaces the default connection pool (e.g. httpx.MockTransport in tests).
+    """
+    settings = get_settings()
+    return httpx.Client(
+        limits=build_limits(),
+        timeout=settings.http_timeout,
+        headers={"Accept-Encoding": accept_encoding()},
+        transport=transport,
+    )
+
+
+def build_async_client() -> httpx.AsyncClient:
+    """AsyncClient with a shared keep-alive pool for all async ingestion clients."""
+    settings = get_settings()
+    return httpx.AsyncClient(
+        limits=build_limits(),
+        timeout=settings.http_timeout,
+        headers={"Accept-Encoding": accept_encoding()},
+        http2=settings.http2 and http2_available(),
+    )
@@ -2,24 +2,104 @@
 
 import httpx
 from credit_markets.config.settings import get_settings
-from credit_markets.utils.retry import retry
+from credit_markets.ingestion.cache import HTTPCache
+from credit_markets.ingestion.http import build_client, get_rate_limiter
+from credit_markets.observability.metrics import count_retry
+from credit_markets.utils import serialization
+from credit_markets.utils.retry import retry, async_retry
 
 class SECClient:
-    def __init__(self):
+    def __init__(self, http: httpx.Client = None, cache: HTTPCache = None):
         settings = get_settings()
         self.user_agent = settings.sec_user_agent
-        self.base_url = "https://data.sec.gov"
+        self.base_url = settings.sec_base_url
         self.headers = {"User-Agent": self.user_agent}
+        self._owns_http = http is None
+        self.http = http or build_client()
+        self.cache = cache
+        self.rate_limiter = get_rate_limiter("sec")
 
-    @retry(max_attempts=3, base_delay=1.0, exceptions=(httpx.HTTPError,))
+    def close(self) -> None:
+        """Close the HTTP session if this client created it."""
+        if self._owns_http:
+            self.http.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @retry(max_attempts=3, base_delay=1.0, exceptions=(httpx.HTTPError,), on_retry=count_retry)
     def get_company_filings(self, cik: str) -> dict:
         cik_padded = cik.zfill(10)
         url = f"{self.base_url}/submissions/CIK{cik_padded}.json"
-        response = httpx.get(url, headers=self.headers)
-        return response.json()
+        self.rate_limiter.wait()
+        response = self.http.get(url, headers=self.headers)
+        response.raise_for_status()
+        return serialization.loads(response.content)
+
+    @retry(max_attempts=3, base_delay=1.0, exceptions=(httpx.HTTPError,), on_retry=count_retry)
+    def get_company_filings_if_changed(self, cik: str) -> tuple:
+        """Conditional get_company_filings through the HTTP cache.
+
+        Returns:
+            (data, changed) tuple; changed is always True without a cache
+        """
+        url = f"{self.base_url}/submissions/CIK{cik.zfill(10)}.json"
+        if self.cache is None:
+            self.rate_limiter.wait()
+            response = self.http.get(url, headers=self.headers)
+            response.raise_for_status()
+            return serialization.loads(response.content), True
+        self.rate_limiter.wait()
+        return self.cache.get(self.http, url, headers=self.headers)
+
+    def mark_loaded(self, cik: str) -> None:
+        """Let the HTTP cache send validators for this company once its filings are in silver."""
+        if self.cache is not None:
+            self.cache.mark_loaded(f"{self.base_url}/submissions/CIK{cik.zfill(10)}.json")
+
+class AsyncSECClient:
+    """Async SEC client that issues requests through a shared httpx.AsyncClient."""
+
+    def __init__(self, http: httpx.AsyncClient, cache: HTTPCache = None):
+        settings = get_settings()
+        self.user_agent = settings.sec_user_agent
+        self.base_url = settings.sec_base_url
+        self.headers = {"User-Agent": self.user_agent}
+        self.http = http
+        self.cache = cache
+        self.rate_limiter = get_rate_limiter("sec")
+
+    @async_retry(max_attempts=3, base_delay=1.0, exceptions=(httpx.HTTPError,), on_retry=count_retry)
+    async def get_company_filings(self, cik: str) -> dict:
+        cik_padded = cik.zfill(10)
+        url = f"{self.base_url}/submissions/CIK{cik_padded}.json"
+        await self.rate_limiter.wait_async()
+        response = await self.http.get(url, headers=self.headers)
+        response.raise_for_status()
+        return serialization.loads(response.content)
+
+    @async_retry(max_attempts=3, base_delay=1.0, exceptions=(httpx.HTTPError,), on_retry=count_retry)
+    async def get_company_filings_if_changed(self, cik: str) -> tuple:
+        """Conditional get_company_filings through the HTTP cache; returns (data, changed)."""
+        url = f"{self.base_url}/submissions/CIK{cik.zfill(10)}.json"
+        if self.cache is None:
+            await self.rate_limiter.wait_async()
+            response = await self.http.get(url, headers=self.headers)
+            response.raise_for_status()
+            return serialization.loads(response.content), True
+        await self.rate_limiter.wait_async()
+        return await self.cache.aget(self.http, url, headers=self.headers)
+
+    def mark_loaded(self, cik: str) -> None:
+        """Let the HTTP cache send validators for this company once its filings are in silver."""
+        if self.cache is not None:
+            self.cache.mark_loaded(f"{self.base_url}/submissions/CIK{cik.zfill(10)}.json")
 
 if __name__ == "__main__":
-    client = SECClient()
-    data = client.get_company_filings("320193")
+    with SECClient() as client:
+        data = client.get_company_filings("320193")
     print(f"Company: {data.get('name')}")
     print(f"Recent filings: {len(data.get('filings', {}).get('recent', {}).get('form'))}")
\ No newline at end of file
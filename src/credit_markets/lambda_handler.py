@@ -1,8 +1,62 @@
 #Lambda Handler
 
-from credit_markets.pipeline.daily import DailyPipeline
 from datetime import date, datetime
 import json
+import time
+from credit_markets.observability.logging import flush_logging, get_logger
+
+# Reused across warm invocations of the same container: the HTTP session,
+# boto3 client and Postgres pool survive between calls. Pooled connections
+# are health-checked on checkout, so ones that went stale while the
+# container was frozen are replaced transparently.
+_pipeline = None
+
+# Largest share of the remaining time deadline_margin_seconds may reserve, so
+# an invocation with less time left than the margin still makes progress
+MAX_MARGIN_FRACTION = 0.5
+
+
+def get_pipeline():
+    """The container's DailyPipeline, created on first use."""
+    global _pipeline
+    if _pipeline is None:
+        # Deferred so importing the handler module does not load the client libraries
+        from credit_markets.pipeline.daily import DailyPipeline
+
+        _pipeline = DailyPipeline()
+    return _pipeline
+
+
+def reset_pipeline() -> None:
+    """Drop the cached pipeline and its connections so the next call reconnects."""
+    global _pipeline
+    if _pipeline is not None:
+        from credit_markets.storage.postgres import close_pools
+
+        _pipeline.close()
+        close_pools()
+        _pipeline = None
+
+
+def run_deadline(context, margin: float):
+    """time.monotonic() value to stop starting new work at, or None without a Lambda context.
+
+    The margin is capped at MAX_MARGIN_FRACTION of the remaining time;
+    otherwise a margin at least as long as the timeout would start nothing
+    and every resume event would come back with the same work pending.
+    """
+    if context is None or not hasattr(context, "get_remaining_time_in_millis"):
+        return None
+    remaining = context.get_remaining_time_in_millis() / 1000
+    if margin > remaining * MAX_MARGIN_FRACTION:
+        get_logger("credit_markets.lambda").error(
+            f"deadline_margin_seconds={margin} leaves no time to run with {remaining:.1f}s remaining; "
+            f"using {remaining * MAX_MARGIN_FRACTION:.1f}s. Raise the function timeout or lower the margin."
+        )
+        margin = remaining * MAX_MARGIN_FRACTION
+    return time.monotonic() + remaining - margin
+
+
 
 def handler(event, context):
     """    AWS Lambda entry point.
@@ -10,13 +64,18 @@ def handler(event, context):
     Args:
         event: Dict containing input data (from EventBridge, API Gateway, etc.)
                Example: {"target_date": "2026-01-26"} or {} for today
+               Pass {"full_refresh": true} to re-fetch full FRED history
+               Pass {"series": [...], "ciks": [...]} to run only those entities
         
         context: Lambda runtime info (request ID, time remaining, memory limit)
-                 You rarely use this directly, but it's always passed
+                 get_remaining_time_in_millis() sets the run's deadline,
+                 deadline_margin_seconds before the timeout
     
     Returns:
         Dict with statusCode and body (API Gateway format)
         Example: {"statusCode": 200, "body": '{"fred_rows": 100}'}
+        If the invocation ran out of time, the body has "complete": false and
+        a "resume" event that finishes the remaining entities when re-sent.
     """
 
     target_date = event.get("target_date")
@@ -26,15 +85,31 @@ def handler(event, context):
         target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
     
     try:
-        pipeline = DailyPipeline()
-        results = pipeline.run(target_date)
+        pipeline = get_pipeline()
+        results = pipeline.run(
+            target_date,
+            full_refresh=event.get("full_refresh", False),
+            deadline=run_deadline(context, pipeline.settings.deadline_margin_seconds),
+            series=event.get("series"),
+            ciks=event.get("ciks"),
+        )
+        if not results["complete"]:
+            results["resume"] = {
+                **event,
+                "target_date": str(target_date),
+                **results["pending"],
+            }
 
         return {
             "statusCode": 200,
             "body": json.dumps(results)
         }
     except Exception as e:
+        reset_pipeline()
         return {
             "statusCode": 500,
             "body": json.dumps({"error": str(e)})
         }
+    finally:
+        # The container may be frozen as soon as we return; write queued logs first
+        flush_logging()
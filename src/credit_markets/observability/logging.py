@@ -1,30 +1,214 @@
 # Structured Logging Configuration
 
+import atexit
+import copy
 import logging
-import json
-from datetime import datetime
+import queue
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from credit_markets.utils import serialization
+
+# Attributes every LogRecord has; anything else on a record came from `extra`
+_RECORD_ATTRS = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime", "context"}
+
+_context = ContextVar("log_context", default=None)
+
+_listener = None
+_configure_lock = threading.Lock()
+
+
+@contextmanager
+def log_context(**fields):
+    """Add fields (run_id, source, entity, ...) to every record logged in this block.
+
+    Context is per thread / asyncio task; utils.parallel and StagedPipeline
+    copy it into their worker threads. None values are ignored.
+    """
+    token = _context.set({**current_log_context(), **{k: v for k, v in fields.items() if v is not None}})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+def current_log_context() -> dict:
+    return _context.get() or {}
+
 
 class JSONFormatter(logging.Formatter):
     def format(self, record):
         log_obj = {
-            "timestamp": datetime.utcnow().isoformat(),
+            # record.created is already taken by logging; no second clock read
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "message": record.getMessage(),
             "module": record.module,
         }
 
-        if hasattr(record, "extra"):
-            log_obj.update(record.extra)
-        
-        return json.dumps(log_obj)
+        log_obj.update(getattr(record, "context", None) or current_log_context())
+        log_obj.update({k: v for k, v in record.__dict__.items() if k not in _RECORD_ATTRS})
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_obj["exception"] = record.exc_text
+
+        return serialization.dumps(log_obj, default=str).decode("utf-8")
+
+
+class ContextFilter(logging.Filter):
+    """Capture the caller's log_context on the record before it changes threads."""
+
+    def filter(self, record):
+        record.context = current_log_context()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Sample and rate-limit records below INFO (per-item debug logs).
+
+    Each DEBUG record passes with probability `sample_rate`, and at most
+    `max_per_second` records pass per call site (file and line) per second.
+    INFO and above always pass.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, max_per_second: float = None):
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.max_per_second = max_per_second
+        self.lock = threading.Lock()
+        self.windows = {}  # (pathname, lineno) -> (window_start, count)
+        self.dropped = 0
+
+    def filter(self, record):
+        if record.levelno >= logging.INFO:
+            return True
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            self._drop()
+            return False
+        if self.max_per_second is None:
+            return True
+
+        site = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self.lock:
+            start, count = self.windows.get(site, (now, 0))
+            if now - start >= 1.0:
+                start, count = now, 0
+            if count >= self.max_per_second:
+                self.dropped += 1
+                return False
+            self.windows[site] = (start, count + 1)
+        return True
+
+    def _drop(self):
+        with self.lock:
+            self.dropped += 1
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # The JSON formatter runs in the listener thread; only merge args here
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(
+    level: str = "INFO",
+    queue_size: int = 10_000,
+    debug_sample_rate: float = 1.0,
+    debug_max_per_second: float = None,
+    stream=None,
+) -> QueueListener:
+    """Route the credit_markets loggers through a queue to a background writer.
+
+    Calling threads only capture context and enqueue the record; JSON
+    encoding and the stream write happen on the listener thread. Replaces
+    any previous configuration.
+    """
+    global _listener
+    with _configure_lock:
+        root = logging.getLogger("credit_markets")
+        if _listener is not None:
+            _listener.stop()
+        for handler in list(root.handlers):
+            if isinstance(handler, NonBlockingQueueHandler):
+                root.removeHandler(handler)
+
+        writer = logging.StreamHandler(stream or sys.stderr)
+        writer.setFormatter(JSONFormatter())
+
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=queue_size))
+        handler.addFilter(SamplingFilter(debug_sample_rate, debug_max_per_second))
+        handler.addFilter(ContextFilter())
+
+        root.addHandler(handler)
+        root.setLevel(level)
+
+        _listener = QueueListener(handler.queue, writer, respect_handler_level=True)
+        _listener.start()
+        return _listener
+
+
+def flush_logging() -> None:
+    """Block until every queued record has been written (e.g. before a Lambda freeze)."""
+    if _listener is not None:
+        _listener.queue.join()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background writer."""
+    global _listener
+    with _configure_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+def _configure_from_settings() -> None:
+    from credit_markets.config.settings import get_settings
+
+    try:
+        settings = get_settings()
+    except ValueError:
+        # Invalid or missing settings must not stop the error from being logged
+        configure_logging()
+        return
+    configure_logging(
+        level=settings.log_level,
+        queue_size=settings.log_queue_size,
+        debug_sample_rate=settings.log_debug_sample_rate,
+        debug_max_per_second=settings.log_debug_max_per_second,
+    )
+
 
 def get_logger(name: str) -> logging.Logger:
-    logger = logging.getLogger(name)
-
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        handler.setFormatter(JSONFormatter())
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-        
-    return logger
\ No newline at end of file
+    """Logger under the credit_markets hierarchy, configuring logging on first use."""
+    if _listener is None:
+        _configure_from_settings()
+    return logging.getLogger(name)
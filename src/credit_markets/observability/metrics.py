@@ -0,0 +1,137 @@
+# Prometheus Metrics
+
+import logging
+import time
+from contextlib import contextmanager
+from credit_markets.config.settings import get_settings
+from credit_markets.observability.tracing import span
+
+try:
+    from prometheus_client import CollectorRegistry, Counter, Histogram, push_to_gateway, write_to_textfile
+except ImportError:  # metrics become no-ops; pip install prometheus-client to record them
+    CollectorRegistry = None
+
+logger = logging.getLogger(__name__)
+
+
+class _NoopMetric:
+    """Accepts the Counter/Histogram calls used here and discards them."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def labels(self, *_values):
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def observe(self, amount: float) -> None:
+        pass
+
+
+if CollectorRegistry is None:
+    Counter = Histogram = _NoopMetric
+    REGISTRY = None
+else:
+    # Own registry so exports contain pipeline metrics only, not process/GC collectors
+    REGISTRY = CollectorRegistry()
+
+# Labels are bounded (source, stage, api); series / CIK go on spans instead,
+# since one label value per entity would create thousands of time series.
+STAGE_SECONDS = Histogram(
+    "credit_markets_stage_seconds",
+    "Time spent per item in a pipeline stage (fetch, bronze, silver)",
+    ["source", "stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+    registry=REGISTRY,
+)
+STAGE_FAILURES = Counter(
+    "credit_markets_stage_failures_total",
+    "Items that failed in a pipeline stage",
+    ["source", "stage"],
+    registry=REGISTRY,
+)
+RETRIES = Counter(
+    "credit_markets_retries_total",
+    "Retried calls, by function",
+    ["function"],
+    registry=REGISTRY,
+)
+RATE_LIMIT_WAIT = Counter(
+    "credit_markets_rate_limiter_wait_seconds_total",
+    "Time callers were delayed by an API's rate limiter",
+    ["api"],
+    registry=REGISTRY,
+)
+ROWS = Counter(
+    "credit_markets_rows_total",
+    "Silver rows by action (inserted / updated / quarantined)",
+    ["source", "action"],
+    registry=REGISTRY,
+)
+
+
+@contextmanager
+def observe(source: str, stage: str, entities: list = None):
+    """Trace and time one unit of stage work.
+
+    Opens a "{source}.{stage}" span carrying the entity id (or ids, for a
+    batch), observes STAGE_SECONDS and counts failures.
+    """
+    entities = [str(entity) for entity in entities or [] if entity is not None]
+    attributes = {"source": source, "stage": stage}
+    if len(entities) == 1:
+        attributes["entity_id"] = entities[0]
+    elif entities:
+        attributes["entity_ids"] = entities
+        attributes["batch_size"] = len(entities)
+
+    start = time.perf_counter()
+    with span(f"{source}.{stage}", **attributes) as current:
+        try:
+            yield current
+        except Exception:
+            STAGE_FAILURES.labels(source, stage).inc()
+            raise
+        finally:
+            STAGE_SECONDS.labels(source, stage).observe(time.perf_counter() - start)
+
+
+def count_retry(function: str, _attempt: int, _error: Exception) -> None:
+    """on_retry hook for utils.retry decorators."""
+    RETRIES.labels(function).inc()
+
+
+def rate_limit_observer(api: str):
+    """RateLimiter on_throttle hook accumulating wait time per API."""
+    return lambda delay: RATE_LIMIT_WAIT.labels(api).inc(delay)
+
+
+def record_rows(source: str, counts: dict) -> None:
+    """Count inserted/updated/quarantined rows from a transformer load."""
+    for action in ("inserted", "updated", "quarantined"):
+        ROWS.labels(source, action).inc(counts.get(action, 0))
+
+
+def export_metrics() -> None:
+    """Write metrics to the textfile collector and/or push them to a Pushgateway.
+
+    Both targets are optional (metrics_textfile, metrics_pushgateway). An
+    export failure is logged and never fails the run.
+    """
+    settings = get_settings()
+    if REGISTRY is None:
+        if settings.metrics_textfile or settings.metrics_pushgateway:
+            logger.warning("Metrics export configured but prometheus-client is not installed")
+        return
+    if settings.metrics_textfile:
+        try:
+            write_to_textfile(settings.metrics_textfile, REGISTRY)
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {settings.metrics_textfile}: {e}")
+    if settings.metrics_pushgateway:
+        try:
+            push_to_gateway(settings.metrics_pushgateway, job=settings.metrics_job, registry=REGISTRY)
+        except OSError as e:
+            logger.warning(f"Could not push metrics to {settings.metrics_pushgateway}: {e}")
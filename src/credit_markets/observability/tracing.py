@@ -0,0 +1,82 @@
+# OpenTelemetry Tracing
+
+import atexit
+from contextlib import contextmanager
+from threading import Lock
+from credit_markets.config.settings import get_settings
+
+try:
+    from opentelemetry import trace
+except ImportError:  # spans become no-ops; pip install opentelemetry-api to record them
+    trace = None
+
+_tracer = None
+_tracer_lock = Lock()
+_provider = None
+_trace_out = None
+
+
+def configure_tracing() -> None:
+    """Install an SDK tracer provider when trace_exporter is set.
+
+    "console" writes each finished span as JSON to trace_file (or stdout),
+    which works without a collector. Otherwise the API's no-op provider, or
+    whatever provider the host process configured, is left in place.
+    """
+    global _provider, _trace_out
+    settings = get_settings()
+    if settings.trace_exporter == "none" or trace is None:
+        return
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+    _trace_out = open(settings.trace_file, "a") if settings.trace_file else None  # noqa: SIM115
+    exporter = ConsoleSpanExporter(out=_trace_out) if _trace_out else ConsoleSpanExporter()
+    _provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.metrics_job}),
+        shutdown_on_exit=False,
+    )
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(_provider)
+
+
+def get_tracer():
+    """The credit_markets tracer, or None without opentelemetry installed."""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None and trace is not None:
+            configure_tracing()
+            _tracer = trace.get_tracer("credit_markets")
+        return _tracer
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Start a span as the current span; None-valued attributes are dropped.
+
+    Exceptions are recorded on the span and re-raised.
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        yield None
+        return
+    attributes = {k: v for k, v in attributes.items() if v is not None}
+    with tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans, stop the tracer provider and close trace_file."""
+    global _provider, _trace_out
+    with _tracer_lock:
+        if _provider is not None:
+            _provider.shutdown()
+            _provider = None
+        if _trace_out is not None:
+            _trace_out.close()
+            _trace_out = None
+
+
+atexit.register(shutdown_tracing)
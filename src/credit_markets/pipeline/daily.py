@@ -1,70 +1,558 @@
 # Daily Pipeline Orchestrator
 
-from datetime import datetime, date
-from credit_markets.ingestion.fred import FREDClient
-from credit_markets.ingestion.sec import SECClient
-from credit_markets.storage.s3 import S3Client
-from credit_markets.storage.postgres import PostgresClient
-from credit_markets.transform.fred import FREDTransformer
-from credit_markets.transform.sec import SECTransformer
-from credit_markets.observability.logging import get_logger
-from credit_markets.utils.parallel import parallel_map
+import asyncio
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import date, timedelta
+from functools import cached_property, wraps
+from credit_markets.config.settings import get_settings
+from credit_markets.observability.logging import current_log_context, get_logger, log_context
+from credit_markets.pipeline.stages import Stage, StagedPipeline
+from credit_markets.utils.parallel import ItemError, async_parallel_map
+
+# Client modules pull in httpx, boto3, psycopg2 and pyarrow, so they are
+# imported by the properties that build them rather than at module load.
+
+def sum_counts(counts_list) -> dict:
+    """Add up the inserted/updated/quarantined counts returned by the transformers."""
+    totals = {"inserted": 0, "updated": 0, "quarantined": 0}
+    for counts in counts_list:
+        totals["inserted"] += counts["inserted"]
+        totals["updated"] += counts["updated"]
+        totals["quarantined"] += counts.get("quarantined", 0)
+    return totals
+
+def failed_keys(staged_run: dict) -> list:
+    """Entities that failed in any stage of a StagedPipeline run."""
+    return sorted({str(key) for _, key, _ in staged_run["failed"] if key is not None})
+
+def until_deadline(keys: list, deadline: float = None, pending: list = None):
+    """Yield (key, None) stage inputs until the time.monotonic() deadline passes.
+
+    Keys that were not handed out are appended to `pending`.
+    """
+    for i, key in enumerate(keys):
+        if deadline is not None and time.monotonic() >= deadline:
+            pending.extend(keys[i:])
+            return
+        yield key, None
+
+def run_context(method):
+    """Run a pipeline method inside a log_context with a fresh run_id."""
+    if asyncio.iscoroutinefunction(method):
+        @wraps(method)
+        async def async_wrapper(self, target_date, *args, **kwargs):
+            with log_context(run_id=uuid.uuid4().hex, run_date=str(target_date)):
+                return await method(self, target_date, *args, **kwargs)
+        return async_wrapper
+
+    @wraps(method)
+    def wrapper(self, target_date, *args, **kwargs):
+        with log_context(run_id=uuid.uuid4().hex, run_date=str(target_date)):
+            return method(self, target_date, *args, **kwargs)
+    return wrapper
+
+@contextmanager
+def observe_stage(source: str, stage: str, keys: list):
+    """Trace/time one stage call and tag its log records with source, stage and entity."""
+    from credit_markets.observability.metrics import observe
+
+    entity = keys[0] if len(keys) == 1 else None
+    with log_context(source=source, stage=stage, entity=entity), observe(source, stage, keys):
+        yield
 
 class DailyPipeline:
+    """Fetch FRED and SEC data, write bronze to S3 and load silver into Postgres.
+
+    Clients are built on first use, so constructing the pipeline is cheap and
+    a run only pays for the clients it touches.
+    """
+
     def __init__(self):
         self.logger = get_logger("credit_markets.pipeline")
-        self.fred = FREDClient()
-        self.sec = SECClient()
-        self.s3 = S3Client()
-        self.postgres = PostgresClient()
-        self.fred_transformer = FREDTransformer()
-        self.sec_transformer = SECTransformer()
-
-    def run(self, target_date: date) -> dict:
-        results = {"date": str(target_date), "fred": {}, "sec": {}}
-        self.logger.info(f"Starting pipeline for {target_date}")
+        self.settings = get_settings()
+
+    @cached_property
+    def http(self):
+        from credit_markets.ingestion.http import build_client
+
+        return build_client()
+
+    @cached_property
+    def http_cache(self):
+        from credit_markets.ingestion.cache import get_http_cache
+
+        return get_http_cache()
+
+    @cached_property
+    def fred(self):
+        from credit_markets.ingestion.fred import FREDClient
+
+        return FREDClient(self.http, cache=self.http_cache)
+
+    @cached_property
+    def sec(self):
+        from credit_markets.ingestion.sec import SECClient
+
+        return SECClient(self.http, cache=self.http_cache)
+
+    @cached_property
+    def s3(self):
+        from credit_markets.storage.s3 import S3Client
+
+        return S3Client()
+
+    @cached_property
+    def postgres(self):
+        from credit_markets.storage.postgres import PostgresClient
+
+        return PostgresClient()
+
+    @cached_property
+    def fred_transformer(self):
+        from credit_markets.transform.fred import FREDTransformer
+
+        return FREDTransformer(self.postgres, quarantine=self.quarantine)
+
+    @cached_property
+    def sec_transformer(self):
+        from credit_markets.transform.sec import SECTransformer
+
+        return SECTransformer(self.postgres, quarantine=self.quarantine)
+
+    @cached_property
+    def quarantine(self):
+        """Sink for batches that fail the in-flight checks, or None when disabled."""
+        if not self.settings.quarantine_enabled:
+            return None
+        from credit_markets.quality.inflight import Quarantine
+
+        return Quarantine(self.s3, prefix=self.settings.quarantine_prefix)
+
+    @cached_property
+    def manifest(self):
+        from credit_markets.storage.manifest import BronzeManifest
+
+        return BronzeManifest(self.postgres)
+
+    @cached_property
+    def columnar(self):
+        """ColumnarWriter, or None when columnar_format is "none"."""
+        if self.settings.columnar_format == "none":
+            return None
+        from credit_markets.storage.columnar import ColumnarWriter
+
+        return ColumnarWriter()
+
+    def close(self) -> None:
+        """Release the shared HTTP session, if one was opened."""
+        if "http" in self.__dict__:
+            self.http.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write_columnar(self, source: str, data, target_date: date) -> int:
+        """Write parsed rows or an Arrow table to the columnar dataset for `source`, partitioned by run date."""
+        from credit_markets.storage.columnar import fred_table, sec_table
+
+        if isinstance(data, list):
+            data = fred_table(data) if source == "fred" else sec_table(data)
+        return self.columnar.write(source, data, target_date)
+
+    def dedup_state(self, source: str, full_refresh: bool = False):
+        """Manifest entries to compare payloads against, or None when dedup is off.
+
+        A full refresh compares against nothing but still records new digests.
+        """
+        if self.settings.bronze_dedup == "off":
+            return None
+        return {} if full_refresh else self.manifest.load(source)
+
+    def write_bronze(self, source: str, entity_id: str, data: dict, key: str, known) -> tuple:
+        """Write a payload to bronze unless the manifest already holds its digest.
+
+        Returns:
+            Manifest entry (entity_id, digest, bronze_key), or None when the
+            payload is unchanged and its silver load can be skipped
+        """
+        from credit_markets.storage.manifest import content_digest
+
+        write_json = self.settings.write_bronze_json
+        digest = None
+        if known is not None:
+            digest = content_digest(source, data)
+            previous = known.get(entity_id)
+            if previous and previous[0] == digest:
+                if self.settings.bronze_dedup == "pointer" and write_json and previous[1]:
+                    self.s3.write_json({"bronze_pointer": previous[1], "content_hash": digest}, key)
+                return None
+        if write_json:
+            self.s3.write_json(data, key)
+        return (entity_id, digest, key if write_json else None)
+
+    def record_manifest(self, source: str, known, entries: list, target_date: date) -> None:
+        if known is not None:
+            self.manifest.record(source, entries, target_date)
+
+    def staged(self, source: str, stages: list) -> StagedPipeline:
+        """StagedPipeline whose stage calls are traced, timed and log-tagged under `source`."""
+        return StagedPipeline(
+            stages,
+            queue_size=self.settings.stage_queue_size,
+            observer=lambda stage, keys: observe_stage(source, stage, keys),
+        )
 
+    def item_failures(self, source: str, results: list) -> list:
+        """Log and return the keys of async_parallel_map results that are ItemErrors."""
+        failed = []
+        for key, value in results:
+            if isinstance(value, ItemError):
+                self.logger.error(f"{source} {key} failed: {value.exception}")
+                failed.append(str(key))
+        return failed
+
+    def active_series(self) -> list:
         rows = self.postgres.fetch_all(
             "SELECT series_id FROM reference.fred_series WHERE is_active = TRUE"
         )
-        series_list = [row[0] for row in rows]
-        total_fred_rows = 0
+        return [row[0] for row in rows]
+
+    def active_ciks(self) -> list:
+        rows = self.postgres.fetch_all(
+            "SELECT cik FROM reference.sec_companies WHERE is_active = TRUE"
+        )
+        return [row[0] for row in rows]
+
+    def fred_start_dates(self, series_list: list, full_refresh: bool = False) -> dict:
+        """observation_start per series: watermark minus look-back, or None for full history."""
+        if full_refresh or not self.settings.fred_incremental:
+            return {}
+        lookback = timedelta(days=self.settings.fred_lookback_days)
+        watermarks = self.fred_transformer.get_watermarks(series_list)
+        return {series_id: watermark - lookback for series_id, watermark in watermarks.items()}
+
+    @run_context
+    def run(
+        self,
+        target_date: date,
+        full_refresh: bool = False,
+        deadline: float = None,
+        series: list = None,
+        ciks: list = None,
+    ) -> dict:
+        """Run fetch -> bronze write -> silver load as independent stages.
+
+        Each stage has its own threads (fetch_workers, bronze_workers,
+        silver_workers) and hands items on through bounded queues, so the
+        rate-limited fetchers stay busy while S3 and Postgres keep up.
+
+        Args:
+            target_date: Run date, used for the bronze keys
+            full_refresh: Fetch full FRED history instead of incrementally
+            deadline: time.monotonic() value after which no new entity is
+                started; entities already in flight are finished
+            series: FRED series to run instead of all active ones
+            ciks: SEC companies to run instead of all active ones
+
+        Returns:
+            Results dict. If the deadline cut the run short, "complete" is
+            False and "pending" lists the series / CIKs that were not started
+            (pass them back as `series` / `ciks` to resume).
+        """
+        from credit_markets.ingestion.http import rate_limiter_stats
+        from credit_markets.observability.metrics import export_metrics, record_rows
+        from credit_markets.transform.fred import concat_observations
+
+        results = {"date": str(target_date), "run_id": current_log_context().get("run_id"), "fred": {}, "sec": {}}
+        self.logger.info(f"Starting pipeline for {target_date}")
 
-        def process_fred(series_id):
-            fred_data = self.fred.get_series(series_id)
-            s3_key = f"bronze/fred/{target_date}/{series_id}.json"
-            self.s3.write_json(fred_data, s3_key)
-            return self.fred_transformer.load_treasury_yields(fred_data, series_id)
+        series_list = self.active_series() if series is None else list(series)
+        start_dates = self.fred_start_dates(series_list, full_refresh)
+        fred_unchanged = []
+        fred_pending = []
+        fred_known = self.dedup_state("fred", full_refresh)
+        fred_deduplicated = []
+        fred_entries = []
 
-        fred_results = parallel_map(process_fred, series_list, max_workers=5, rate_limit=5.0)
-        total_fred_rows = sum(rows for _, rows in fred_results)
+        def fetch_fred(series_id, _):
+            fred_data, changed = self.fred.get_series_if_changed(
+                series_id, observation_start=start_dates.get(series_id)
+            )
+            if not changed:
+                fred_unchanged.append(series_id)
+                self.logger.debug("Series unchanged since last fetch")
+                return None
+            return fred_data
+
+        fred_columnar_tables = []
+
+        def write_fred(series_id, fred_data):
+            key = f"bronze/fred/{target_date}/{series_id}.json"
+            entry = self.write_bronze("fred", series_id, fred_data, key, fred_known)
+            if entry is None:
+                fred_deduplicated.append(series_id)
+                self.logger.debug("Payload matches manifest, skipping load")
+                self.fred.mark_loaded(series_id, observation_start=start_dates.get(series_id))
+                return None
+            return entry, self.fred_transformer.observations_table(fred_data, series_id)
+
+        def load_fred(series_id, value):
+            entry, table = value
+            # Only batches that passed the checks reach the columnar copy
+            counts = self.fred_transformer.load_observation_table(
+                table, loaded=fred_columnar_tables if self.columnar else None
+            )
+            if not counts.get("quarantined"):
+                # A quarantined payload is fetched and checked again next run
+                fred_entries.append(entry)
+                self.fred.mark_loaded(series_id, observation_start=start_dates.get(series_id))
+            self.logger.debug("Loaded observations", extra={"rows": table.num_rows, **counts})
+            return counts
+
+        fred_run = self.staged("fred", [
+            Stage("fetch", fetch_fred, workers=self.settings.fetch_workers),
+            Stage("bronze", write_fred, workers=self.settings.bronze_workers),
+            Stage("silver", load_fred, workers=self.settings.silver_workers),
+        ]).run(until_deadline(series_list, deadline, fred_pending))
+
+        fred_counts = sum_counts(fred_run["outputs"])
+        total_fred_rows = fred_counts["inserted"] + fred_counts["updated"]
+        self.record_manifest("fred", fred_known, fred_entries, target_date)
+        if self.columnar:
+            results["fred"]["columnar_rows"] = self.write_columnar(
+                "fred", concat_observations(fred_columnar_tables), target_date
+            )
 
         results["fred"]["series"] = series_list
+        results["fred"]["incremental_series"] = len(start_dates)
+        results["fred"]["unchanged"] = len(fred_unchanged)
+        results["fred"]["deduplicated"] = len(fred_deduplicated)
+        results["fred"]["failed"] = failed_keys(fred_run)
         results["fred"]["silver_rows"] = total_fred_rows
+        results["fred"].update(fred_counts)
+        results["fred"]["stages"] = fred_run["stages"]
+
+        cik_list = self.active_ciks() if ciks is None else list(ciks)
+        sec_unchanged = []
+        sec_pending = []
+        sec_known = self.dedup_state("sec", full_refresh)
+        sec_deduplicated = []
+        sec_entries = []
+        sec_quarantined = []
+
+        def fetch_sec(cik, _):
+            sec_data, changed = self.sec.get_company_filings_if_changed(cik)
+            if not changed:
+                sec_unchanged.append(cik)
+                self.logger.debug("Submissions unchanged since last fetch")
+                return None
+            return sec_data
+
+        def write_sec(cik, sec_data):
+            entry = self.write_bronze("sec", cik, sec_data, f"bronze/sec/{target_date}/{cik}.json", sec_known)
+            if entry is None:
+                sec_deduplicated.append(cik)
+                self.logger.debug("Payload matches manifest, skipping load")
+                self.sec.mark_loaded(cik)
+                return None
+            # Hand on only the parsed rows so the full payload can be freed
+            rows = self.sec_transformer.parse_filings(sec_data)
+            # Checked per company so one bad filing does not reject the whole load batch
+            rejected = self.sec_transformer.quarantine_if_invalid(rows)
+            if rejected:
+                sec_quarantined.append(rejected)
+                return None
+            return entry, rows
+
+        def load_sec(batch):
+            rows = [row for _, (_, rows) in batch for row in rows]
+            counts = self.sec_transformer.load_filing_rows(rows)
+            if self.columnar:
+                self.write_columnar("sec", rows, target_date)
+            sec_entries.extend(entry for _, (entry, _) in batch)
+            for cik, _ in batch:
+                self.sec.mark_loaded(cik)
+            self.logger.debug("Loaded filings", extra={"companies": len(batch), "rows": len(rows), **counts})
+            return counts
+
+        sec_run = self.staged("sec", [
+            Stage("fetch", fetch_sec, workers=self.settings.fetch_workers),
+            Stage("bronze", write_sec, workers=self.settings.bronze_workers),
+            Stage("silver", load_sec, workers=self.settings.silver_workers,
+                  batch_size=self.settings.sec_load_batch_size),
+        ]).run(until_deadline(cik_list, deadline, sec_pending))
+
+        sec_counts = sum_counts(sec_run["outputs"] + sec_quarantined)
+        total_sec_rows = sec_counts["inserted"] + sec_counts["updated"]
+        self.record_manifest("sec", sec_known, sec_entries, target_date)
 
-        company_rows = self.postgres.fetch_all(
-            "SELECT cik FROM reference.sec_companies WHERE is_active = TRUE"
-        )
-        cik_list = [row[0] for row in company_rows]
-        total_sec_rows = 0
-
-        def process_sec(cik):
-            sec_data = self.sec.get_company_filings(cik)
-            sec_key = f"bronze/sec/{target_date}/{cik}.json"
-            self.s3.write_json(sec_data, sec_key)
-            return self.sec_transformer.load_filings(sec_data)
-
-        sec_results = parallel_map(process_sec, cik_list, max_workers=5, rate_limit=5.0)
-        total_sec_rows = sum(rows for _, rows in sec_results)
-        
         results["sec"]["companies"] = len(cik_list)
+        results["sec"]["unchanged"] = len(sec_unchanged)
+        results["sec"]["deduplicated"] = len(sec_deduplicated)
+        results["sec"]["failed"] = failed_keys(sec_run)
         results["sec"]["silver_rows"] = total_sec_rows
+        results["sec"].update(sec_counts)
+        results["sec"]["stages"] = sec_run["stages"]
+        results["postgres_pool"] = self.postgres.pool.stats()
+        results["rate_limiters"] = rate_limiter_stats()
+        results["complete"] = not (fred_pending or sec_pending)
+        if not results["complete"]:
+            results["pending"] = {"series": fred_pending, "ciks": sec_pending}
+            self.logger.warning(
+                f"Deadline reached: {len(fred_pending)} series and {len(sec_pending)} companies not started"
+            )
+
+        record_rows("fred", fred_counts)
+        record_rows("sec", sec_counts)
+        export_metrics()
 
         self.logger.info(f"Pipeline complete: {total_fred_rows} FRED rows, {total_sec_rows} SEC rows")
 
         return results
 
+    @run_context
+    async def run_async(self, target_date: date, full_refresh: bool = False) -> dict:
+        """Same as run(), but drives API fetches from one event loop.
+
+        Up to async_max_in_flight requests share one keep-alive connection pool
+        under the same rate limits as run(); S3 writes and Postgres loads are
+        blocking and run in worker threads.
+        """
+        from credit_markets.ingestion.fred import AsyncFREDClient
+        from credit_markets.ingestion.http import build_async_client, rate_limiter_stats
+        from credit_markets.observability.metrics import export_metrics, record_rows
+        from credit_markets.ingestion.sec import AsyncSECClient
+
+        results = {"date": str(target_date), "run_id": current_log_context().get("run_id"), "fred": {}, "sec": {}}
+        self.logger.info(f"Starting async pipeline for {target_date}")
+        max_in_flight = self.settings.async_max_in_flight
+
+        series_list = await asyncio.to_thread(self.active_series)
+        start_dates = await asyncio.to_thread(self.fred_start_dates, series_list, full_refresh)
+        cik_list = await asyncio.to_thread(self.active_ciks)
+        fred_known = await asyncio.to_thread(self.dedup_state, "fred", full_refresh)
+        sec_known = await asyncio.to_thread(self.dedup_state, "sec", full_refresh)
+        deduplicated = {"fred": 0, "sec": 0}
+        fred_entries = []
+        sec_entries = []
+
+        async with build_async_client() as http:
+            fred = AsyncFREDClient(http, cache=self.http_cache)
+            sec = AsyncSECClient(http, cache=self.http_cache)
+            fred_unchanged = []
+            sec_unchanged = []
+
+            async def process_fred(series_id):
+                with observe_stage("fred", "fetch", [series_id]):
+                    fred_data, changed = await fred.get_series_if_changed(
+                        series_id, observation_start=start_dates.get(series_id)
+                    )
+                if not changed:
+                    fred_unchanged.append(series_id)
+                    return {"inserted": 0, "updated": 0}
+                s3_key = f"bronze/fred/{target_date}/{series_id}.json"
+                with observe_stage("fred", "bronze", [series_id]):
+                    entry = await asyncio.to_thread(self.write_bronze, "fred", series_id, fred_data, s3_key, fred_known)
+                if entry is None:
+                    deduplicated["fred"] += 1
+                    fred.mark_loaded(series_id, observation_start=start_dates.get(series_id))
+                    return {"inserted": 0, "updated": 0}
+                with observe_stage("fred", "silver", [series_id]):
+                    counts = await asyncio.to_thread(self.fred_transformer.load_treasury_yields, fred_data, series_id)
+                if not counts.get("quarantined"):
+                    fred_entries.append(entry)
+                    fred.mark_loaded(series_id, observation_start=start_dates.get(series_id))
+                return counts
+
+            fred_results = await async_parallel_map(
+                process_fred, series_list, max_in_flight=max_in_flight, capture_errors=True
+            )
+            fred_failed = self.item_failures("fred", fred_results)
+
+            async def process_sec(cik):
+                with observe_stage("sec", "fetch", [cik]):
+                    sec_data, changed = await sec.get_company_filings_if_changed(cik)
+                if not changed:
+                    sec_unchanged.append(cik)
+                    return None, []
+                sec_key = f"bronze/sec/{target_date}/{cik}.json"
+                with observe_stage("sec", "bronze", [cik]):
+                    entry = await asyncio.to_thread(self.write_bronze, "sec", cik, sec_data, sec_key, sec_known)
+                if entry is None:
+                    deduplicated["sec"] += 1
+                    sec.mark_loaded(cik)
+                    return None, []
+                # Submissions documents can be several MB; parse off the event loop
+                rows = await asyncio.to_thread(self.sec_transformer.parse_filings, sec_data)
+                rejected = await asyncio.to_thread(self.sec_transformer.quarantine_if_invalid, rows)
+                if rejected:
+                    sec_counts_list.append(rejected)
+                    return None, []
+                return entry, rows
+
+            sec_counts_list = []
+            sec_failed = []
+            batch_size = max(self.settings.sec_load_batch_size, max_in_flight)
+            for start in range(0, len(cik_list), batch_size):
+                batch = cik_list[start:start + batch_size]
+                sec_results = await async_parallel_map(
+                    process_sec, batch, max_in_flight=max_in_flight, capture_errors=True
+                )
+                sec_failed.extend(self.item_failures("sec", sec_results))
+                sec_results = [(cik, value) for cik, value in sec_results if not isinstance(value, ItemError)]
+                batch_rows = [row for _, (_, rows) in sec_results for row in rows]
+                try:
+                    with observe_stage("sec", "silver", [cik for cik, _ in sec_results]):
+                        sec_counts_list.append(
+                            await asyncio.to_thread(self.sec_transformer.load_filing_rows, batch_rows)
+                        )
+                except Exception as e:
+                    self.logger.error(f"SEC load failed for {len(sec_results)} companies: {e}")
+                    sec_failed.extend(cik for cik, _ in sec_results)
+                    continue
+                sec_entries.extend(entry for _, (entry, _) in sec_results if entry is not None)
+                for cik, (entry, _) in sec_results:
+                    if entry is not None:
+                        sec.mark_loaded(cik)
+
+        await asyncio.to_thread(self.record_manifest, "fred", fred_known, fred_entries, target_date)
+        await asyncio.to_thread(self.record_manifest, "sec", sec_known, sec_entries, target_date)
+
+        fred_counts = sum_counts(counts for _, counts in fred_results if not isinstance(counts, ItemError))
+        sec_counts = sum_counts(sec_counts_list)
+        total_fred_rows = fred_counts["inserted"] + fred_counts["updated"]
+        total_sec_rows = sec_counts["inserted"] + sec_counts["updated"]
+
+        results["fred"]["series"] = series_list
+        results["fred"]["incremental_series"] = len(start_dates)
+        results["fred"]["unchanged"] = len(fred_unchanged)
+        results["fred"]["deduplicated"] = deduplicated["fred"]
+        results["fred"]["failed"] = sorted(fred_failed)
+        results["fred"]["silver_rows"] = total_fred_rows
+        results["fred"].update(fred_counts)
+        results["sec"]["companies"] = len(cik_list)
+        results["sec"]["unchanged"] = len(sec_unchanged)
+        results["sec"]["deduplicated"] = deduplicated["sec"]
+        results["sec"]["failed"] = sorted(sec_failed)
+        results["sec"]["silver_rows"] = total_sec_rows
+        results["sec"].update(sec_counts)
+        results["postgres_pool"] = self.postgres.pool.stats()
+        results["rate_limiters"] = rate_limiter_stats()
+
+        record_rows("fred", fred_counts)
+        record_rows("sec", sec_counts)
+        export_metrics()
+
+        self.logger.info(f"Async pipeline complete: {total_fred_rows} FRED rows, {total_sec_rows} SEC rows")
+
+        return results
+
 if __name__ == "__main__":
-    pipeline = DailyPipeline()
-    results = pipeline.run(date.today())
+    with DailyPipeline() as pipeline:
+        results = pipeline.run(date.today())
     print(f"Pipeline Completed: {results}")
\ No newline at end of file
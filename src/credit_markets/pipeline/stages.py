@@ -0,0 +1,217 @@
+# Staged Producer/Consumer Pipeline
+
+import contextvars
+import logging
+import queue
+import statistics
+import threading
+import time
+from contextlib import nullcontext
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class Stage:
+    """One step of a StagedPipeline, run by its own pool of worker threads.
+
+    `func(key, value)` receives the entity key and the previous stage's
+    output and returns the value handed to the next stage; returning None
+    drops the item. With `batch_size` > 1 the stage instead calls
+    `func(batch)` with a list of (key, value) pairs, flushing a partial batch
+    after `batch_timeout` seconds without new input.
+    """
+
+    def __init__(self, name: str, func, workers: int = 1, batch_size: int = 1, batch_timeout: float = 1.0):
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+
+
+class StageStats:
+    """Per-stage counters: throughput, latency, and time spent blocked."""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.items_in = 0
+        self.items_out = 0
+        self.failed = 0
+        self.latencies = []
+        self.idle_seconds = 0.0
+        self.blocked_seconds = 0.0
+
+    def record(self, items: int, latency: float, produced: int, failed: bool) -> None:
+        with self.lock:
+            self.items_in += items
+            self.items_out += produced
+            self.failed += items if failed else 0
+            self.latencies.append(latency)
+
+    def add_idle(self, seconds: float) -> None:
+        with self.lock:
+            self.idle_seconds += seconds
+
+    def add_blocked(self, seconds: float) -> None:
+        with self.lock:
+            self.blocked_seconds += seconds
+
+    def to_dict(self, elapsed: float) -> dict:
+        with self.lock:
+            latencies = sorted(self.latencies)
+            busy = sum(latencies)
+            return {
+                "workers": self.workers,
+                "items_in": self.items_in,
+                "items_out": self.items_out,
+                "failed": self.failed,
+                "items_per_second": round(self.items_in / elapsed, 2) if elapsed else 0.0,
+                "busy_seconds": round(busy, 3),
+                "utilization": round(busy / (elapsed * self.workers), 3) if elapsed else 0.0,
+                "idle_seconds": round(self.idle_seconds, 3),
+                "backpressure_seconds": round(self.blocked_seconds, 3),
+                "p50_seconds": round(statistics.median(latencies), 4) if latencies else 0.0,
+                "p99_seconds": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 4) if latencies else 0.0,
+            }
+
+
+class StagedPipeline:
+    """Run items through stages connected by bounded queues.
+
+    Every stage has its own worker threads, so a slow stage only holds up the
+    stages before it once the queue between them is full (backpressure),
+    instead of stalling every worker. Failures are recorded per item and do
+    not stop the pipeline. Outputs of the last stage are collected and
+    returned.
+
+    `observer(stage_name, keys)`, if given, returns a context manager that
+    wraps every call of a stage function (e.g. for tracing and metrics). An
+    observer that raises fails that call like the stage function would.
+    """
+
+    def __init__(self, stages: list, queue_size: int = 50, observer=None):
+        self.stages = stages
+        self.queue_size = queue_size
+        self.observer = observer
+
+    def run(self, items) -> dict:
+        """Feed (key, value) pairs through the stages.
+
+        Returns:
+            Dict with "outputs" of the last stage, "failed" [(stage, key, error)]
+            and per-stage "stages" stats
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        stats = [StageStats(stage.name, stage.workers) for stage in self.stages]
+        outputs = []
+        failed = []
+        failed_lock = threading.Lock()
+        remaining_workers = [stage.workers for stage in self.stages]
+        remaining_lock = threading.Lock()
+        start = time.monotonic()
+
+        def put(index: int, entry) -> None:
+            """Hand an entry to stage `index`, or collect it after the last stage."""
+            if index == len(self.stages):
+                outputs.append(entry[1])
+                return
+            wait_start = time.monotonic()
+            queues[index].put(entry)
+            if index > 0:
+                stats[index - 1].add_blocked(time.monotonic() - wait_start)
+
+        def worker_done(index: int) -> None:
+            with remaining_lock:
+                remaining_workers[index] -= 1
+                last = remaining_workers[index] == 0
+            if last and index + 1 < len(self.stages):
+                for _ in range(self.stages[index + 1].workers):
+                    queues[index + 1].put(_STOP)
+
+        def call(index: int, stage: Stage, entries: list) -> None:
+            call_start = time.monotonic()
+            try:
+                observed = self.observer(stage.name, [key for key, _ in entries]) if self.observer else nullcontext()
+                with observed:
+                    if stage.batch_size > 1:
+                        produced = [(None, stage.func(entries))]
+                    else:
+                        key, value = entries[0]
+                        produced = [(key, stage.func(key, value))]
+                produced = [entry for entry in produced if entry[1] is not None]
+                error = None
+            except Exception as e:
+                produced = []
+                error = e
+            stats[index].record(len(entries), time.monotonic() - call_start, len(produced), error is not None)
+
+            if error is not None:
+                with failed_lock:
+                    for key, _ in entries:
+                        failed.append((stage.name, key, error))
+                logger.error(f"Stage {stage.name} failed for {[key for key, _ in entries]}: {error}")
+            for entry in produced:
+                put(index + 1, entry)
+
+        def work(index: int) -> None:
+            stage = self.stages[index]
+            batch = []
+            while True:
+                wait_start = time.monotonic()
+                try:
+                    timeout = stage.batch_timeout if batch else None
+                    entry = queues[index].get(timeout=timeout)
+                except queue.Empty:
+                    stats[index].add_idle(time.monotonic() - wait_start)
+                    call(index, stage, batch)
+                    batch = []
+                    continue
+                stats[index].add_idle(time.monotonic() - wait_start)
+
+                if entry is _STOP:
+                    if batch:
+                        call(index, stage, batch)
+                    worker_done(index)
+                    return
+
+                batch.append(entry)
+                if len(batch) >= stage.batch_size:
+                    call(index, stage, batch)
+                    batch = []
+
+        threads = [
+            threading.Thread(
+                target=contextvars.copy_context().run, args=(work, index), name=f"stage-{stage.name}-{n}", daemon=True
+            )
+            for index, stage in enumerate(self.stages)
+            for n in range(stage.workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        # Feeding blocks once the first stage falls behind, so `items` can be lazy
+        input_blocked = 0.0
+        try:
+            for entry in items:
+                wait_start = time.monotonic()
+                queues[0].put(entry)
+                input_blocked += time.monotonic() - wait_start
+        finally:
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_STOP)
+
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.monotonic() - start
+        return {
+            "outputs": outputs,
+            "failed": failed,
+            "elapsed_seconds": round(elapsed, 3),
+            "input_backpressure_seconds": round(input_blocked, 3),
+            "stages": {s.name: s.to_dict(elapsed) for s in stats},
+        }
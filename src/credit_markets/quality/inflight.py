@@ -0,0 +1,147 @@
+# In-flight Data Quality Checks
+
+import logging
+import uuid
+from datetime import UTC, datetime
+import pyarrow as pa
+import pyarrow.compute as pc
+
+logger = logging.getLogger(__name__)
+
+# Same rules as create_fred_expectations(), which validates what landed in silver
+SERIES_ID_PATTERN = r"^[A-Z0-9]+$"
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+NUMERIC_PATTERN = r"^-?(\d+(\.\d*)?|\.\d+)$"
+ACCESSION_NUMBER_PATTERN = r"^\d{10}-\d{2}-\d{6}$"
+CIK_PATTERN = r"^\d{1,10}$"
+
+OBSERVATION_TYPES = {
+    "observation_date": pa.date32(),
+    "series_id": pa.string(),
+    "value": pa.float64(),
+}
+
+
+def count_not_matching(column, pattern: str) -> int:
+    """Non-null values of a string column that do not match `pattern`."""
+    matched = pc.sum(pc.match_substring_regex(column, pattern)).as_py() or 0
+    return len(column) - column.null_count - matched
+
+
+def failed_rules(counts: dict) -> dict:
+    return {rule: count for rule, count in counts.items() if count}
+
+
+def string_columns(rows: list, names: tuple) -> tuple:
+    """Rows as string arrays per column, plus a type failure per column that is not all strings."""
+    columns = {}
+    failures = {}
+    for name, values in zip(names, zip(*rows, strict=True), strict=True):
+        try:
+            columns[name] = pa.array(values, pa.string())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            failures[f"type:{name}"] = len(rows)
+    return columns, failures
+
+
+def check_observations(table) -> dict:
+    """Check a typed observations table/batch before it is loaded.
+
+    Returns:
+        {rule: failing row count}; empty when the batch is clean
+    """
+    missing = [name for name in OBSERVATION_TYPES if name not in table.schema.names]
+    if missing:
+        return {f"column_exists:{name}": table.num_rows for name in missing}
+
+    counts = {
+        f"type:{name}": table.num_rows
+        for name, expected in OBSERVATION_TYPES.items()
+        if table.schema.field(name).type != expected
+    }
+    if counts:
+        return counts
+
+    series_ids = table.column("series_id")
+    return failed_rules({
+        "not_null:series_id": series_ids.null_count,
+        "not_null:observation_date": table.column("observation_date").null_count,
+        # "." (missing) values are dropped when parsing, so a null here failed the numeric cast
+        "type:value": table.column("value").null_count,
+        "regex:series_id": count_not_matching(series_ids, SERIES_ID_PATTERN),
+    })
+
+
+def check_observation_rows(rows: list) -> dict:
+    """check_observations() for (observation_date, series_id, value) string rows."""
+    if not rows:
+        return {}
+    columns, failures = string_columns(rows, ("observation_date", "series_id", "value"))
+    if failures:
+        return failures
+
+    dates, series_ids, values = columns["observation_date"], columns["series_id"], columns["value"]
+    return failed_rules({
+        "not_null:series_id": series_ids.null_count,
+        "not_null:observation_date": dates.null_count,
+        "type:observation_date": count_not_matching(dates, DATE_PATTERN),
+        "type:value": values.null_count + count_not_matching(values, NUMERIC_PATTERN),
+        "regex:series_id": count_not_matching(series_ids, SERIES_ID_PATTERN),
+    })
+
+
+def check_filing_rows(rows: list) -> dict:
+    """Check parsed (accession_number, cik, company_name, filing_type, filing_date) rows."""
+    if not rows:
+        return {}
+    columns, failures = string_columns(
+        rows, ("accession_number", "cik", "company_name", "filing_type", "filing_date")
+    )
+    if failures:
+        return failures
+
+    accession_numbers, ciks, filing_dates = columns["accession_number"], columns["cik"], columns["filing_date"]
+    return failed_rules({
+        "not_null:accession_number": accession_numbers.null_count,
+        "not_null:cik": ciks.null_count,
+        "not_null:filing_date": filing_dates.null_count,
+        "regex:accession_number": count_not_matching(accession_numbers, ACCESSION_NUMBER_PATTERN),
+        "regex:cik": count_not_matching(ciks, CIK_PATTERN),
+        "type:filing_date": count_not_matching(filing_dates, DATE_PATTERN),
+    })
+
+
+class Quarantine:
+    """Write batches that failed in-flight checks to S3 instead of loading them.
+
+    Objects go to {prefix}/{source}/{YYYY-MM-DD}/{id}.json with the failed
+    rules and the rejected rows, so they can be inspected and replayed.
+    """
+
+    def __init__(self, s3, prefix: str = "quarantine"):
+        self.s3 = s3
+        self.prefix = prefix
+
+    def __call__(self, source: str, failures: dict, rows: list) -> str:
+        key = f"{self.prefix}/{source}/{datetime.now(UTC):%Y-%m-%d}/{uuid.uuid4().hex}.json"
+        self.s3.write_json({"source": source, "failures": failures, "rows": rows}, key)
+        return key
+
+
+def quarantine_batch(quarantine, source: str, failures: dict, rows: list) -> dict:
+    """Divert a failed batch to `quarantine` (or drop it when None) instead of raising.
+
+    Returns:
+        Load counts for the batch: nothing inserted or updated, all rows quarantined
+    """
+    key = None
+    if quarantine is not None:
+        try:
+            key = quarantine(source, failures, rows)
+        except Exception as e:
+            logger.error(f"Could not quarantine {source} batch: {e}")
+    logger.error(
+        f"Quarantined {len(rows)} {source} rows failing {sorted(failures)}",
+        extra={"failures": failures, "quarantine_key": key},
+    )
+    return {"inserted": 0, "updated": 0, "quarantined": len(rows)}
@@ -0,0 +1,172 @@
+# Columnar (Parquet / Delta) Storage
+
+import uuid
+from datetime import date
+from threading import Lock
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import fs
+from credit_markets.config.settings import get_settings
+
+FRED_SCHEMA = pa.schema([
+    ("observation_date", pa.date32()),
+    ("series_id", pa.string()),
+    ("value", pa.float64()),
+])
+
+SEC_SCHEMA = pa.schema([
+    ("accession_number", pa.string()),
+    ("cik", pa.string()),
+    ("company_name", pa.string()),
+    ("filing_type", pa.string()),
+    ("filing_date", pa.date32()),
+])
+
+# Partition columns are kept as ISO strings so range filters compare lexically
+PARTITIONING = ds.partitioning(pa.schema([("date", pa.string())]), flavor="hive")
+
+
+def fred_table(rows: list) -> pa.Table:
+    """Arrow table from parsed (observation_date, series_id, value) rows."""
+    dates, series_ids, values = (
+        (list(col) for col in zip(*rows, strict=True)) if rows else ([], [], [])
+    )
+    return pa.table({
+        "observation_date": pa.array(dates, pa.string()).cast(pa.date32()),
+        "series_id": pa.array(series_ids, pa.string()),
+        "value": pa.array(values, pa.string()).cast(pa.float64()),
+    }, schema=FRED_SCHEMA)
+
+
+def sec_table(rows: list) -> pa.Table:
+    """Arrow table from parsed silver.sec_filings rows."""
+    columns = [list(col) for col in zip(*rows, strict=True)] if rows else [[] for _ in SEC_SCHEMA]
+    arrays = [pa.array(values, pa.string()) for values in columns]
+    arrays[-1] = arrays[-1].cast(pa.date32())
+    return pa.Table.from_arrays(arrays, schema=SEC_SCHEMA)
+
+
+# One lock per dataset path: Delta appends race on the same log version
+_write_locks = {}
+_write_locks_guard = Lock()
+
+
+def write_lock(path: str) -> Lock:
+    with _write_locks_guard:
+        return _write_locks.setdefault(path, Lock())
+
+
+def storage_options() -> dict:
+    """object_store options for deltalake, mirroring the S3Client endpoint settings.
+
+    S3 has no atomic rename, so commits go through the DynamoDB locking
+    provider when delta_lock_table is set. Unsafe renames are only enabled
+    when delta_allow_unsafe_rename says a single writer is guaranteed.
+    """
+    settings = get_settings()
+    options = {"AWS_REGION": settings.aws_region}
+    if settings.delta_lock_table:
+        options["AWS_S3_LOCKING_PROVIDER"] = "dynamodb"
+        options["DELTA_DYNAMO_TABLE_NAME"] = settings.delta_lock_table
+    elif settings.delta_allow_unsafe_rename:
+        options["AWS_S3_ALLOW_UNSAFE_RENAME"] = "true"
+    if settings.aws_endpoint_url:
+        options["AWS_ENDPOINT_URL"] = settings.aws_endpoint_url
+        options["AWS_ALLOW_HTTP"] = "true"
+    return options
+
+
+def resolve_filesystem(root: str) -> tuple:
+    """pyarrow filesystem and path for a local directory or s3:// root."""
+    if root.startswith("s3://"):
+        settings = get_settings()
+        filesystem = fs.S3FileSystem(
+            region=settings.aws_region,
+            endpoint_override=settings.aws_endpoint_url,
+            scheme="http" if settings.aws_endpoint_url and settings.aws_endpoint_url.startswith("http://") else "https",
+        )
+        return filesystem, root[len("s3://"):]
+    return fs.LocalFileSystem(), root
+
+
+class ColumnarWriter:
+    """Write FRED / SEC rows as Parquet files or Delta tables.
+
+    Layout is one dataset per source under `root`, hive-partitioned by run
+    date: {root}/{source}/date=YYYY-MM-DD/...
+    """
+
+    def __init__(self, fmt: str = None, root: str = None):
+        if fmt is None or root is None:
+            settings = get_settings()
+            fmt = fmt or settings.columnar_format
+            root = root or settings.columnar_root or f"s3://{settings.s3_bucket}/columnar"
+        self.format = fmt
+        self.root = root.rstrip("/")
+
+    def write(self, source: str, table: pa.Table, run_date: date) -> int:
+        """Append a table to the source's dataset under the run date's partition.
+
+        Returns:
+            Number of rows written
+        """
+        if table.num_rows == 0:
+            return 0
+        table = table.append_column("date", pa.array([str(run_date)] * table.num_rows, pa.string()))
+        path = f"{self.root}/{source}"
+
+        if self.format == "delta":
+            from deltalake import write_deltalake
+
+            options = storage_options() if path.startswith("s3://") else None
+            with write_lock(path):
+                write_deltalake(path, table, partition_by=["date"], mode="append", storage_options=options)
+        else:
+            filesystem, base = resolve_filesystem(path)
+            ds.write_dataset(
+                table,
+                base,
+                filesystem=filesystem,
+                format="parquet",
+                partitioning=PARTITIONING,
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+        return table.num_rows
+
+
+class ColumnarReader:
+    """Scan columnar datasets with partition pruning and predicate pushdown."""
+
+    def __init__(self, fmt: str = None, root: str = None):
+        writer = ColumnarWriter(fmt, root)
+        self.format = writer.format
+        self.root = writer.root
+
+    def dataset(self, source: str) -> ds.Dataset:
+        path = f"{self.root}/{source}"
+        if self.format == "delta":
+            from deltalake import DeltaTable
+
+            options = storage_options() if path.startswith("s3://") else None
+            return DeltaTable(path, storage_options=options).to_pyarrow_dataset()
+        filesystem, base = resolve_filesystem(path)
+        return ds.dataset(base, filesystem=filesystem, format="parquet", partitioning=PARTITIONING)
+
+    def scan(self, source: str, start: date = None, end: date = None, columns: list = None, filter=None) -> pa.Table:
+        """Read a source's rows for run dates in [start, end].
+
+        The date bounds prune partitions; `filter` is any extra pyarrow
+        expression (e.g. ds.field("series_id") == "DGS10") pushed down into
+        the Parquet scan.
+        """
+        expression = filter
+        if start is not None:
+            expression = _and(expression, ds.field("date") >= str(start))
+        if end is not None:
+            expression = _and(expression, ds.field("date") <= str(end))
+        return self.dataset(source).to_table(columns=columns, filter=expression)
+
+
+def _and(left, right):
+    return right if left is None else left & right
@@ -0,0 +1,68 @@
+# Bronze Content-Hash Manifest
+
+import hashlib
+from datetime import date
+from credit_markets.storage.postgres import PostgresClient
+from credit_markets.utils import serialization
+
+# Fields FRED stamps with the request date; they change daily without the data changing
+VOLATILE_FIELDS = {
+    "fred": {"realtime_start", "realtime_end"},
+    "sec": set(),
+}
+
+
+def _strip(value, fields: set):
+    if isinstance(value, dict):
+        return {k: _strip(v, fields) for k, v in value.items() if k not in fields}
+    if isinstance(value, list):
+        return [_strip(v, fields) for v in value]
+    return value
+
+
+def content_digest(source: str, data: dict) -> str:
+    """SHA-256 of a payload's canonical JSON, ignoring per-request fields."""
+    fields = VOLATILE_FIELDS.get(source, set())
+    canonical = serialization.dumps(_strip(data, fields) if fields else data, sort_keys=True)
+    return hashlib.sha256(canonical).hexdigest()
+
+
+class BronzeManifest:
+    """Digest of the last loaded payload per (source, entity), in reference.bronze_manifest.
+
+    The pipeline reads the whole manifest for a source once per run, compares
+    digests in memory, and records new digests in one statement after the
+    silver load succeeded, so a failed load is retried on the next run.
+    """
+
+    def __init__(self, postgres: PostgresClient = None):
+        self.postgres = postgres or PostgresClient()
+
+    def load(self, source: str) -> dict:
+        """entity_id -> (content_hash, bronze_key) for a source."""
+        rows = self.postgres.fetch_all(
+            "SELECT entity_id, content_hash, bronze_key FROM reference.bronze_manifest WHERE source = %s",
+            (source,),
+        )
+        return {entity_id: (content_hash, bronze_key) for entity_id, content_hash, bronze_key in rows}
+
+    def record(self, source: str, entries: list, run_date: date) -> int:
+        """Upsert (entity_id, content_hash, bronze_key) entries."""
+        if not entries:
+            return 0
+        entity_ids, hashes, keys = (list(col) for col in zip(*entries, strict=True))
+        return self.postgres.execute(
+            """
+            INSERT INTO reference.bronze_manifest AS m
+                (source, entity_id, content_hash, bronze_key, run_date)
+            SELECT %s, entity_id, content_hash, bronze_key, %s
+            FROM unnest(%s::varchar[], %s::char(64)[], %s::varchar[])
+                AS u(entity_id, content_hash, bronze_key)
+            ON CONFLICT (source, entity_id) DO UPDATE SET
+                content_hash = EXCLUDED.content_hash,
+                bronze_key = EXCLUDED.bronze_key,
+                run_date = EXCLUDED.run_date,
+                updated_at = NOW()
+            """,
+            (source, run_date, entity_ids, hashes, keys),
+        )
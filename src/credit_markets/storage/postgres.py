@@ -1,9 +1,211 @@
 # PostgreSQL Client
 
+import csv
+import io
+import time
 import psycopg2
+from psycopg2 import extensions, sql
 from contextlib import contextmanager
+from threading import BoundedSemaphore, Lock
 from credit_markets.config.settings import get_settings
 
+# Unquoted CSV field that bulk_upsert() writes for None so COPY loads NULL, not ""
+COPY_NULL = "\\N"
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class ConnectionPool:
+    """Thread-safe connection pool with blocking checkout and health checks.
+
+    Idle connections are kept on a LIFO list and reused; psycopg2 is only
+    used to open new ones. (psycopg2's ThreadedConnectionPool closes returned
+    connections beyond `minconn` and raises when exhausted.) Checkouts are
+    gated by a semaphore and wait up to `timeout` seconds. Connections idle
+    longer than `health_check_interval` are pinged before being handed out,
+    and connections older than `max_lifetime` are recycled.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = 1,
+        max_size: int = 5,
+        timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+        max_lifetime: float = 3600.0,
+    ):
+        self.dsn = dsn
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.max_lifetime = max_lifetime
+        self._slots = BoundedSemaphore(max_size)
+        self._lock = Lock()
+        self._idle = []
+        self._created_at = {}
+        self._last_used = {}
+        self._closed = False
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._created = 0
+        self._discarded = 0
+
+        for _ in range(min(min_size, max_size)):
+            conn = self._connect()
+            self._idle.append(conn)
+
+    def getconn(self):
+        """Check out a healthy connection, blocking while the pool is exhausted."""
+        start = time.monotonic()
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._waits += 1
+            if not self._slots.acquire(timeout=self.timeout):
+                raise PoolTimeout(f"No database connection available after {self.timeout}s")
+        waited = time.monotonic() - start
+
+        try:
+            conn = self._checkout_healthy()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._checkouts += 1
+            self._wait_seconds += waited
+        return conn
+
+    def putconn(self, conn) -> None:
+        """Return a connection to the idle list, rolling back any open transaction."""
+        try:
+            if not conn.closed and not self._closed:
+                status = conn.info.transaction_status
+                if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                    conn.close()
+                elif status != extensions.TRANSACTION_STATUS_IDLE:
+                    try:
+                        conn.rollback()
+                    except psycopg2.Error:
+                        conn.close()
+
+            with self._lock:
+                if conn.closed or self._closed:
+                    self._forget(conn)
+                else:
+                    self._last_used[id(conn)] = time.monotonic()
+                    self._idle.append(conn)
+            if self._closed and not conn.closed:
+                conn.close()
+        finally:
+            self._slots.release()
+
+    def _connect(self):
+        conn = psycopg2.connect(self.dsn)
+        with self._lock:
+            self._created_at[id(conn)] = time.monotonic()
+            self._created += 1
+        return conn
+
+    def _checkout_healthy(self):
+        while True:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                return self._connect()
+
+            now = time.monotonic()
+            with self._lock:
+                created_at = self._created_at.get(id(conn), now)
+                idle = now - self._last_used.get(id(conn), now)
+
+            if conn.closed or now - created_at > self.max_lifetime or not self._is_alive(conn, idle):
+                self._discard(conn)
+                continue
+            return conn
+
+    def _is_alive(self, conn, idle: float) -> bool:
+        if idle < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _discard(self, conn) -> None:
+        with self._lock:
+            self._forget(conn)
+            self._discarded += 1
+        if not conn.closed:
+            conn.close()
+
+    def _forget(self, conn) -> None:
+        self._created_at.pop(id(conn), None)
+        self._last_used.pop(id(conn), None)
+
+    def stats(self) -> dict:
+        """Snapshot of pool usage: checkouts, waits and connection ages."""
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - created for created in self._created_at.values()]
+            return {
+                "max_size": self.max_size,
+                "open_connections": len(ages),
+                "idle_connections": len(self._idle),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "wait_seconds": round(self._wait_seconds, 3),
+                "connections_created": self._created,
+                "connections_discarded": self._discarded,
+                "max_connection_age_seconds": round(max(ages, default=0.0), 3),
+                "avg_connection_age_seconds": round(sum(ages) / len(ages), 3) if ages else 0.0,
+            }
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones are closed when returned."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for conn in idle:
+                self._forget(conn)
+        for conn in idle:
+            conn.close()
+
+
+_pools = {}
+_pools_lock = Lock()
+
+
+def get_pool(dsn: str) -> ConnectionPool:
+    """Get the process-wide pool for a DSN, creating it on first use."""
+    with _pools_lock:
+        if dsn not in _pools:
+            settings = get_settings()
+            _pools[dsn] = ConnectionPool(
+                dsn,
+                min_size=settings.database_pool_min_size,
+                max_size=settings.database_pool_size,
+                timeout=settings.database_pool_timeout,
+                health_check_interval=settings.database_pool_health_check_interval,
+                max_lifetime=settings.database_pool_max_lifetime,
+            )
+        return _pools[dsn]
+
+
+def close_pools() -> None:
+    """Close every pooled connection in this process."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
 class PostgresClient:
     def __init__(self):
         settings = get_settings()
@@ -12,16 +214,23 @@ class PostgresClient:
             f"port={settings.database_port} "
             f"dbname={settings.database_name} "
             f"user={settings.database_user} "
-            f"password={settings.database_password.get_secret_value()}"
+            f"password={settings.database_password.get_secret_value()} "
+            # NOW() written to TIMESTAMP columns (e.g. ingested_at) is then UTC
+            "options='-c TimeZone=UTC'"
         )
-    
+
+    @property
+    def pool(self) -> ConnectionPool:
+        return get_pool(self.connection_string)
+
     @contextmanager
     def get_connection(self):
-        conn = psycopg2.connect(self.connection_string)
+        pool = self.pool
+        conn = pool.getconn()
         try:
             yield conn
         finally:
-            conn.close()
+            pool.putconn(conn)
 
     def execute(self, query: str, params: tuple = None) -> int:
         with self.get_connection() as conn:
@@ -29,7 +238,7 @@ class PostgresClient:
                 cursor.execute(query, params)
                 conn.commit()
                 return cursor.rowcount
-    
+
     def execute_many(self, query: str, params_list: list) -> int:
         with self.get_connection() as conn:
             with conn.cursor() as cursor:
@@ -43,7 +252,111 @@ class PostgresClient:
                 cursor.execute(query, params)
                 return cursor.fetchall()
 
+    def execute_returning(self, query: str, params: tuple = None) -> list:
+        """Execute a data-modifying statement and return its RETURNING rows."""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                conn.commit()
+                return rows
+
+    def bulk_upsert(
+        self,
+        table: str,
+        columns: tuple,
+        rows,
+        key_columns: tuple,
+        update_columns: tuple = (),
+        touch_columns: tuple = (),
+    ) -> dict:
+        """Load rows with COPY into a temp staging table, then merge in one upsert.
+
+        Rows that already exist are updated only when one of `update_columns`
+        actually changed (or skipped entirely if none are given); `touch_columns`
+        (e.g. ingested_at) are then set to NOW() as well. Duplicate keys
+        within `rows` are collapsed before the merge.
+
+        None is written as the COPY_NULL marker so it loads as NULL while ""
+        stays an empty string; a literal "\\N" value would therefore load as NULL.
+
+        Returns:
+            Dict with "inserted" and "updated" row counts
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            tuple(COPY_NULL if value is None else value for value in row) for row in rows
+        )
+        if buffer.tell() == 0:
+            return {"inserted": 0, "updated": 0}
+        buffer.seek(0)
+        return self.bulk_upsert_csv(
+            table, columns, buffer, key_columns, update_columns, touch_columns, null=COPY_NULL
+        )
+
+    def bulk_upsert_csv(
+        self,
+        table: str,
+        columns: tuple,
+        buffer,
+        key_columns: tuple,
+        update_columns: tuple = (),
+        touch_columns: tuple = (),
+        null: str = "",
+    ) -> dict:
+        """bulk_upsert() for rows already encoded as headerless CSV in a file-like buffer.
+
+        Lets columnar callers write the CSV in one pass (e.g. pyarrow.csv)
+        without materialising a Python tuple per row. `null` is the unquoted
+        field COPY reads as NULL; the CSV default "" means empty strings
+        cannot be told apart from NULL.
+        """
+        target = sql.Identifier(*table.split("."))
+        staging = sql.Identifier("staging_" + table.replace(".", "_"))
+        cols = sql.SQL(", ").join(map(sql.Identifier, columns))
+        keys = sql.SQL(", ").join(map(sql.Identifier, key_columns))
+
+        if update_columns:
+            conflict = sql.SQL("DO UPDATE SET {assignments} WHERE ({current}) IS DISTINCT FROM ({incoming})").format(
+                assignments=sql.SQL(", ").join(
+                    [sql.SQL("{col} = EXCLUDED.{col}").format(col=sql.Identifier(col)) for col in update_columns]
+                    + [sql.SQL("{col} = NOW()").format(col=sql.Identifier(col)) for col in touch_columns]
+                ),
+                current=sql.SQL(", ").join(sql.Identifier("t", col) for col in update_columns),
+                incoming=sql.SQL(", ").join(sql.Identifier("excluded", col) for col in update_columns),
+            )
+        else:
+            conflict = sql.SQL("DO NOTHING")
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    sql.SQL("CREATE TEMP TABLE {staging} (LIKE {target} INCLUDING DEFAULTS) ON COMMIT DROP").format(
+                        staging=staging, target=target
+                    )
+                )
+                cursor.copy_expert(
+                    sql.SQL("COPY {staging} ({cols}) FROM STDIN WITH (FORMAT csv, NULL {null})").format(
+                        staging=staging, cols=cols, null=sql.Literal(null)
+                    ),
+                    buffer,
+                )
+                cursor.execute(
+                    sql.SQL("""
+                        INSERT INTO {target} AS t ({cols})
+                        SELECT DISTINCT ON ({keys}) {cols} FROM {staging}
+                        ON CONFLICT ({keys}) {conflict}
+                        RETURNING (xmax = 0)
+                    """).format(target=target, cols=cols, keys=keys, staging=staging, conflict=conflict)
+                )
+                merged = cursor.fetchall()
+                conn.commit()
+
+        inserted = sum(1 for (is_insert,) in merged if is_insert)
+        return {"inserted": inserted, "updated": len(merged) - inserted}
+
 if __name__ == "__main__":
     client = PostgresClient()
     result = client.execute("SELECT 1")
     print(f"Query executed, rows: {result}")
+    print(f"Pool stats: {client.pool.stats()}")
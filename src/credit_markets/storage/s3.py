@@ -1,35 +1,118 @@
 # S3 Storage Client
 
-import json
+import gzip
 from datetime import datetime
 import boto3
+from botocore.config import Config
 from credit_markets.config.settings import get_settings
+from credit_markets.utils import serialization
+from credit_markets.utils.parallel import parallel_imap, parallel_map
+
+ENCODINGS = ("identity", "gzip", "zstd")
+
+
+def encode_body(body: bytes, encoding: str, level: int = None) -> bytes:
+    """Compress an object body for the given Content-Encoding."""
+    if encoding == "identity":
+        return body
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=level or 6)
+    if encoding == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstd bronze encoding needs the 'zstandard' package (pip install .[compression])") from e
+        return zstandard.ZstdCompressor(level=level or 3).compress(body)
+    raise ValueError(f"Unsupported encoding {encoding!r}, expected one of {ENCODINGS}")
+
+
+def decode_body(body: bytes, encoding: str = None) -> bytes:
+    """Undo encode_body() for an object's Content-Encoding."""
+    if not encoding or encoding == "identity":
+        return body
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstd bronze encoding needs the 'zstandard' package (pip install .[compression])") from e
+        return zstandard.ZstdDecompressor().decompress(body)
+    raise ValueError(f"Unsupported encoding {encoding!r}, expected one of {ENCODINGS}")
+
 
 class S3Client:
     def __init__(self):
         settings = get_settings()
         self.bucket = settings.s3_bucket
+        self.encoding = settings.s3_bronze_encoding
+        self.compression_level = settings.s3_compression_level
+        self.upload_workers = settings.s3_upload_workers
+        config = Config(max_pool_connections=settings.s3_max_pool_connections)
 
         if settings.aws_endpoint_url:
             self.client = boto3.client(
                 "s3",
                 endpoint_url=settings.aws_endpoint_url,
                 region_name=settings.aws_region,
+                config=config,
             )
         else:
-            self.client = boto3.client("s3", region_name=settings.aws_region)
+            self.client = boto3.client("s3", region_name=settings.aws_region, config=config)
     
-    def write_json(self, data: dict, key: str) -> None:
-        """Write JSON data to s3"""
-        body = json.dumps(data)
+    def write_json(self, data: dict, key: str, encoding: str = None) -> None:
+        """Write JSON data to s3, compressed with `encoding` (default s3_bronze_encoding)"""
+        encoding = encoding or self.encoding
+        body = encode_body(serialization.dumps(data), encoding, self.compression_level)
+        extra = {} if encoding == "identity" else {"ContentEncoding": encoding}
         self.client.put_object(
             Bucket=self.bucket,
             Key=key,
             Body=body,
-            ContentType="application/json"
+            ContentType="application/json",
+            **extra,
+        )
+
+    def write_many(self, objects, encoding: str = None, max_workers: int = None) -> int:
+        """Upload (data, key) pairs concurrently over the client's shared connection pool.
+
+        Returns:
+            Number of objects written
+        """
+        results = parallel_map(
+            lambda obj: self.write_json(obj[0], obj[1], encoding=encoding),
+            objects,
+            max_workers=max_workers or self.upload_workers,
+        )
+        return len(results)
+
+    def list_keys(self, prefix: str):
+        """Yield the keys under a prefix, one page at a time."""
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield obj["Key"]
+
+    def read_json(self, key: str):
+        """Read a JSON object, decompressing it according to its ContentEncoding"""
+        response = self.client.get_object(Bucket=self.bucket, Key=key)
+        body = decode_body(response["Body"].read(), response.get("ContentEncoding"))
+        return serialization.loads(body)
+
+    def read_many(self, keys, max_workers: int = None, ordered: bool = False):
+        """Download JSON objects concurrently, streaming results as they arrive.
+
+        At most 2 * max_workers objects are held in memory at a time, so
+        `keys` may be a lazy listing of any size.
+
+        Yields:
+            (key, data) tuples
+        """
+        yield from parallel_imap(
+            self.read_json, keys, max_workers=max_workers or self.upload_workers, ordered=ordered
         )
 
 if __name__ == "__main__":
     client = S3Client()
     client.write_json({"test": "data"}, "test/example.json")
-    print("Written to S3")
\ No newline at end of file
+    print("Written to S3")
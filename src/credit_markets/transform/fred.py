@@ -1,31 +1,154 @@
 # FRED Data Transformer - Bronze to Silver
 
-from decimal import Decimal
+import io
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from credit_markets.quality.inflight import (
+    NUMERIC_PATTERN,
+    check_observation_rows,
+    check_observations,
+    quarantine_batch,
+)
 from credit_markets.storage.postgres import PostgresClient
 
+# Only the fields silver needs are converted out of each observation dict
+OBSERVATION_TYPE = pa.struct([("date", pa.string()), ("value", pa.string())])
+
+OBSERVATION_SCHEMA = pa.schema([
+    ("observation_date", pa.date32()),
+    ("series_id", pa.string()),
+    ("value", pa.float64()),
+])
+
+LOAD_BATCH_ROWS = 100_000
+
+
+def concat_observations(tables: list) -> pa.Table:
+    """Combine per-series observation tables into one."""
+    return pa.concat_tables(tables) if tables else OBSERVATION_SCHEMA.empty_table()
+
+
 class FREDTransformer:
-    def __init__(self):
-        self.postgres = PostgresClient()
+    """Load FRED observations into silver.treasury_yields.
+
+    Every batch is checked (quality.inflight) before it is written; batches
+    that fail are handed to `quarantine` instead of being loaded.
+    """
+
+    def __init__(self, postgres: PostgresClient = None, quarantine=None):
+        self.postgres = postgres or PostgresClient()
+        self.quarantine = quarantine
     
-    def load_treasury_yields(self, data: dict, series_id: str) -> int:
-        observations = data.get("observations", [])
+    def get_watermarks(self, series_ids: list) -> dict:
+        """Latest loaded observation_date per series, fetched in one query."""
+        if not series_ids:
+            return {}
+        rows = self.postgres.fetch_all(
+            """
+            SELECT series_id, MAX(observation_date)
+            FROM silver.treasury_yields
+            WHERE series_id = ANY(%s)
+            GROUP BY series_id
+            """,
+            (list(series_ids),),
+        )
+        return dict(rows)
 
-        params_list = [
-            (obs["date"], series_id, Decimal(obs["value"]))
-            for obs in observations
+    def parse_observations(self, data: dict, series_id: str) -> list:
+        """Flatten a series payload into silver.treasury_yields rows, dropping missing values."""
+        return [
+            (obs["date"], series_id, obs["value"])
+            for obs in data.get("observations", [])
             if obs["value"] != "."
         ]
 
-        if not params_list:
-            return 0
-        
-        query = """
-            INSERT INTO silver.treasury_yields (observation_date, series_id, value)
-            VALUES (%s, %s, %s)
-            ON CONFLICT (observation_date, series_id) DO NOTHING
+    def observations_table(self, data: dict, series_id: str) -> pa.Table:
+        """Typed columns for a series payload, dropping missing (".") values.
+
+        The observations are converted to Arrow in one pass and filtered and
+        cast column-wise, so no Python object is created per observation.
         """
+        observations = data.get("observations", [])
+        if not observations:
+            return OBSERVATION_SCHEMA.empty_table()
+
+        struct = pa.array(observations, type=OBSERVATION_TYPE)
+        present = pc.not_equal(struct.field("value"), ".")
+        dates = pc.filter(struct.field("date"), present)
+        values = pc.filter(struct.field("value"), present)
+
+        # Malformed dates / values become nulls for check_observations() to
+        # report, rather than failing the cast for the whole series
+        numeric = pc.match_substring_regex(values, NUMERIC_PATTERN)
+        return pa.table({
+            "observation_date": pc.strptime(dates, format="%Y-%m-%d", unit="s", error_is_null=True).cast(pa.date32()),
+            "series_id": pa.array([series_id] * len(dates), pa.string()),
+            "value": pc.if_else(numeric, values, pa.scalar(None, pa.string())).cast(pa.float64()),
+        }, schema=OBSERVATION_SCHEMA)
+
+    def load_treasury_yields(self, data: dict, series_id: str) -> dict:
+        """Bulk-load a series' observations into silver.treasury_yields."""
+        return self.load_observation_table(self.observations_table(data, series_id))
+
+    def load_observation_table(
+        self, table: pa.Table, batch_rows: int = LOAD_BATCH_ROWS, loaded: list = None
+    ) -> dict:
+        """Bulk-load an observations table in batches of `batch_rows`.
 
-        return self.postgres.execute_many(query, params_list)
+        Each batch is written to CSV by pyarrow and COPY-merged like
+        load_observation_rows(). Batches that passed the checks and were
+        loaded are appended to `loaded` as tables, if given.
+
+        Returns:
+            Dict with "inserted" and "updated" row counts, plus "quarantined"
+            rows if any batch failed the in-flight checks
+        """
+        counts = {"inserted": 0, "updated": 0}
+        for batch in table.to_batches(max_chunksize=batch_rows):
+            if batch.num_rows == 0:
+                continue
+            failures = check_observations(batch)
+            if failures:
+                rejected = quarantine_batch(self.quarantine, "fred", failures, batch.to_pylist())
+                counts["quarantined"] = counts.get("quarantined", 0) + rejected["quarantined"]
+                continue
+            buffer = io.BytesIO()
+            pa_csv.write_csv(batch, buffer, pa_csv.WriteOptions(include_header=False))
+            buffer.seek(0)
+            merged = self.postgres.bulk_upsert_csv(
+                "silver.treasury_yields",
+                columns=tuple(OBSERVATION_SCHEMA.names),
+                buffer=buffer,
+                key_columns=("observation_date", "series_id"),
+                update_columns=("value",),
+                touch_columns=("ingested_at",),
+            )
+            counts["inserted"] += merged["inserted"]
+            counts["updated"] += merged["updated"]
+            if loaded is not None:
+                loaded.append(pa.Table.from_batches([batch]))
+        return counts
+
+    def load_observation_rows(self, rows) -> dict:
+        """Bulk-load parsed observation rows (possibly spanning several series).
+
+        Returns:
+            Dict with "inserted" and "updated" row counts ("quarantined" if
+            the rows failed the in-flight checks)
+        """
+        rows = list(rows)
+        failures = check_observation_rows(rows)
+        if failures:
+            return quarantine_batch(self.quarantine, "fred", failures, rows)
+        return self.postgres.bulk_upsert(
+            "silver.treasury_yields",
+            columns=("observation_date", "series_id", "value"),
+            rows=rows,
+            key_columns=("observation_date", "series_id"),
+            update_columns=("value",),
+            touch_columns=("ingested_at",),
+        )
 
 if __name__ == "__main__":
     from credit_markets.ingestion.fred import FREDClient
@@ -34,5 +157,5 @@ if __name__ == "__main__":
     data = client.get_series("DGS10")
 
     transformer = FREDTransformer()
-    rows = transformer.load_treasury_yields(data, "DGS10")
-    print(f"Loaded {rows} rows into silver.treasury_yields")
\ No newline at end of file
+    counts = transformer.load_treasury_yields(data, "DGS10")
+    print(f"Loaded into silver.treasury_yields: {counts}")
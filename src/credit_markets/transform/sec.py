@@ -1,35 +1,111 @@
 #SEC Data Transformer - Bronze to Silver
 
+from credit_markets.quality.inflight import check_filing_rows, quarantine_batch
 from credit_markets.storage.postgres import PostgresClient
 
 class SECTransformer:
-    def __init__(self):
-        self.postgres = PostgresClient()
-    
-    def load_filings(self, data: dict) -> int:
+    """Load SEC submissions into silver.sec_filings.
+
+    Every batch is checked (quality.inflight) before it is written; batches
+    that fail are handed to `quarantine` instead of being loaded.
+    """
+
+    def __init__(self, postgres: PostgresClient = None, quarantine=None):
+        self.postgres = postgres or PostgresClient()
+        self.quarantine = quarantine
+
+    def parse_filings(self, data: dict) -> list:
+        """Flatten a submissions payload into silver.sec_filings rows."""
         cik = data.get("cik", "")
         company_name = data.get("name", "")
         recent = data.get("filings", {}).get("recent", {})
         accession_numbers = recent.get("accessionNumber", [])
         forms = recent.get("form", [])
         filing_dates = recent.get("filingDate", [])
-        rows_inserted = 0
-        for i in range(len(accession_numbers)):
-            query = """
-                INSERT INTO silver.sec_filings
-                    (accession_number, cik, company_name, filing_type, filing_date)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (accession_number) DO NOTHING
-            """
-            params = (
-                accession_numbers[i],
-                cik,
-                company_name,
-                forms[i],
-                filing_dates[i]
+
+        return [
+            (accession_number, cik, company_name, form, filing_date)
+            for accession_number, form, filing_date in zip(
+                accession_numbers, forms, filing_dates, strict=True
             )
-            rows_inserted += self.postgres.execute(query, params)
-        return rows_inserted
+        ]
+
+    def quarantine_if_invalid(self, rows: list):
+        """Check one company's parsed rows and quarantine them if they fail.
+
+        Returns:
+            Load counts for the quarantined rows, or None when the rows are clean
+        """
+        failures = check_filing_rows(rows)
+        if failures:
+            return quarantine_batch(self.quarantine, "sec", failures, rows)
+        return None
+
+    def load_filings(self, data: dict) -> dict:
+        """Load one company's recent filings into silver.sec_filings."""
+        return self.load_filing_rows(self.parse_filings(data))
+
+    def load_filings_batch(self, data_list: list) -> dict:
+        """Load several companies' filings in a single statement."""
+        rows = []
+        for data in data_list:
+            rows.extend(self.parse_filings(data))
+        return self.load_filing_rows(rows)
+
+    def load_filing_rows(self, rows: list) -> dict:
+        """Upsert parsed filing rows with one INSERT ... SELECT FROM unnest(...).
+
+        Rows may span several companies. If the batch fails the in-flight
+        checks, only the companies whose rows fail are quarantined and the
+        rest are still loaded.
+
+        Returns:
+            Dict with "inserted" and "updated" row counts ("quarantined" if
+            any rows failed the in-flight checks)
+        """
+        counts = {"inserted": 0, "updated": 0}
+        if not rows:
+            return counts
+        if check_filing_rows(rows):
+            companies = {}
+            for row in rows:
+                companies.setdefault(row[1], []).append(row)
+            rows = []
+            counts["quarantined"] = 0
+            for company_rows in companies.values():
+                rejected = self.quarantine_if_invalid(company_rows)
+                if rejected:
+                    counts["quarantined"] += rejected["quarantined"]
+                else:
+                    rows.extend(company_rows)
+            if not rows:
+                return counts
+
+        accession_numbers, ciks, company_names, forms, filing_dates = (
+            list(col) for col in zip(*rows, strict=True)
+        )
+
+        query = """
+            INSERT INTO silver.sec_filings AS t
+                (accession_number, cik, company_name, filing_type, filing_date)
+            SELECT DISTINCT ON (accession_number)
+                accession_number, cik, company_name, filing_type, filing_date
+            FROM unnest(%s::varchar[], %s::varchar[], %s::varchar[], %s::varchar[], %s::date[])
+                AS u(accession_number, cik, company_name, filing_type, filing_date)
+            ON CONFLICT (accession_number) DO UPDATE SET
+                company_name = EXCLUDED.company_name,
+                filing_type = EXCLUDED.filing_type,
+                filing_date = EXCLUDED.filing_date
+            WHERE (t.company_name, t.filing_type, t.filing_date)
+                IS DISTINCT FROM (EXCLUDED.company_name, EXCLUDED.filing_type, EXCLUDED.filing_date)
+            RETURNING (xmax = 0)
+        """
+        params = (accession_numbers, ciks, company_names, forms, filing_dates)
+
+        merged = self.postgres.execute_returning(query, params)
+        counts["inserted"] = sum(1 for (is_insert,) in merged if is_insert)
+        counts["updated"] = len(merged) - counts["inserted"]
+        return counts
     
 if __name__ == "__main__":
     from credit_markets.ingestion.sec import SECClient
@@ -38,5 +114,5 @@ if __name__ == "__main__":
     data = client.get_company_filings("320193")
 
     transformer = SECTransformer()
-    rows = transformer.load_filings(data)
-    print(f"Loaded {rows} filings into silver.sec_filings")
\ No newline at end of file
+    counts = transformer.load_filings(data)
+    print(f"Loaded into silver.sec_filings: {counts}")
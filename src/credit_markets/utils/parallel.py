@@ -1,52 +1,194 @@
 # Parallel Processing Utilities
 
+import asyncio
+import contextvars
 import time
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from threading import Lock
 
 logger = logging.getLogger(__name__)
 
+_EXHAUSTED = object()
+
 class RateLimiter:
-    """Simple rate limiter using token bucket algorithm."""
+    """Token bucket rate limiter usable from threads and coroutines.
+
+    Tokens refill continuously at `calls_per_second` up to `burst`, so idle
+    time builds up credit for short bursts. Each caller reserves a token
+    under the lock (going into debt if the bucket is empty) and then sleeps
+    outside it, so waiting callers never serialize each other.
+    `on_throttle(delay)` is called whenever a caller has to wait.
+    """
 
-    def __init__(self, calls_per_second: float = 5.0):
-        self.min_interval = 1.0 / calls_per_second
-        self.last_call = 0.0
+    def __init__(self, calls_per_second: float = 5.0, burst: int = 1, on_throttle=None):
+        self.rate = calls_per_second
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
         self.lock = Lock()
+        self.acquired = 0
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+        self.on_throttle = on_throttle
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.acquired += 1
+            if delay > 0:
+                self.throttled += 1
+                self.throttled_seconds += delay
+        if delay > 0 and self.on_throttle:
+            self.on_throttle(delay)
+        return delay
 
     def wait(self):
         """Block until rate limit allows next call"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self):
+        """Sleep (without blocking the event loop) until rate limit allows next call"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
         with self.lock:
-            now = time.time()
-            elapsed = now - self.last_call
-            if elapsed < self.min_interval:
-                time.sleep(self.min_interval - elapsed)
-            self.last_call = time.time()
+            return {
+                "rate": self.rate,
+                "burst": int(self.capacity),
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+            }
+
+class ItemError:
+    """Failure of func(item), yielded in place of a result when errors are captured."""
+
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+    def __repr__(self):
+        return f"ItemError({self.exception!r})"
+
+def parallel_imap(
+    func,
+    items,
+    max_workers: int = 5,
+    max_in_flight: int = None,
+    ordered: bool = False,
+    capture_errors: bool = False,
+    rate_limit: float = None,
+):
+    """Stream func over items on a thread pool with bounded memory.
+
+    Only `max_in_flight` items are submitted at a time; more are pulled from
+    `items` as results are consumed, so neither inputs nor results are ever
+    fully buffered.
+
+    Args:
+        func: Function to call on each item
+        items: Iterable (possibly lazy) of items to process
+        max_workers: Number of parallel threads
+        max_in_flight: Max submitted-but-unconsumed items (default 2 * max_workers)
+        ordered: Yield in input order instead of completion order
+        capture_errors: Yield ItemError for failed items instead of raising
+        rate_limit: Max calls per second, or None when func throttles itself
+
+    Yields:
+        (item, result) tuples"""
+    limiter = RateLimiter(rate_limit) if rate_limit else None
+    max_in_flight = max_in_flight or max_workers * 2
+    remaining = iter(items)
 
-def parallel_map(func, items, max_workers: int = 5, rate_limit: float = 5.0):
+    def call(item):
+        if limiter:
+            limiter.wait()
+        try:
+            return func(item)
+        except Exception as e:
+            if capture_errors:
+                return ItemError(e)
+            raise
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+
+        def fill():
+            while len(pending) < max_in_flight:
+                item = next(remaining, _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    return
+                # Run in a copy of the caller's context so log_context() fields carry over
+                pending.append((executor.submit(contextvars.copy_context().run, call, item), item))
+
+        try:
+            fill()
+            while pending:
+                if ordered:
+                    future, item = pending.popleft()
+                    result = future.result()
+                else:
+                    wait([future for future, _ in pending], return_when=FIRST_COMPLETED)
+                    index = next(i for i, (future, _) in enumerate(pending) if future.done())
+                    future, item = pending[index]
+                    del pending[index]
+                    result = future.result()
+                fill()
+                yield item, result
+        finally:
+            for future, _ in pending:
+                future.cancel()
+
+def parallel_map(func, items, max_workers: int = 5, rate_limit: float = None):
     """Execute func on each item in parallel with rate limiting.
-    
+
     Args:
         func: Function to call on each item
         items: Iterable of items to process
         max_workers: Number of parallel threads
-        rate_limit: Max calls per second
+        rate_limit: Max calls per second, or None when func throttles itself
     
     Returns:
         List of (item, result) tuples"""
-    limiter = RateLimiter(rate_limit)
-    results = []
+    return list(parallel_imap(func, items, max_workers=max_workers, rate_limit=rate_limit))
 
-    def rate_limited_call(item):
-        limiter.wait()
-        return item, func(item)
+async def async_parallel_map(
+    func, items, max_in_flight: int = 100, rate_limit: float = None, capture_errors: bool = False
+):
+    """Await coroutine func on each item concurrently with rate limiting.
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(rate_limited_call, item): item for item in items}
-            
-        for future in as_completed(futures):
-            item, result = future.result()
-            results.append((item, result))
-    
-    return results
\ No newline at end of file
+    Args:
+        func: Async function to call on each item
+        items: Iterable of items to process
+        max_in_flight: Max coroutines awaiting func at once
+        rate_limit: Max calls started per second, or None when func throttles itself
+        capture_errors: Return ItemError for failed items instead of raising
+            (and abandoning the other items)
+
+    Returns:
+        List of (item, result) tuples in input order"""
+    limiter = RateLimiter(rate_limit) if rate_limit else None
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def rate_limited_call(item):
+        async with semaphore:
+            if limiter:
+                await limiter.wait_async()
+            try:
+                return item, await func(item)
+            except Exception as e:
+                if capture_errors:
+                    return item, ItemError(e)
+                raise
+
+    return await asyncio.gather(*(rate_limited_call(item) for item in items))
@@ -1,5 +1,6 @@
 #Retry Decorator with Exponential Backoff
 
+import asyncio
 import time
 import logging
 from functools import wraps
@@ -7,9 +8,11 @@ from functools import wraps
 logger = logging.getLogger(__name__)
 
 
-def retry(max_attempts: int = 3, base_delay: float = 1.0, exceptions: tuple = (Exception,)):
+def retry(max_attempts: int = 3, base_delay: float = 1.0, exceptions: tuple = (Exception,), on_retry=None):
     """
     Retry decorator with exponential backoff.
+
+    `on_retry(function_name, attempt, exception)` is called before each retry.
     """
     def decorator(func):
         @wraps(func)
@@ -24,6 +27,8 @@ def retry(max_attempts: int = 3, base_delay: float = 1.0, exceptions: tuple = (E
                     if attempt < max_attempts - 1:
                         delay = base_delay * (2 ** attempt)
                         logger.warning(f"{func.__name__} failed (attempt {attempt + 1}/{max_attempts}): {e}. Retrying in {delay}s")
+                        if on_retry:
+                            on_retry(func.__name__, attempt + 1, e)
                         time.sleep(delay)
                     else:
                         logger.error(f"{func.__name__} failed after {max_attempts} attempts: {e}")
@@ -32,4 +37,33 @@ def retry(max_attempts: int = 3, base_delay: float = 1.0, exceptions: tuple = (E
         
         return wrapper
 
-    return decorator
\ No newline at end of file
+    return decorator
+
+def async_retry(max_attempts: int = 3, base_delay: float = 1.0, exceptions: tuple = (Exception,), on_retry=None):
+    """
+    Async counterpart of `retry`: backs off with asyncio.sleep instead of blocking.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            last_exception = None
+
+            for attempt in range(max_attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    last_exception = e
+                    if attempt < max_attempts - 1:
+                        delay = base_delay * (2 ** attempt)
+                        logger.warning(f"{func.__name__} failed (attempt {attempt + 1}/{max_attempts}): {e}. Retrying in {delay}s")
+                        if on_retry:
+                            on_retry(func.__name__, attempt + 1, e)
+                        await asyncio.sleep(delay)
+                    else:
+                        logger.error(f"{func.__name__} failed after {max_attempts} attempts: {e}")
+
+            raise last_exception
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,74 @@
+# JSON Serialization
+
+import json
+import math
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback; pip install .[json] for orjson
+    orjson = None
+
+BACKEND = "orjson" if orjson else "json"
+
+
+def _default(obj):
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _chain_default(default):
+    """_default for the types orjson handles natively, then the caller's default."""
+    if default is None:
+        return _default
+
+    def chained(obj):
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        return default(obj)
+    return chained
+
+
+def _replace_non_finite(obj):
+    """Copy of obj with NaN / infinity floats as None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
+
+
+def dumps(obj, sort_keys: bool = False, default=None) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes.
+
+    Uses orjson when installed. The stdlib fallback produces the same
+    compact, non-ASCII-escaped output, so digests of the bytes do not depend
+    on which backend is installed: dates are ISO 8601 and NaN / infinity
+    become null. `default` converts otherwise unserializable objects (e.g.
+    str for log fields).
+    """
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, default=default, option=option)
+    kwargs = {
+        "sort_keys": sort_keys,
+        "separators": (",", ":"),
+        "ensure_ascii": False,
+        "default": _chain_default(default),
+    }
+    try:
+        text = json.dumps(obj, allow_nan=False, **kwargs)
+    except ValueError:
+        # Out-of-range floats are rare; only then pay for the copy
+        text = json.dumps(_replace_non_finite(obj), allow_nan=False, **kwargs)
+    return text.encode("utf-8")
+
+
+def loads(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
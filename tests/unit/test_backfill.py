@@ -0,0 +1,32 @@
+#Unit Tests
+
+from datetime import date
+
+
+from credit_markets.pipeline.backfill import split_fred_by_date, split_sec_by_date
+
+
+def test_split_fred_by_date_keeps_range_only(mock_fred_response):
+    """Observations are grouped per date and clipped to the backfill range"""
+
+    partitions = split_fred_by_date(mock_fred_response, date(2026, 1, 27), date(2026, 1, 31))
+
+    assert list(partitions) == ["2026-01-27"]
+    assert partitions["2026-01-27"]["observations"][0]["value"] == "4.25"
+
+
+def test_split_sec_by_date_filters_every_column(mock_sec_response):
+    """Each partition carries the filings.recent columns for that date only"""
+
+    recent = mock_sec_response["filings"]["recent"]
+    for column in recent:
+        recent[column].append(recent[column][0])
+    recent["filingDate"][1] = "2026-01-16"
+
+    partitions = split_sec_by_date(mock_sec_response, date(2026, 1, 16), date(2026, 1, 16))
+
+    assert list(partitions) == ["2026-01-16"]
+    day = partitions["2026-01-16"]["filings"]["recent"]
+    assert day["filingDate"] == ["2026-01-16"]
+    assert len(day["accessionNumber"]) == 1
+    assert partitions["2026-01-16"]["name"] == "Apple Inc."
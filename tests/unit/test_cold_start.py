@@ -0,0 +1,49 @@
+#Unit Tests
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("httpx", "boto3", "botocore", "psycopg2", "pyarrow")
+
+# Required settings, so DailyPipeline() can load Settings without a .env file
+SETTINGS_ENV = {
+    "FRED_API_KEY": "test",
+    "SEC_USER_AGENT": "test test@example.com",
+    "DATABASE_HOST": "localhost",
+    "DATABASE_PORT": "5432",
+    "DATABASE_NAME": "credit_markets",
+    "DATABASE_USER": "postgres",
+    "DATABASE_PASSWORD": "postgres",
+    "S3_BUCKET": "test",
+    "AWS_REGION": "us-east-1",
+}
+
+
+def imported_modules(statement: str) -> set:
+    """Top-level modules loaded by `statement` in a fresh interpreter."""
+    code = f"import sys; {statement}; print(' '.join(sorted({{m.split('.')[0] for m in sys.modules}})))"
+    env = {**SETTINGS_ENV, **os.environ}
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize("module", ["credit_markets.cli", "credit_markets.lambda_handler", "credit_markets.pipeline.daily"])
+def test_entry_points_do_not_import_client_libraries(module):
+    """Client libraries are loaded on first use, not at import"""
+
+    loaded = imported_modules(f"import {module}")
+
+    assert loaded.isdisjoint(HEAVY_MODULES), sorted(loaded & set(HEAVY_MODULES))
+
+
+def test_pipeline_construction_builds_no_clients():
+    """DailyPipeline() alone does not create HTTP, S3 or Postgres clients"""
+
+    loaded = imported_modules(
+        "from credit_markets.pipeline.daily import DailyPipeline; DailyPipeline().close()"
+    )
+
+    assert loaded.isdisjoint(HEAVY_MODULES), sorted(loaded & set(HEAVY_MODULES))
@@ -0,0 +1,79 @@
+#Unit Tests
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pyarrow.dataset as ds
+import pytest
+
+from credit_markets.storage import columnar
+from credit_markets.storage.columnar import ColumnarReader, ColumnarWriter, fred_table, sec_table
+
+
+def test_fred_rows_round_trip_with_date_pruning(tmp_path):
+    """Rows written per run date are read back only for the requested range"""
+
+    writer = ColumnarWriter("parquet", str(tmp_path))
+    writer.write("fred", fred_table([("2026-01-26", "DGS10", "4.23")]), date(2026, 1, 26))
+    writer.write("fred", fred_table([("2026-01-27", "DGS10", "4.25"), ("2026-01-27", "DGS2", "4.10")]), date(2026, 1, 27))
+
+    reader = ColumnarReader("parquet", str(tmp_path))
+    table = reader.scan("fred", start=date(2026, 1, 27), end=date(2026, 1, 27))
+
+    assert table.num_rows == 2
+    assert set(table.column("date").to_pylist()) == {"2026-01-27"}
+
+
+def test_scan_pushes_down_extra_filter(tmp_path):
+    """An extra expression filters rows inside the scan"""
+
+    writer = ColumnarWriter("parquet", str(tmp_path))
+    writer.write("fred", fred_table([("2026-01-27", "DGS10", "4.25"), ("2026-01-27", "DGS2", "4.10")]), date(2026, 1, 27))
+
+    table = ColumnarReader("parquet", str(tmp_path)).scan(
+        "fred", columns=["series_id", "value"], filter=ds.field("series_id") == "DGS2"
+    )
+
+    assert table.to_pylist() == [{"series_id": "DGS2", "value": 4.10}]
+
+
+def test_sec_table_types_filing_date():
+    """SEC rows become typed columns"""
+
+    table = sec_table([("0000320193-24-000001", "0000320193", "Apple Inc.", "10-K", "2026-01-15")])
+
+    assert table.schema.field("filing_date").type == "date32[day]"
+    assert table.num_rows == 1
+
+
+def test_ragged_rows_are_rejected():
+    """A short row raises instead of misaligning the columns"""
+
+    with pytest.raises(ValueError):
+        fred_table([("2026-01-27", "DGS10", "4.25"), ("2026-01-26", "DGS10")])
+
+
+@pytest.mark.parametrize(
+    ("lock_table", "allow_unsafe_rename", "expected"),
+    [
+        (None, False, {}),
+        ("delta_log", False, {"AWS_S3_LOCKING_PROVIDER": "dynamodb", "DELTA_DYNAMO_TABLE_NAME": "delta_log"}),
+        (None, True, {"AWS_S3_ALLOW_UNSAFE_RENAME": "true"}),
+    ],
+)
+def test_delta_commits_use_lock_table_or_explicit_unsafe_rename(monkeypatch, lock_table, allow_unsafe_rename, expected):
+    """Unsafe renames are never enabled unless configured"""
+
+    settings = MagicMock(aws_region="us-east-1", aws_endpoint_url=None)
+    settings.delta_lock_table = lock_table
+    settings.delta_allow_unsafe_rename = allow_unsafe_rename
+    monkeypatch.setattr(columnar, "get_settings", lambda: settings)
+
+    assert columnar.storage_options() == {"AWS_REGION": "us-east-1", **expected}
+
+
+def test_writes_to_the_same_dataset_share_a_lock():
+    """Appends to one source are serialized; other sources write independently"""
+
+    assert columnar.write_lock("s3://bucket/columnar/fred") is columnar.write_lock("s3://bucket/columnar/fred")
+    assert columnar.write_lock("s3://bucket/columnar/fred") is not columnar.write_lock("s3://bucket/columnar/sec")
@@ -0,0 +1,132 @@
+#Unit Tests
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from credit_markets.pipeline.daily import DailyPipeline
+from credit_markets.transform.fred import FREDTransformer
+
+
+def test_observations_table_types_and_drops_missing(mock_fred_response):
+    """Observations become typed columns with "." values dropped"""
+
+    mock_fred_response["observations"].append({"date": "2026-01-25", "value": "."})
+
+    table = FREDTransformer(postgres=MagicMock()).observations_table(mock_fred_response, "DGS10")
+
+    assert table.to_pylist() == [
+        {"observation_date": date(2026, 1, 27), "series_id": "DGS10", "value": 4.25},
+        {"observation_date": date(2026, 1, 26), "series_id": "DGS10", "value": 4.23},
+    ]
+
+
+def test_observations_table_matches_row_parser(mock_fred_response):
+    """The columnar and row parsers keep the same observations"""
+
+    transformer = FREDTransformer(postgres=MagicMock())
+    table = transformer.observations_table(mock_fred_response, "DGS10")
+    rows = transformer.parse_observations(mock_fred_response, "DGS10")
+
+    assert [(str(r["observation_date"]), r["series_id"], r["value"]) for r in table.to_pylist()] == [
+        (d, s, float(v)) for d, s, v in rows
+    ]
+
+
+def test_load_observation_table_copies_in_batches(mock_fred_response):
+    """Each batch is sent to Postgres as headerless CSV"""
+
+    postgres = MagicMock()
+    postgres.bulk_upsert_csv.return_value = {"inserted": 1, "updated": 0}
+    transformer = FREDTransformer(postgres=postgres)
+
+    counts = transformer.load_observation_table(
+        transformer.observations_table(mock_fred_response, "DGS10"), batch_rows=1
+    )
+
+    assert counts == {"inserted": 2, "updated": 0}
+    first_batch = postgres.bulk_upsert_csv.call_args_list[0].kwargs["buffer"].getvalue()
+    assert first_batch.decode().strip() == "2026-01-27,\"DGS10\",4.25"
+
+
+def test_load_refreshes_ingested_at(mock_fred_response):
+    """Updated rows get a new ingested_at so the daily validation batch picks them up"""
+
+    postgres = MagicMock()
+    postgres.bulk_upsert_csv.return_value = {"inserted": 0, "updated": 2}
+    transformer = FREDTransformer(postgres=postgres)
+
+    transformer.load_observation_table(transformer.observations_table(mock_fred_response, "DGS10"))
+
+    assert postgres.bulk_upsert_csv.call_args.kwargs["touch_columns"] == ("ingested_at",)
+
+
+def make_pipeline(watermarks, fred_incremental=True, fred_lookback_days=7):
+    """DailyPipeline over a stubbed PostgresClient whose watermark query returns `watermarks`"""
+
+    postgres = MagicMock()
+    postgres.fetch_all.return_value = list(watermarks.items())
+    pipeline = DailyPipeline.__new__(DailyPipeline)
+    pipeline.settings = SimpleNamespace(
+        fred_incremental=fred_incremental, fred_lookback_days=fred_lookback_days
+    )
+    pipeline.fred_transformer = FREDTransformer(postgres=postgres)
+    return pipeline, postgres
+
+
+def test_get_watermarks_maps_series_to_latest_date():
+    """One grouped query returns the latest observation_date per series"""
+
+    postgres = MagicMock()
+    postgres.fetch_all.return_value = [("DGS10", date(2026, 1, 27)), ("DGS2", date(2026, 1, 26))]
+
+    watermarks = FREDTransformer(postgres=postgres).get_watermarks(["DGS10", "DGS2", "DGS30"])
+
+    assert watermarks == {"DGS10": date(2026, 1, 27), "DGS2": date(2026, 1, 26)}
+    assert postgres.fetch_all.call_args.args[1] == (["DGS10", "DGS2", "DGS30"],)
+
+
+def test_get_watermarks_without_series_skips_query():
+    """No series means no query and no watermarks"""
+
+    postgres = MagicMock()
+
+    assert FREDTransformer(postgres=postgres).get_watermarks([]) == {}
+    postgres.fetch_all.assert_not_called()
+
+
+def test_fred_start_dates_subtract_lookback():
+    """Each series restarts fred_lookback_days before its watermark so revisions are re-fetched"""
+
+    pipeline, _postgres = make_pipeline({"DGS10": date(2026, 1, 27)}, fred_lookback_days=7)
+
+    assert pipeline.fred_start_dates(["DGS10"]) == {"DGS10": date(2026, 1, 20)}
+
+
+def test_fred_start_dates_first_run_fetches_full_history():
+    """Series without a watermark get no start date, i.e. full history"""
+
+    pipeline, _postgres = make_pipeline({"DGS10": date(2026, 1, 27)})
+
+    start_dates = pipeline.fred_start_dates(["DGS10", "DGS2"])
+
+    assert "DGS2" not in start_dates
+    assert make_pipeline({})[0].fred_start_dates(["DGS10"]) == {}
+
+
+def test_fred_start_dates_full_refresh_ignores_watermarks():
+    """A full refresh fetches full history without querying watermarks"""
+
+    pipeline, postgres = make_pipeline({"DGS10": date(2026, 1, 27)})
+
+    assert pipeline.fred_start_dates(["DGS10"], full_refresh=True) == {}
+    postgres.fetch_all.assert_not_called()
+
+
+def test_fred_start_dates_disabled_when_not_incremental():
+    """fred_incremental=False always fetches full history"""
+
+    pipeline, postgres = make_pipeline({"DGS10": date(2026, 1, 27)}, fred_incremental=False)
+
+    assert pipeline.fred_start_dates(["DGS10"]) == {}
+    postgres.fetch_all.assert_not_called()
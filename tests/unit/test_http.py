@@ -0,0 +1,103 @@
+#Unit Tests
+
+import httpx
+import pytest
+
+from credit_markets.config.settings import Settings
+from credit_markets.ingestion import fred, http, sec
+from credit_markets.ingestion.fred import FREDClient
+from credit_markets.ingestion.sec import SECClient
+from credit_markets.pipeline.daily import DailyPipeline
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    """Settings without a .env file, installed wherever the HTTP clients read them"""
+
+    settings = Settings(
+        fred_api_key="test-key",
+        sec_user_agent="Test test@example.com",
+        database_host="localhost",
+        database_port=5432,
+        database_name="test",
+        database_user="test",
+        database_password="test",
+        s3_bucket="test",
+        aws_region="us-east-1",
+        fred_rate_limit=1000,
+        sec_rate_limit=1000,
+    )
+    for module in (http, fred, sec):
+        monkeypatch.setattr(module, "get_settings", lambda: settings)
+    monkeypatch.setattr(http, "_rate_limiters", {})
+    return settings
+
+
+@pytest.fixture
+def recorder():
+    """MockTransport that records every request and answers with an empty JSON object"""
+
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    return seen, httpx.MockTransport(handler)
+
+
+def test_build_client_negotiates_compression(settings, recorder):
+    """Requests carry the Accept-Encoding header, or identity when compression is off"""
+
+    seen, transport = recorder
+
+    with http.build_client(transport=transport) as client:
+        client.get("https://data.sec.gov/submissions/CIK0000320193.json")
+    settings.http_compression = False
+    with http.build_client(transport=transport) as client:
+        client.get("https://data.sec.gov/submissions/CIK0000320193.json")
+
+    assert seen[0].headers["Accept-Encoding"].startswith("gzip, deflate")
+    assert seen[1].headers["Accept-Encoding"] == "identity"
+
+
+def test_pipeline_clients_share_one_session(settings, recorder):
+    """FRED and SEC clients built by the pipeline reuse the same httpx.Client"""
+
+    seen, transport = recorder
+    pipeline = DailyPipeline.__new__(DailyPipeline)
+    pipeline.settings = settings
+    pipeline.http = http.build_client(transport=transport)
+    pipeline.http_cache = None
+
+    pipeline.fred.get_series("DGS10")
+    pipeline.sec.get_company_filings("320193")
+
+    assert pipeline.fred.http is pipeline.sec.http is pipeline.http
+    assert [request.url.host for request in seen] == ["api.stlouisfed.org", "data.sec.gov"]
+    assert seen[1].headers["User-Agent"] == "Test test@example.com"
+
+    pipeline.fred.close()
+    pipeline.sec.close()
+    assert not pipeline.http.is_closed
+    pipeline.close()
+    assert pipeline.http.is_closed
+
+
+@pytest.mark.usefixtures("settings")
+def test_rate_limiter_shared_per_api():
+    """Clients for the same API share one token bucket; each API has its own"""
+
+    with FREDClient() as first, FREDClient() as second, SECClient() as filings:
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter is not filings.rate_limiter
+
+
+@pytest.mark.usefixtures("settings")
+def test_client_closes_session_it_created():
+    """A client without an injected session closes the one it built on exit"""
+
+    with FREDClient() as client:
+        assert not client.http.is_closed
+
+    assert client.http.is_closed
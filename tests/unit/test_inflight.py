@@ -0,0 +1,124 @@
+#Unit Tests
+
+from unittest.mock import MagicMock
+
+from credit_markets.quality.inflight import (
+    check_filing_rows,
+    check_observation_rows,
+    check_observations,
+)
+from credit_markets.transform.fred import FREDTransformer
+from credit_markets.transform.sec import SECTransformer
+
+
+def test_clean_observations_pass(mock_fred_response):
+    table = FREDTransformer(postgres=MagicMock()).observations_table(mock_fred_response, "DGS10")
+
+    assert check_observations(table) == {}
+
+
+def test_malformed_values_are_reported_not_raised(mock_fred_response):
+    """A non-numeric value or bad date no longer fails the cast for the whole series"""
+
+    mock_fred_response["observations"].append({"date": "2026-13-40", "value": "n/a"})
+
+    table = FREDTransformer(postgres=MagicMock()).observations_table(mock_fred_response, "DGS10")
+
+    assert check_observations(table) == {"not_null:observation_date": 1, "type:value": 1}
+
+
+def test_failing_batch_is_quarantined_not_loaded(mock_fred_response):
+    postgres = MagicMock()
+    quarantine = MagicMock(return_value="quarantine/fred/2026-01-27/x.json")
+    transformer = FREDTransformer(postgres=postgres, quarantine=quarantine)
+
+    counts = transformer.load_observation_table(transformer.observations_table(mock_fred_response, "dgs-10"))
+
+    assert counts == {"inserted": 0, "updated": 0, "quarantined": 2}
+    postgres.bulk_upsert_csv.assert_not_called()
+    source, failures, rows = quarantine.call_args.args
+    assert (source, failures, len(rows)) == ("fred", {"regex:series_id": 2}, 2)
+
+
+def test_observation_rows_rules():
+    rows = [("2026-01-27", "DGS10", "4.25"), ("2026/01/26", "DGS10", "high"), ("2026-01-25", None, "4.2")]
+
+    assert check_observation_rows(rows) == {
+        "not_null:series_id": 1,
+        "type:observation_date": 1,
+        "type:value": 1,
+    }
+
+
+def test_filing_rows_rules(mock_sec_response):
+    rows = SECTransformer(postgres=MagicMock()).parse_filings(mock_sec_response)
+    assert check_filing_rows(rows) == {}
+
+    rows.append(("bad", "0000320193", "Apple Inc.", "10-K", None))
+    assert check_filing_rows(rows) == {"not_null:filing_date": 1, "regex:accession_number": 1}
+
+    assert check_filing_rows([("0000320193-24-000001", 320193, "Apple Inc.", "10-K", "2026-01-15")]) == {"type:cik": 1}
+
+
+def test_sec_quarantine_without_sink_skips_load():
+    """With no quarantine configured a bad batch is still skipped instead of raising"""
+
+    postgres = MagicMock()
+    transformer = SECTransformer(postgres=postgres)
+
+    counts = transformer.load_filing_rows([("bad", "0000320193", "Apple Inc.", "10-K", "2026-01-15")])
+
+    assert counts["quarantined"] == 1
+    postgres.execute_returning.assert_not_called()
+
+
+def test_only_loaded_batches_are_handed_on(mock_fred_response):
+    """Batches that were quarantined never reach the columnar copy"""
+
+    postgres = MagicMock()
+    postgres.bulk_upsert_csv.return_value = {"inserted": 1, "updated": 0}
+    transformer = FREDTransformer(postgres=postgres, quarantine=MagicMock())
+    mock_fred_response["observations"].append({"date": "2026-01-28", "value": "n/a"})
+    table = transformer.observations_table(mock_fred_response, "DGS10")
+
+    loaded = []
+    counts = transformer.load_observation_table(table, batch_rows=1, loaded=loaded)
+
+    assert counts == {"inserted": 2, "updated": 0, "quarantined": 1}
+    assert [t.column("value").to_pylist() for t in loaded] == [[4.25], [4.23]]
+
+
+def test_sec_companies_are_checked_one_at_a_time(mock_sec_response):
+    """A company with a bad filing is quarantined on its own; clean companies pass"""
+
+    quarantine = MagicMock()
+    transformer = SECTransformer(postgres=MagicMock(), quarantine=quarantine)
+    rows = transformer.parse_filings(mock_sec_response)
+
+    assert transformer.quarantine_if_invalid(rows) is None
+    quarantine.assert_not_called()
+
+    rows.append(("0000320193-24-000002", "0000320193", "Apple Inc.", "10-Q", "2026-01"))
+    assert transformer.quarantine_if_invalid(rows)["quarantined"] == len(rows)
+    assert quarantine.call_args.args[:2] == ("sec", {"type:filing_date": 1})
+
+
+def test_sec_batch_quarantines_only_failing_companies():
+    """A bad filing quarantines its own company; the other company in the batch is loaded"""
+
+    postgres = MagicMock()
+    postgres.execute_returning.return_value = [(True,)]
+    quarantine = MagicMock()
+    transformer = SECTransformer(postgres=postgres, quarantine=quarantine)
+    good = ("0000320193-24-000001", "320193", "Apple Inc.", "10-K", "2026-01-15")
+    bad = [
+        ("0000789019-24-000001", "789019", "Microsoft Corp", "10-Q", "2026-01-14"),
+        ("bad", "789019", "Microsoft Corp", "8-K", "2026-01-13"),
+    ]
+
+    counts = transformer.load_filing_rows([good, *bad])
+
+    assert counts == {"inserted": 1, "updated": 0, "quarantined": 2}
+    assert quarantine.call_args.args[2] == bad
+    accession_numbers = postgres.execute_returning.call_args.args[1][0]
+    assert accession_numbers == [good[0]]
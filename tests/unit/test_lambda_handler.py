@@ -0,0 +1,104 @@
+#Unit Tests
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from credit_markets import lambda_handler
+from credit_markets.pipeline import daily
+
+
+@pytest.fixture
+def cached_pipeline(monkeypatch):
+    """A stand-in DailyPipeline installed as the container's cached pipeline"""
+
+    pipeline = MagicMock()
+    pipeline.settings.deadline_margin_seconds = 60.0
+    pipeline.run.return_value = {"fred": {"silver_rows": 2}, "sec": {"silver_rows": 1}, "complete": True}
+    monkeypatch.setattr(lambda_handler, "_pipeline", pipeline)
+    return pipeline
+
+
+def test_warm_invocations_reuse_the_pipeline(cached_pipeline):
+    """The same pipeline (and its clients) serves consecutive invocations"""
+
+    for _ in range(2):
+        response = lambda_handler.handler({"target_date": "2026-01-27"}, None)
+        assert response["statusCode"] == 200
+
+    assert cached_pipeline.run.call_count == 2
+    assert lambda_handler.get_pipeline() is cached_pipeline
+    cached_pipeline.close.assert_not_called()
+
+
+def test_deadline_comes_from_remaining_time(cached_pipeline):
+    """The run stops starting new work deadline_margin_seconds before the timeout"""
+
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = 900_000
+
+    lambda_handler.handler({}, context)
+
+    deadline = cached_pipeline.run.call_args.kwargs["deadline"]
+    assert deadline is not None
+    assert 830 < deadline - lambda_handler.time.monotonic() <= 840
+
+
+def test_margin_longer_than_remaining_time_is_clamped(monkeypatch):
+    """A margin that would leave no run time is capped so the invocation still makes progress"""
+
+    logged = []
+    monkeypatch.setattr(lambda_handler, "get_logger", lambda _name: MagicMock(error=logged.append))
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = 30_000
+
+    deadline = lambda_handler.run_deadline(context, margin=60.0)
+
+    assert 14 < deadline - lambda_handler.time.monotonic() <= 15
+    assert len(logged) == 1
+
+
+def test_partial_run_returns_resume_event(cached_pipeline):
+    """A run cut short by the deadline returns an event that resumes it"""
+
+    cached_pipeline.run.return_value = {
+        "fred": {"silver_rows": 2},
+        "sec": {"silver_rows": 0},
+        "complete": False,
+        "pending": {"series": [], "ciks": ["0000789019"]},
+    }
+
+    response = lambda_handler.handler({"target_date": "2026-01-27", "full_refresh": True}, None)
+
+    body = json.loads(response["body"])
+    assert body["resume"] == {
+        "target_date": "2026-01-27",
+        "full_refresh": True,
+        "series": [],
+        "ciks": ["0000789019"],
+    }
+
+
+def test_failure_discards_cached_pipeline(cached_pipeline, monkeypatch):
+    """After an error the next invocation starts with fresh connections"""
+
+    cached_pipeline.run.side_effect = RuntimeError("server closed the connection unexpectedly")
+    monkeypatch.setattr(lambda_handler, "reset_pipeline", lambda: monkeypatch.setattr(lambda_handler, "_pipeline", None))
+
+    response = lambda_handler.handler({}, None)
+
+    assert response["statusCode"] == 500
+    assert lambda_handler._pipeline is None
+
+
+def test_until_deadline_collects_unstarted_keys():
+    """Keys after the deadline are not yielded but reported as pending"""
+
+    pending = []
+
+    started = list(daily.until_deadline(["DGS2", "DGS10"], deadline=0.0, pending=pending))
+
+    assert started == []
+    assert pending == ["DGS2", "DGS10"]
+    assert list(daily.until_deadline(["DGS2"])) == [("DGS2", None)]
@@ -0,0 +1,112 @@
+#Unit Tests
+
+import io
+import json
+import logging
+
+import pytest
+
+from credit_markets.observability.logging import (
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    configure_logging,
+    flush_logging,
+    log_context,
+    shutdown_logging,
+)
+from credit_markets.utils import serialization
+from credit_markets.utils.parallel import parallel_map
+
+
+@pytest.fixture
+def log_stream():
+    """Queue-backed logging writing JSON lines to an in-memory stream"""
+
+    stream = io.StringIO()
+    configure_logging(level="DEBUG", stream=stream)
+    yield stream
+    shutdown_logging()
+
+
+def lines(stream) -> list:
+    flush_logging()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_extra_fields_are_emitted(log_stream):
+    """Fields passed via extra= appear in the JSON line"""
+
+    logging.getLogger("credit_markets.test").info("Loaded", extra={"rows": 42, "series_id": "DGS10"})
+
+    [line] = lines(log_stream)
+    assert line["message"] == "Loaded"
+    assert line["rows"] == 42
+    assert line["series_id"] == "DGS10"
+
+
+def test_context_follows_work_into_worker_threads(log_stream):
+    """log_context fields set by the caller are attached to records logged by pool threads"""
+
+    logger = logging.getLogger("credit_markets.test")
+
+    def work(entity):
+        with log_context(entity=entity):
+            logger.info("Processed")
+
+    with log_context(run_id="abc", source="fred"):
+        parallel_map(work, ["DGS2", "DGS10"], max_workers=2)
+
+    records = lines(log_stream)
+    assert {(r["run_id"], r["source"], r["entity"]) for r in records} == {
+        ("abc", "fred", "DGS2"),
+        ("abc", "fred", "DGS10"),
+    }
+
+
+def test_exceptions_are_included(log_stream):
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logging.getLogger("credit_markets.test").exception("Load failed")
+
+    [line] = lines(log_stream)
+    assert "ValueError: boom" in line["exception"]
+
+
+def test_debug_records_are_capped_per_call_site():
+    """Per-item debug logs beyond max_per_second are dropped; INFO always passes"""
+
+    sampler = SamplingFilter(max_per_second=3)
+
+    def record(level):
+        return logging.LogRecord("credit_markets", level, "daily.py", 10, "item", (), None)
+
+    passed = [sampler.filter(record(logging.DEBUG)) for _ in range(10)]
+
+    assert passed.count(True) == 3
+    assert sampler.dropped == 7
+    assert sampler.filter(record(logging.INFO))
+
+
+def test_full_queue_drops_instead_of_blocking():
+    import queue
+
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    record = logging.LogRecord("credit_markets", logging.INFO, "daily.py", 10, "item", (), None)
+
+    handler.handle(record)
+    handler.handle(record)
+
+    assert handler.dropped == 1
+
+
+def test_json_lines_are_valid_without_orjson(monkeypatch, log_stream):
+    """The stdlib fallback writes ISO timestamps and null for NaN fields"""
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    logging.getLogger("credit_markets.test").info("Loaded", extra={"value": float("nan")})
+
+    [line] = lines(log_stream)
+    assert "T" in line["timestamp"]
+    assert line["timestamp"].endswith("+00:00")
+    assert line["value"] is None
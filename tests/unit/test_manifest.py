@@ -0,0 +1,34 @@
+#Unit Tests
+
+import copy
+
+
+from credit_markets.storage.manifest import content_digest
+
+
+def test_fred_digest_ignores_realtime_fields(mock_fred_response):
+    """A re-fetch stamped with a new realtime date has the same digest"""
+
+    refetched = copy.deepcopy(mock_fred_response)
+    for obs in refetched["observations"]:
+        obs["realtime_start"] = obs["realtime_end"] = "2026-01-28"
+
+    assert content_digest("fred", refetched) == content_digest("fred", mock_fred_response)
+
+
+def test_digest_changes_with_values(mock_fred_response, mock_sec_response):
+    """Revised values and new filings change the digest"""
+
+    revised = copy.deepcopy(mock_fred_response)
+    revised["observations"][0]["value"] = "4.26"
+    refiled = copy.deepcopy(mock_sec_response)
+    refiled["filings"]["recent"]["form"] = ["10-K/A"]
+
+    assert content_digest("fred", revised) != content_digest("fred", mock_fred_response)
+    assert content_digest("sec", refiled) != content_digest("sec", mock_sec_response)
+
+
+def test_digest_ignores_key_order(mock_sec_response):
+    reordered = dict(reversed(list(mock_sec_response.items())))
+
+    assert content_digest("sec", reordered) == content_digest("sec", mock_sec_response)
@@ -0,0 +1,74 @@
+#Unit Tests
+
+from types import SimpleNamespace
+
+import pytest
+
+for module in ("prometheus_client", "opentelemetry"):
+    pytest.importorskip(module)
+
+from credit_markets.observability import metrics, tracing
+
+
+@pytest.fixture(autouse=True)
+def settings(monkeypatch):
+    """Observability settings without needing the full environment"""
+
+    settings = SimpleNamespace(
+        trace_exporter="none", trace_file=None,
+        metrics_textfile=None, metrics_pushgateway=None, metrics_job="credit_markets",
+    )
+    monkeypatch.setattr(metrics, "get_settings", lambda: settings)
+    monkeypatch.setattr(tracing, "get_settings", lambda: settings)
+    return settings
+
+
+def sample(name: str, **labels) -> float:
+    return metrics.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_observe_times_and_counts_failures():
+    """Each observed call lands in the stage histogram; failures are counted"""
+
+    before = sample("credit_markets_stage_seconds_count", source="fred", stage="silver")
+    failures = sample("credit_markets_stage_failures_total", source="fred", stage="silver")
+
+    with metrics.observe("fred", "silver", ["DGS10"]):
+        pass
+    with pytest.raises(RuntimeError):
+        with metrics.observe("fred", "silver", ["DGS2"]):
+            raise RuntimeError("load failed")
+
+    assert sample("credit_markets_stage_seconds_count", source="fred", stage="silver") == before + 2
+    assert sample("credit_markets_stage_failures_total", source="fred", stage="silver") == failures + 1
+
+
+def test_textfile_export_is_prometheus_text(tmp_path, settings):
+    """Metrics are written in exposition format for the node_exporter textfile collector"""
+
+    path = tmp_path / "credit_markets.prom"
+    settings.metrics_textfile = str(path)
+
+    metrics.record_rows("sec", {"inserted": 3, "updated": 1})
+    metrics.export_metrics()
+
+    text = path.read_text()
+    assert 'credit_markets_rows_total{action="inserted",source="sec"}' in text
+
+
+def test_shutdown_tracing_flushes_and_closes_trace_file(tmp_path, settings, monkeypatch):
+    """Spans still buffered at exit are written and trace_file is closed"""
+
+    monkeypatch.setattr(tracing.trace, "set_tracer_provider", lambda _provider: None)
+    settings.trace_exporter = "console"
+    settings.trace_file = str(tmp_path / "spans.jsonl")
+
+    tracing.configure_tracing()
+    out = tracing._trace_out
+    with tracing._provider.get_tracer("test").start_as_current_span("silver_load"):
+        pass
+    tracing.shutdown_tracing()
+
+    assert out.closed
+    assert tracing._provider is None
+    assert '"name": "silver_load"' in (tmp_path / "spans.jsonl").read_text()
@@ -0,0 +1,47 @@
+#Unit Tests
+
+import importlib
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from credit_markets.observability import metrics, tracing
+
+
+@pytest.fixture
+def without_observability_packages(monkeypatch):
+    """Reload metrics/tracing as if prometheus_client and opentelemetry were not installed"""
+
+    monkeypatch.setitem(sys.modules, "prometheus_client", None)
+    monkeypatch.setitem(sys.modules, "opentelemetry", None)
+    settings = SimpleNamespace(
+        trace_exporter="console", trace_file=None,
+        metrics_textfile="metrics.prom", metrics_pushgateway=None, metrics_job="credit_markets",
+    )
+    importlib.reload(tracing)
+    importlib.reload(metrics)
+    monkeypatch.setattr(metrics, "get_settings", lambda: settings)
+    monkeypatch.setattr(tracing, "get_settings", lambda: settings)
+    yield metrics
+    monkeypatch.undo()
+    importlib.reload(tracing)
+    importlib.reload(metrics)
+
+
+def test_metrics_and_spans_are_noops_without_packages(without_observability_packages):
+    """A Lambda package without prometheus/opentelemetry still runs the pipeline"""
+
+    fallback = without_observability_packages
+
+    with fallback.observe("fred", "silver", ["DGS10"]) as current:
+        assert current is None
+    with pytest.raises(RuntimeError):
+        with fallback.observe("sec", "fetch", ["320193"]):
+            raise RuntimeError("fetch failed")
+    fallback.count_retry("get_series", 1, RuntimeError())
+    fallback.rate_limit_observer("fred")(0.5)
+    fallback.record_rows("fred", {"inserted": 1, "updated": 0})
+    fallback.export_metrics()
+
+    assert fallback.REGISTRY is None
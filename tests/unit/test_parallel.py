@@ -0,0 +1,185 @@
+#Unit Tests
+
+import asyncio
+import time
+
+import pytest
+import threading
+
+from credit_markets.utils.parallel import ItemError, RateLimiter, async_parallel_map, parallel_imap, parallel_map
+from credit_markets.utils.retry import async_retry
+
+
+def test_async_parallel_map_preserves_order():
+    """Results come back as (item, result) pairs in input order"""
+
+    async def double(x):
+        await asyncio.sleep(0.01 * (5 - x))
+        return x * 2
+
+    results = asyncio.run(async_parallel_map(double, range(5), max_in_flight=5, rate_limit=1000))
+    assert results == [(0, 0), (1, 2), (2, 4), (3, 6), (4, 8)]
+
+
+def test_async_parallel_map_caps_in_flight():
+    """Never more than max_in_flight coroutines run at once"""
+
+    in_flight = 0
+    peak = 0
+
+    async def track(_):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    asyncio.run(async_parallel_map(track, range(20), max_in_flight=3, rate_limit=1000))
+    assert peak == 3
+
+
+def test_async_parallel_map_captures_errors():
+    """A failing coroutine comes back as ItemError while the rest still complete"""
+
+    async def fail_on_two(x):
+        if x == 2:
+            raise ValueError("bad item")
+        return x
+
+    results = dict(asyncio.run(async_parallel_map(fail_on_two, range(4), rate_limit=1000, capture_errors=True)))
+    assert isinstance(results[2], ItemError)
+    assert isinstance(results[2].exception, ValueError)
+    assert results[3] == 3
+
+
+def test_rate_limiter_allows_burst_then_throttles():
+    """A full bucket admits `burst` calls immediately, the rest wait for refill"""
+
+    limiter = RateLimiter(calls_per_second=50, burst=3)
+
+    delays = [limiter.reserve() for _ in range(5)]
+
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(1 / 50, abs=0.005)
+    assert delays[4] == pytest.approx(2 / 50, abs=0.005)
+    assert limiter.stats()["throttled"] == 2
+
+
+def test_rate_limiter_reports_throttle_delays():
+    """on_throttle receives each delay a caller is made to wait"""
+
+    delays = []
+    limiter = RateLimiter(calls_per_second=50, burst=1, on_throttle=delays.append)
+
+    for _ in range(3):
+        limiter.reserve()
+
+    assert delays == [pytest.approx(1 / 50, abs=0.005), pytest.approx(2 / 50, abs=0.005)]
+
+
+def test_rate_limiter_threads_wait_concurrently():
+    """Waiting threads sleep outside the lock, so total time tracks the rate, not a queue"""
+
+    limiter = RateLimiter(calls_per_second=100, burst=1)
+    threads = [threading.Thread(target=limiter.wait) for _ in range(10)]
+
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    assert 9 / 100 - 0.01 <= elapsed < 0.5
+
+
+def test_rate_limiter_async_spaces_calls():
+    """Coroutines are spaced at least 1/calls_per_second apart"""
+
+    async def run():
+        limiter = RateLimiter(calls_per_second=50)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.wait_async() for _ in range(5)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 4 / 50 - 0.005
+
+
+def test_async_retry_retries_then_succeeds():
+    """Async function fails twice, then succeeds on third try"""
+
+    call_count = 0
+
+    @async_retry(max_attempts=3, base_delay=0.01)
+    async def fails_twice():
+        nonlocal call_count
+        call_count += 1
+        if call_count < 3:
+            raise ValueError("temporary failure")
+        return "success"
+
+    assert asyncio.run(fails_twice()) == "success"
+    assert call_count == 3
+
+
+def test_async_retry_raises_after_max_attempts():
+    """Async function fails all attempts, raise exception"""
+
+    @async_retry(max_attempts=2, base_delay=0.01)
+    async def always_fails():
+        raise ValueError("permanent failure")
+
+    with pytest.raises(ValueError):
+        asyncio.run(always_fails())
+
+
+def test_parallel_imap_ordered_yields_input_order():
+    """Ordered mode yields in input order even when later items finish first"""
+
+    def slow_first(x):
+        time.sleep(0.02 if x == 0 else 0)
+        return x * 2
+
+    results = list(parallel_imap(slow_first, range(6), max_workers=3, ordered=True))
+    assert results == [(0, 0), (1, 2), (2, 4), (3, 6), (4, 8), (5, 10)]
+
+
+def test_parallel_imap_bounds_items_pulled():
+    """Only max_in_flight items are pulled from the input ahead of the consumer"""
+
+    pulled = 0
+
+    def source():
+        nonlocal pulled
+        for i in range(100):
+            pulled += 1
+            yield i
+
+    stream = parallel_imap(lambda x: x, source(), max_workers=2, max_in_flight=4)
+    next(stream)
+    assert pulled <= 5
+    stream.close()
+
+
+def test_parallel_imap_captures_errors():
+    """Failures are yielded as ItemError instead of aborting the map"""
+
+    def fail_on_two(x):
+        if x == 2:
+            raise ValueError("bad item")
+        return x
+
+    results = dict(parallel_imap(fail_on_two, range(4), capture_errors=True))
+    assert isinstance(results[2], ItemError)
+    assert isinstance(results[2].exception, ValueError)
+    assert results[3] == 3
+
+
+def test_parallel_map_raises_on_failure():
+    """Without error capture the first failure propagates"""
+
+    def always_fails(_):
+        raise ValueError("permanent failure")
+
+    with pytest.raises(ValueError):
+        parallel_map(always_fails, range(3))
@@ -0,0 +1,126 @@
+#Unit Tests
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from psycopg2 import extensions
+
+from credit_markets.storage import postgres
+from credit_markets.storage.postgres import ConnectionPool, PoolTimeout
+
+
+class FakeConnect:
+    """Stand-in for psycopg2.connect that hands out idle mock connections."""
+
+    def __init__(self):
+        self.opened = []
+
+    def __call__(self, _dsn):
+        conn = MagicMock()
+        conn.closed = 0
+        conn.info.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+        conn.close.side_effect = lambda: setattr(conn, "closed", 1)
+        self.opened.append(conn)
+        return conn
+
+
+@pytest.fixture(autouse=True)
+def fake_connect(monkeypatch):
+    connect = FakeConnect()
+    monkeypatch.setattr(postgres.psycopg2, "connect", connect)
+    return connect
+
+
+def test_reuses_returned_connections():
+    """A returned connection is handed out again instead of reconnecting"""
+
+    pool = ConnectionPool("dsn", max_size=2)
+
+    first = pool.getconn()
+    pool.putconn(first)
+    second = pool.getconn()
+
+    assert second is first
+    stats = pool.stats()
+    assert stats["checkouts"] == 2
+    assert stats["connections_created"] == 1
+
+
+def test_blocks_then_times_out_when_exhausted():
+    """Checkout waits for a free slot and raises after the timeout"""
+
+    pool = ConnectionPool("dsn", max_size=1, timeout=0.05)
+    pool.getconn()
+
+    with pytest.raises(PoolTimeout):
+        pool.getconn()
+
+    assert pool.stats()["waits"] == 1
+
+
+def test_waiting_checkout_gets_released_connection():
+    """A blocked checkout proceeds as soon as another thread returns a connection"""
+
+    pool = ConnectionPool("dsn", max_size=1, timeout=1.0)
+    held = pool.getconn()
+
+    timer = threading.Timer(0.05, pool.putconn, args=(held,))
+    timer.start()
+    conn = pool.getconn()
+    timer.join()
+
+    assert conn is held
+
+
+def test_recycles_connections_past_max_lifetime():
+    """Connections older than max_lifetime are closed and replaced"""
+
+    pool = ConnectionPool("dsn", max_size=1, max_lifetime=0.0)
+
+    first = pool.getconn()
+    pool.putconn(first)
+    second = pool.getconn()
+
+    assert second is not first
+    assert first.closed
+    assert pool.stats()["connections_discarded"] >= 1
+
+
+def test_concurrent_connections_stay_open_above_min_size(fake_connect):
+    """Connections returned beyond min_size are kept idle, not closed (unlike ThreadedConnectionPool)"""
+
+    pool = ConnectionPool("dsn", min_size=1, max_size=4)
+
+    for _ in range(3):
+        held = [pool.getconn() for _ in range(4)]
+        for conn in held:
+            pool.putconn(conn)
+
+    assert len(fake_connect.opened) == 4
+    assert not any(conn.closed for conn in fake_connect.opened)
+    assert pool.stats()["idle_connections"] == 4
+
+
+def test_open_transaction_is_rolled_back_on_return():
+    pool = ConnectionPool("dsn", max_size=1)
+    conn = pool.getconn()
+    conn.info.transaction_status = extensions.TRANSACTION_STATUS_INERROR
+
+    pool.putconn(conn)
+
+    conn.rollback.assert_called_once()
+    assert pool.getconn() is conn
+
+
+def test_close_closes_idle_and_returned_connections():
+    pool = ConnectionPool("dsn", max_size=2)
+    held = pool.getconn()
+    idle = pool.getconn()
+    pool.putconn(idle)
+
+    pool.close()
+    pool.putconn(held)
+
+    assert idle.closed and held.closed
+    assert pool.stats()["open_connections"] == 0
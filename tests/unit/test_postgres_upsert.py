@@ -0,0 +1,159 @@
+#Unit Tests
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+from psycopg2 import sql
+
+from credit_markets.storage.postgres import PostgresClient
+
+
+def render(query):
+    """Render a psycopg2.sql object to text without a live connection."""
+
+    if isinstance(query, sql.Composed):
+        return "".join(render(part) for part in query.seq)
+    if isinstance(query, sql.Identifier):
+        return ".".join(f'"{name}"' for name in query.strings)
+    if isinstance(query, sql.Literal):
+        return repr(query.wrapped)
+    if isinstance(query, sql.SQL):
+        return query.string
+    return str(query)
+
+
+class FakeCursor:
+    """Records executed statements and the COPY payload, returns canned merge results."""
+
+    def __init__(self, merged):
+        self.merged = merged
+        self.statements = []
+        self.copy_sql = None
+        self.copy_payload = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def execute(self, query, _params=None):
+        self.statements.append(" ".join(render(query).split()))
+
+    def copy_expert(self, query, buffer):
+        self.copy_sql = render(query)
+        self.copy_payload = buffer.read()
+
+    def fetchall(self):
+        return self.merged
+
+
+def make_client(merged=()):
+    cursor = FakeCursor(list(merged))
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+
+    @contextmanager
+    def get_connection():
+        yield conn
+
+    client = PostgresClient.__new__(PostgresClient)
+    client.get_connection = get_connection
+    return client, conn, cursor
+
+
+def test_bulk_upsert_generates_staged_merge():
+    """COPY goes to a temp staging table, then one deduplicated upsert merges into the target"""
+
+    client, conn, cursor = make_client()
+
+    client.bulk_upsert(
+        "raw.fred_observations",
+        ("series_id", "date", "value", "ingested_at"),
+        [("DGS10", "2024-01-02", 4.1, None)],
+        key_columns=("series_id", "date"),
+        update_columns=("value",),
+        touch_columns=("ingested_at",),
+    )
+
+    create, merge = cursor.statements
+    assert create == (
+        'CREATE TEMP TABLE "staging_raw_fred_observations" '
+        '(LIKE "raw"."fred_observations" INCLUDING DEFAULTS) ON COMMIT DROP'
+    )
+    assert cursor.copy_sql == (
+        'COPY "staging_raw_fred_observations" ("series_id", "date", "value", "ingested_at") '
+        "FROM STDIN WITH (FORMAT csv, NULL '\\\\N')"
+    )
+    assert 'INSERT INTO "raw"."fred_observations" AS t' in merge
+    assert 'SELECT DISTINCT ON ("series_id", "date")' in merge
+    assert 'ON CONFLICT ("series_id", "date") DO UPDATE SET' in merge
+    assert merge.endswith("RETURNING (xmax = 0)")
+    conn.commit.assert_called_once()
+
+
+def test_bulk_upsert_skips_unchanged_and_touches_columns():
+    """Only rows whose update_columns changed are rewritten; touch_columns are set to NOW()"""
+
+    client, _conn, cursor = make_client()
+
+    client.bulk_upsert(
+        "raw.fred_observations",
+        ("series_id", "date", "value", "ingested_at"),
+        [("DGS10", "2024-01-02", 4.1, None)],
+        key_columns=("series_id", "date"),
+        update_columns=("value",),
+        touch_columns=("ingested_at",),
+    )
+
+    merge = cursor.statements[1]
+    assert '"value" = EXCLUDED."value", "ingested_at" = NOW()' in merge
+    assert 'WHERE ("t"."value") IS DISTINCT FROM ("excluded"."value")' in merge
+
+
+def test_bulk_upsert_without_update_columns_does_nothing_on_conflict():
+    """Insert-only upserts leave existing rows untouched"""
+
+    client, _conn, cursor = make_client()
+
+    client.bulk_upsert("raw.sec_filings", ("accession_number",), [("0001",)], key_columns=("accession_number",))
+
+    assert cursor.statements[1].split("RETURNING")[0].endswith('ON CONFLICT ("accession_number") DO NOTHING ')
+
+
+def test_bulk_upsert_keeps_empty_strings_distinct_from_null():
+    """None is written as the NULL marker while "" stays an unquoted empty field, which COPY loads as ''"""
+
+    client, _conn, cursor = make_client()
+
+    client.bulk_upsert(
+        "raw.sec_filings",
+        ("accession_number", "form_type", "filing_date"),
+        [("0001", "", None), ("0002", "10-K", "2024-01-02")],
+        key_columns=("accession_number",),
+    )
+
+    assert cursor.copy_payload == '0001,,\\N\r\n0002,10-K,2024-01-02\r\n'
+
+
+def test_bulk_upsert_counts_inserts_and_updates():
+    """RETURNING (xmax = 0) is true for fresh inserts and false for updated rows"""
+
+    client, _conn, _cursor = make_client(merged=[(True,), (False,), (True,)])
+
+    result = client.bulk_upsert("raw.sec_filings", ("accession_number",), [("a",), ("b",), ("c",)], ("accession_number",))
+
+    assert result == {"inserted": 2, "updated": 1}
+
+
+def test_bulk_upsert_empty_input_skips_database():
+    """No rows means no connection is taken and nothing is merged"""
+
+    client = PostgresClient.__new__(PostgresClient)
+    client.get_connection = MagicMock()
+
+    assert client.bulk_upsert("raw.sec_filings", ("accession_number",), [], ("accession_number",)) == {
+        "inserted": 0,
+        "updated": 0,
+    }
+    client.get_connection.assert_not_called()
@@ -0,0 +1,67 @@
+#Unit Tests
+
+import json
+from datetime import date
+from unittest.mock import MagicMock
+
+
+from credit_markets.pipeline import replay
+from credit_markets.pipeline.replay import ReplayPipeline
+from credit_markets.storage.s3 import decode_body, encode_body
+from credit_markets.transform.fred import FREDTransformer
+
+
+def test_decode_body_round_trips_gzip():
+    """Objects written with a Content-Encoding read back unchanged"""
+
+    body = json.dumps({"observations": []}).encode()
+
+    assert decode_body(encode_body(body, "gzip"), "gzip") == body
+    assert decode_body(body, None) == body
+
+
+def test_replay_keeps_latest_run_date_per_row(monkeypatch, mock_fred_response):
+    """Each run date is upserted after the one before it, so later days win"""
+
+    monkeypatch.setattr(replay, "export_metrics", lambda: None)
+
+    revised = {"observations": [{"date": "2026-01-26", "value": "4.30"}]}
+    objects = {
+        "bronze/fred/2026-01-26/DGS10.json": mock_fred_response,
+        "bronze/fred/2026-01-27/DGS10.json": revised,
+    }
+
+    pipeline = MagicMock()
+    pipeline.settings.replay_batch_rows = 1000
+    pipeline.settings.silver_workers = 1
+    pipeline.settings.replay_read_workers = 2
+    pipeline.fred_transformer = FREDTransformer(postgres=MagicMock())
+    pipeline.fred_transformer.postgres.bulk_upsert.return_value = {"inserted": 1, "updated": 0}
+    pipeline.s3.list_keys.side_effect = lambda prefix: [key for key in objects if key.startswith(prefix)]
+    pipeline.s3.read_json.side_effect = objects.get
+
+    results = ReplayPipeline(pipeline).run(date(2026, 1, 26), date(2026, 1, 27), sources=("fred",))
+
+    silver = {}
+    upserts = pipeline.fred_transformer.postgres.bulk_upsert.call_args_list
+    for call in upserts:
+        silver.update({row[:2]: row for row in call.kwargs["rows"]})
+    assert len(upserts) == 2
+    assert sorted(silver.values()) == [("2026-01-26", "DGS10", "4.30"), ("2026-01-27", "DGS10", "4.25")]
+    assert results["fred"] == {"bronze_objects": 2, "silver_rows": 2, "inserted": 2, "updated": 0, "quarantined": 0}
+
+
+def test_replay_follows_dedup_pointers(mock_sec_response):
+    """A pointer object written for an unchanged payload replays the payload it points to"""
+
+    full_key = "bronze/sec/2026-01-26/0000320193.json"
+    objects = {
+        full_key: mock_sec_response,
+        "bronze/sec/2026-01-27/0000320193.json": {"bronze_pointer": full_key, "content_hash": "0" * 64},
+    }
+    pipeline = MagicMock()
+    pipeline.s3.read_json.side_effect = objects.get
+
+    data = ReplayPipeline(pipeline).read_bronze("bronze/sec/2026-01-27/0000320193.json")
+
+    assert data == mock_sec_response
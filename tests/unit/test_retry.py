@@ -64,4 +64,19 @@ def test_only_catches_specified_exceptions():
     with pytest.raises(TypeError):
         raise_type_error()
 
-    assert call_count == 1
\ No newline at end of file
+    assert call_count == 1
+
+
+def test_on_retry_called_before_each_retry():
+    """The on_retry hook sees every retried attempt, not the final failure"""
+
+    seen = []
+
+    @retry(max_attempts=3, base_delay=0.01, on_retry=lambda name, attempt, _e: seen.append((name, attempt)))
+    def always_fails():
+        raise ValueError("down")
+
+    with pytest.raises(ValueError):
+        always_fails()
+
+    assert seen == [("always_fails", 1), ("always_fails", 2)]
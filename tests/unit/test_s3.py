@@ -0,0 +1,90 @@
+#Unit Tests
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from credit_markets.config.settings import Settings
+from credit_markets.storage import s3
+from credit_markets.storage.s3 import S3Client, decode_body, encode_body
+from credit_markets.utils import serialization
+
+BODY = b'{"observations": [{"date": "2026-01-27", "value": "4.25"}]}' * 50
+
+
+@pytest.mark.parametrize("encoding", ["identity", "gzip", "zstd"])
+def test_encode_decode_round_trip(encoding):
+    """Every supported Content-Encoding reads back byte-for-byte"""
+
+    if encoding == "zstd":
+        pytest.importorskip("zstandard")
+
+    encoded = encode_body(BODY, encoding)
+
+    assert decode_body(encoded, encoding) == BODY
+    assert (encoded == BODY) == (encoding == "identity")
+
+
+def test_unknown_encoding_is_rejected():
+    """Unsupported encodings raise rather than writing an unreadable object"""
+
+    with pytest.raises(ValueError):
+        encode_body(BODY, "br")
+    with pytest.raises(ValueError):
+        decode_body(BODY, "br")
+
+
+@pytest.fixture
+def bucket(monkeypatch):
+    """A moto-backed bucket and settings pointing S3Client at it"""
+
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN"):
+        monkeypatch.setenv(name, "testing")
+    monkeypatch.delenv("AWS_ENDPOINT_URL", raising=False)
+    settings = Settings(
+        fred_api_key="test-key",
+        sec_user_agent="Test test@example.com",
+        database_host="localhost",
+        database_port=5432,
+        database_name="test",
+        database_user="test",
+        database_password="test",
+        s3_bucket="bronze-test",
+        aws_region="us-east-1",
+        aws_endpoint_url=None,
+        s3_bronze_encoding="gzip",
+    )
+    monkeypatch.setattr(s3, "get_settings", lambda: settings)
+    with mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket="bronze-test")
+        yield settings
+
+
+@pytest.mark.parametrize("encoding", ["identity", "gzip", "zstd"])
+def test_write_many_sets_content_encoding(bucket, encoding):
+    """write_many uploads every key with its Content-Encoding and read_json decodes by it"""
+
+    if encoding == "zstd":
+        pytest.importorskip("zstandard")
+    client = S3Client()
+    objects = [({"series_id": f"S{i}", "value": i}, f"bronze/fred/2026-01-27/S{i}.json") for i in range(5)]
+
+    assert client.write_many(objects, encoding=encoding, max_workers=3) == 5
+
+    assert sorted(client.list_keys("bronze/fred/")) == sorted(key for _, key in objects)
+    for data, key in objects:
+        head = client.client.head_object(Bucket=bucket.s3_bucket, Key=key)
+        assert head.get("ContentEncoding") == (None if encoding == "identity" else encoding)
+        assert client.read_json(key) == data
+
+
+def test_write_json_defaults_to_bronze_encoding(bucket):
+    """Without an explicit encoding objects use s3_bronze_encoding"""
+
+    client = S3Client()
+
+    client.write_json({"cik": "0000320193"}, "bronze/sec/2026-01-27/320193.json")
+
+    raw = client.client.get_object(Bucket=bucket.s3_bucket, Key="bronze/sec/2026-01-27/320193.json")
+    assert raw["ContentEncoding"] == "gzip"
+    assert decode_body(raw["Body"].read(), "gzip") == serialization.dumps({"cik": "0000320193"})
@@ -0,0 +1,53 @@
+#Unit Tests
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from credit_markets.transform.sec import SECTransformer
+
+
+def test_load_filings_batch_sends_column_aligned_arrays(mock_sec_response):
+    """Each unnest() array holds one column, in row order, and all have the same length"""
+
+    postgres = MagicMock()
+    postgres.execute_returning.return_value = [(True,), (False,), (True,)]
+    transformer = SECTransformer(postgres=postgres)
+    msft = {
+        "cik": "0000789019",
+        "name": "Microsoft Corp",
+        "filings": {
+            "recent": {
+                "accessionNumber": ["0000789019-24-000001", "0000789019-24-000002"],
+                "form": ["10-Q", "8-K"],
+                "filingDate": ["2026-01-14", "2026-01-13"],
+            }
+        },
+    }
+
+    counts = transformer.load_filings_batch([mock_sec_response, msft])
+
+    assert counts == {"inserted": 2, "updated": 1}
+    params = postgres.execute_returning.call_args.args[1]
+    assert len(params) == 5
+    assert {len(column) for column in params} == {3}
+    assert list(zip(*params, strict=True)) == [
+        ("0000320193-24-000001", "0000320193", "Apple Inc.", "10-K", "2026-01-15"),
+        ("0000789019-24-000001", "0000789019", "Microsoft Corp", "10-Q", "2026-01-14"),
+        ("0000789019-24-000002", "0000789019", "Microsoft Corp", "8-K", "2026-01-13"),
+    ]
+
+
+def test_load_filing_rows_rejects_ragged_rows(monkeypatch):
+    """A short row raises instead of silently truncating every column array"""
+
+    monkeypatch.setattr("credit_markets.transform.sec.check_filing_rows", lambda _rows: {})
+    transformer = SECTransformer(postgres=MagicMock())
+    rows = [
+        ("0000320193-24-000001", "0000320193", "Apple Inc.", "10-K", "2026-01-15"),
+        ("0000320193-24-000002", "0000320193", "Apple Inc.", "10-Q"),
+    ]
+
+    with pytest.raises(ValueError):
+        transformer.load_filing_rows(rows)
+    transformer.postgres.execute_returning.assert_not_called()
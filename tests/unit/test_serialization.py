@@ -0,0 +1,44 @@
+#Unit Tests
+
+import json
+from datetime import datetime, timezone
+
+from credit_markets.utils import serialization
+
+
+def test_dumps_is_compact_utf8_bytes(mock_sec_response):
+    """Output is bytes that the stdlib parses back unchanged"""
+
+    mock_sec_response["name"] = "Société Générale"
+    body = serialization.dumps(mock_sec_response)
+
+    assert isinstance(body, bytes)
+    assert b", " not in body
+    assert "Société".encode() in body
+    assert json.loads(body) == mock_sec_response
+
+
+def test_sort_keys_matches_stdlib_canonical_form():
+    """Sorted output is identical to stdlib's compact sorted JSON"""
+
+    data = {"b": [1, {"d": "x", "c": None}], "a": "é"}
+    expected = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+    assert serialization.dumps(data, sort_keys=True) == expected
+
+
+def test_datetimes_serialize_as_iso_strings():
+    moment = datetime(2026, 1, 27, 16, 30, tzinfo=timezone.utc)
+
+    assert serialization.loads(serialization.dumps({"at": moment})) == {"at": "2026-01-27T16:30:00+00:00"}
+
+
+def test_stdlib_fallback_matches_orjson_output(monkeypatch):
+    """Without orjson, dates stay ISO 8601 under a caller default and NaN becomes null"""
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    moment = datetime(2026, 1, 27, 16, 30, tzinfo=timezone.utc)
+
+    body = serialization.dumps({"at": moment, "value": float("nan"), "obj": object}, default=str)
+
+    assert json.loads(body) == {"at": "2026-01-27T16:30:00+00:00", "value": None, "obj": str(object)}
@@ -0,0 +1,133 @@
+#Unit Tests
+
+import threading
+import time
+from contextlib import nullcontext
+
+from credit_markets.pipeline.stages import Stage, StagedPipeline
+
+
+def test_items_flow_through_all_stages():
+    """Each item passes through every stage and last-stage outputs are collected"""
+
+    pipeline = StagedPipeline([
+        Stage("double", lambda _key, value: value * 2, workers=2),
+        Stage("add_one", lambda _key, value: value + 1, workers=2),
+    ])
+
+    result = pipeline.run((i, i) for i in range(10))
+
+    assert sorted(result["outputs"]) == [i * 2 + 1 for i in range(10)]
+    assert result["stages"]["double"]["items_in"] == 10
+    assert result["stages"]["add_one"]["items_out"] == 10
+
+
+def test_none_drops_item_and_failures_are_recorded():
+    """Returning None skips later stages; exceptions are captured per item"""
+
+    def fetch(key, value):
+        if key == "unchanged":
+            return None
+        if key == "broken":
+            raise RuntimeError("fetch failed")
+        return value
+
+    pipeline = StagedPipeline([
+        Stage("fetch", fetch),
+        Stage("load", lambda _key, value: value),
+    ])
+
+    result = pipeline.run([("ok", 1), ("unchanged", 2), ("broken", 3)])
+
+    assert result["outputs"] == [1]
+    assert [(stage, key) for stage, key, _ in result["failed"]] == [("fetch", "broken")]
+    assert result["stages"]["load"]["items_in"] == 1
+
+
+def test_batched_stage_receives_lists():
+    """A stage with batch_size groups its input, flushing the remainder at the end"""
+
+    batches = []
+
+    def load(batch):
+        batches.append([key for key, _ in batch])
+        return len(batch)
+
+    pipeline = StagedPipeline([
+        Stage("fetch", lambda _key, value: value),
+        Stage("load", load, batch_size=4),
+    ])
+
+    result = pipeline.run((i, i) for i in range(10))
+
+    assert sum(result["outputs"]) == 10
+    assert sorted(len(batch) for batch in batches) == [2, 4, 4]
+
+
+def test_slow_stage_applies_backpressure():
+    """A slow downstream stage bounds how far the upstream stage runs ahead"""
+
+    fetched = 0
+    max_ahead = 0
+    loaded = 0
+    lock = threading.Lock()
+
+    def fetch(_key, value):
+        nonlocal fetched, max_ahead
+        with lock:
+            fetched += 1
+            max_ahead = max(max_ahead, fetched - loaded)
+        return value
+
+    def load(_key, value):
+        nonlocal loaded
+        time.sleep(0.005)
+        with lock:
+            loaded += 1
+        return value
+
+    pipeline = StagedPipeline([Stage("fetch", fetch), Stage("load", load)], queue_size=2)
+    pipeline.run((i, i) for i in range(20))
+
+    assert max_ahead <= 4
+
+
+def test_observer_wraps_every_stage_call():
+    """The observer is entered once per call with the stage name and item keys"""
+
+    from contextlib import contextmanager
+
+    observed = []
+
+    @contextmanager
+    def observer(stage, keys):
+        observed.append((stage, sorted(keys)))
+        yield
+
+    pipeline = StagedPipeline([
+        Stage("fetch", lambda _key, value: value, workers=1),
+        Stage("load", lambda batch: len(batch), workers=1, batch_size=2),
+    ], observer=observer)
+
+    pipeline.run((key, key) for key in ("a", "b"))
+
+    assert observed == [("fetch", ["a"]), ("fetch", ["b"]), ("load", ["a", "b"])]
+
+
+def test_failing_observer_fails_the_call_not_the_worker():
+    """An observer exception is recorded as a failure and the pipeline still finishes"""
+
+    def observer(stage, keys):
+        if stage == "load" and keys == ["b"]:
+            raise RuntimeError("metrics backend down")
+        return nullcontext()
+
+    pipeline = StagedPipeline([
+        Stage("fetch", lambda _key, value: value),
+        Stage("load", lambda _key, value: value),
+    ], observer=observer)
+
+    result = pipeline.run((key, key) for key in ("a", "b", "c"))
+
+    assert sorted(result["outputs"]) == ["a", "c"]
+    assert [(stage, key) for stage, key, _ in result["failed"]] == [("load", "b")]